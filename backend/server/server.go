@@ -74,7 +74,7 @@ func (s *GameServiceImpl) StopGame() {
 func (s *GameServiceImpl) BroadcastEvent(event *pb.GameEvent) {
 	notification := &pb.NotificationEvent{
 		Event:     event,
-		Timestamp: int32(time.Now().Unix()),
+		Timestamp: time.Now().UnixMilli(),
 	}
 
 	s.server.PlayersMutex.RLock()
@@ -244,6 +244,18 @@ func (s *GameServiceImpl) SubscribeToEvents(req *pb.ClientRequest, stream pb.Gam
 	return nil
 }
 
+// SyncClock responde a una muestra de sincronización de reloj (estilo NTP)
+// Los clientes usan las cuatro marcas de tiempo para estimar el desfase y el RTT
+func (s *GameServiceImpl) SyncClock(ctx context.Context, req *pb.ClockSyncRequest) (*pb.ClockSyncResponse, error) {
+	receiveTime := time.Now().UnixMilli()
+
+	return &pb.ClockSyncResponse{
+		ClientSendTimeMs:    req.ClientSendTimeMs,
+		ServerReceiveTimeMs: receiveTime,
+		ServerSendTimeMs:    time.Now().UnixMilli(),
+	}, nil
+}
+
 // SendEvent maneja los eventos enviados por los clientes
 func (s *GameServiceImpl) SendEvent(ctx context.Context, event *pb.GameEvent) (*pb.ServerResponse, error) {
 	// Procesar el evento según su tipo
@@ -158,10 +158,11 @@ func (g *Game) BroadcastMeteorCreated(meteor *entities.Meteor) {
 			MeteorCreated: &service.MeteorCreatedEvent{
 				MeteorId:      meteor.GetID(),
 				MeteorType:    meteor.GetMeteorType(),
-				Position:      meteor.Position.ToProtoVector(),
-				Angle:         meteor.Rotation,
+				Position:      meteor.Origin.ToProtoVector(),
+				Angle:         meteor.InitialRotation,
 				RotationSpeed: meteor.RotationSpeed,
 				Velocity:      meteor.Velocity.ToProtoVector(),
+				SpawnTimeMs:   meteor.SpawnTimeMs,
 			},
 		},
 	}
@@ -360,9 +360,11 @@ func (mm *MeteorManager) GetMeteorsProto() *service.MeteorList {
 		meteorData := &service.MeteorData{
 			MeteorId:       m.GetID(),
 			MeteorType:     m.GetMeteorType(),
-			Position:       m.Position.ToProtoVector(),
-			Angle:          m.Rotation,
+			Position:       m.Origin.ToProtoVector(),
+			Angle:          m.InitialRotation,
 			RotationSpeed:  m.RotationSpeed,
+			Velocity:       m.Velocity.ToProtoVector(),
+			SpawnTimeMs:    m.SpawnTimeMs,
 		}
 		meteorList = append(meteorList, meteorData)
 	}
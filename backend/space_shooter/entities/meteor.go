@@ -2,7 +2,9 @@ package entities
 
 import (
 	"fmt"
+	"math"
 	"math/rand"
+	"time"
 
 	"github.com/Yisustxz/cen-project/backend/config"
 	"github.com/Yisustxz/cen-project/backend/engine"
@@ -18,6 +20,12 @@ type Meteor struct {
 	Health         int      // Puntos de vida
 	Points         int      // Puntos que otorga al ser destruido
 	DestroyedBy    int32    // ID del jugador que destruyó el meteorito
+
+	// Trayectoria determinista: estado inicial en SpawnTimeMs.
+	// La posición en cualquier instante t es Origin + Velocity * (t - SpawnTimeMs)
+	SpawnTimeMs     int64           // Milisegundos desde la época Unix
+	Origin          engine.Vector2D // Posición en SpawnTimeMs
+	InitialRotation float32         // Rotación en SpawnTimeMs
 }
 
 // NewMeteor crea un nuevo meteorito con valores por defecto
@@ -82,6 +90,8 @@ func NewMeteor(x, y float32, meteorType string) *Meteor {
 		Health:        hp,
 		Points:        points,
 		DestroyedBy:   -1, // -1 significa que no ha sido destruido
+		SpawnTimeMs:   time.Now().UnixMilli(),
+		Origin:        engine.Vector2D{X: x, Y: y},
 	}
 
 	return m
@@ -113,6 +123,8 @@ func NewMeteorFromConfig(x, y float32, meteorType string, meteorConfig *config.M
 		Health:        meteorConfig.HP,
 		Points:        meteorConfig.Points,
 		DestroyedBy:   -1,
+		SpawnTimeMs:   time.Now().UnixMilli(),
+		Origin:        engine.Vector2D{X: x, Y: y},
 	}
 
 	return m
@@ -139,26 +151,34 @@ func getRandomValueInRange(valueRange []float32) float32 {
 
 // Update actualiza el estado del meteorito
 func (m *Meteor) Update() {
+	m.UpdateAt(time.Now().UnixMilli())
+}
+
+// UpdateAt evalúa la trayectoria del meteorito en el instante indicado.
+// La trayectoria es de forma cerrada (no se integra por tick), así que el
+// resultado coincide con el que calculan los clientes a partir del evento
+// meteor_created sin importar la frecuencia de actualización de cada lado.
+func (m *Meteor) UpdateAt(nowMs int64) {
 	// Si ya está destruido, no hacer nada
 	if m.DestroyedBy >= 0 {
 		return
 	}
 
-	// Aplicar un delta time más pequeño para movimiento más lento
-	// Usamos 0.016 (16ms) para 60 FPS, lo reducimos más para meteoritos más lentos
-	const deltaTime = 0.008 // La mitad de 16ms
-	
-	// Actualizar posición basada en velocidad y delta time
-	m.Position.X += m.Velocity.X * deltaTime
-	m.Position.Y += m.Velocity.Y * deltaTime
-	
-	// Actualizar rotación
-	m.Rotation += m.RotationSpeed * deltaTime
-	if m.Rotation >= 360 {
-		m.Rotation -= 360
-	} else if m.Rotation < 0 {
-		m.Rotation += 360
+	elapsed := float32(nowMs-m.SpawnTimeMs) / 1000.0
+	if elapsed < 0 {
+		elapsed = 0
+	}
+
+	// Velocidad en píxeles por segundo, igual que en el cliente
+	m.Position.X = m.Origin.X + m.Velocity.X*elapsed
+	m.Position.Y = m.Origin.Y + m.Velocity.Y*elapsed
+
+	// Rotación en grados por segundo, normalizada a [0, 360)
+	rotation := math.Mod(float64(m.InitialRotation+m.RotationSpeed*elapsed), 360)
+	if rotation < 0 {
+		rotation += 360
 	}
+	m.Rotation = float32(rotation)
 }
 
 // TakeDamage reduce los puntos de vida del meteorito y devuelve true si fue destruido
@@ -208,6 +228,9 @@ func (m *Meteor) GetSyncData() map[string]interface{} {
 		"velocity_y":   m.Velocity.Y,
 		"rotation":     m.Rotation,
 		"rot_speed":    m.RotationSpeed,
+		"origin_x":     m.Origin.X,
+		"origin_y":     m.Origin.Y,
+		"spawn_time":   m.SpawnTimeMs,
 		"hp":           m.Health,
 		"size":         m.Size,
 		"destroyed_by": m.DestroyedBy,
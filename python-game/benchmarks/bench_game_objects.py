@@ -0,0 +1,111 @@
+"""
+Benchmark del núcleo de GameObject.
+
+Mide la memoria por objeto y el tiempo de update()/draw() por frame para
+distintas cantidades de objetos con hitbox, velocidad constante y rotación
+(algunos ocultos, como los meteoritos en parpadeo). La columna
+"queue ms" mide el dibujado a través de la RenderQueue (queue_draw() y un
+blits() por capa), que es el que usa ObjectsManager.draw_objects.
+
+Uso (desde python-game/):
+    python benchmarks/bench_game_objects.py [--frames 200] [--counts 100 1000 5000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import pygame
+
+from motor.render_queue import RenderQueue
+from motor.sprite import GameObject
+from space_shooter.utils.delta_time import DeltaTime
+
+HITBOX = {"width": 20, "height": 20, "offset_x": 0, "offset_y": 0}
+
+# Velocidades de rotación (grados/s) repartidas entre los objetos; 0 = no rota
+ROTATION_SPEEDS = (0, 45, -90, 180)
+
+# Uno de cada HIDDEN_EVERY objetos está oculto
+HIDDEN_EVERY = 5
+
+
+def create_objects(count, image):
+    """Crea objetos con hitbox, velocidad y rotación como los meteoritos."""
+    objects = []
+    for i in range(count):
+        obj = GameObject(i % 400, (i * 7) % 300, image, obj_type="meteor")
+        obj.set_hitbox_data(HITBOX)
+        obj.set_velocity(10, 30)
+        obj.set_rotation((i * 37) % 360, ROTATION_SPEEDS[i % len(ROTATION_SPEEDS)])
+        # Una parte de los objetos está oculta (meteoritos en parpadeo)
+        obj.set_visibility(i % HIDDEN_EVERY != 0)
+        objects.append(obj)
+    return objects
+
+
+def measure_memory(count, image):
+    """Devuelve los bytes asignados por objeto."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = create_objects(count, image)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del objects
+    return allocated / count
+
+
+def measure_frames(count, image, surface, frames):
+    """Devuelve los milisegundos medios por frame de update(), draw() y de la cola de dibujado."""
+    objects = create_objects(count, image)
+    DeltaTime._delta = 1 / 60
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        for obj in objects:
+            obj.update()
+    update_ms = (time.perf_counter() - start) * 1000 / frames
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        for obj in objects:
+            obj.draw(surface)
+    draw_ms = (time.perf_counter() - start) * 1000 / frames
+
+    queue = RenderQueue()
+    start = time.perf_counter()
+    for _ in range(frames):
+        for obj in objects:
+            obj.queue_draw(queue)
+        queue.flush(surface)
+    queue_ms = (time.perf_counter() - start) * 1000 / frames
+    return update_ms, draw_ms, queue_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del núcleo de GameObject")
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--counts", type=int, nargs="+", default=[100, 1000, 5000])
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    surface = pygame.Surface((400, 300))
+    image = pygame.Surface((16, 16))
+
+    print(f"{'objetos':>8} {'bytes/obj':>10} {'update ms':>10} {'draw ms':>10} {'queue ms':>10}")
+    for count in args.counts:
+        per_object = measure_memory(count, image)
+        update_ms, draw_ms, queue_ms = measure_frames(count, image, surface, args.frames)
+        print(f"{count:>8} {per_object:>10.0f} {update_ms:>10.3f} {draw_ms:>10.3f} {queue_ms:>10.3f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
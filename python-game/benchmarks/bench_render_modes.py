@@ -0,0 +1,95 @@
+"""
+Benchmark de los modos de renderizado.
+
+Compara el tiempo de render() por frame con "scaled_frame" (escena en la
+superficie del nivel escalada entera a la ventana), "prescaled" (sprites
+preescalados dibujados directamente en la ventana) y el backend "texture"
+(texturas de SDL2, ver motor/renderers.py) para distintas cantidades de
+meteoritos. Con SDL_VIDEODRIVER=dummy el backend de texturas usa el renderer
+por software de SDL; en una máquina con GPU conviene ejecutarlo con el driver
+de vídeo real.
+
+Uso (desde python-game/):
+    python benchmarks/bench_render_modes.py [--frames 300] [--counts 10 100 500]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import config
+
+# Partida local sin menú ni servidor y sin límite de FPS
+config.Config._config = {
+    "frontend": {
+        "singlePlayerMode": {"enable": True, "skipMenu": True},
+        "display": {"width": 800, "height": 600, "fullscreen": False, "fpsLimit": 0},
+        "level": {"width": 400, "height": 300}
+    }
+}
+
+from motor.renderers import create_renderer
+from space_shooter.core.game import SpaceShooterGame
+
+# (backend, modo de renderizado del backend de superficies)
+MODES = (("surface", "scaled_frame"), ("surface", "prescaled"), ("texture", "scaled_frame"))
+
+
+def populate(game, count):
+    """Deja en la partida exactamente count meteoritos repartidos por el nivel."""
+    for meteor in list(game.get_objects_by_type("meteor")):
+        game.unregister_object(meteor)
+
+    level_width, level_height = game.level_size
+    for _ in range(count):
+        position = (random.uniform(0, level_width), random.uniform(0, level_height))
+        game.meteor_manager.create_meteor(position=position, rotation=(random.uniform(0, 360), 0),
+                                          speed=(0, 0))
+
+
+def use_backend(game, backend):
+    """Cambia el backend de renderizado de la partida si no es el actual."""
+    if game.renderer.name != backend:
+        game.renderer = create_renderer(backend, game, "Benchmark")
+        game.game_window = game.renderer.surface
+
+
+def measure(game, backend, mode, frames):
+    """Devuelve los milisegundos medios de render() con un backend y modo."""
+    use_backend(game, backend)
+    game.render_mode = mode
+    game.render()  # Primer frame fuera de la medida (preescalado o subida de texturas)
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.render()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de los modos de renderizado")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 500])
+    args = parser.parse_args()
+
+    random.seed(1)
+    game = SpaceShooterGame()
+    game.init_game()
+
+    names = [mode if backend == "surface" else backend for backend, mode in MODES]
+    print(f"{'meteoritos':>10} " + " ".join(f"{name + ' ms':>16}" for name in names))
+    for count in args.counts:
+        populate(game, count)
+        results = [measure(game, backend, mode, args.frames) for backend, mode in MODES]
+        print(f"{count:>10} " + " ".join(f"{ms:>16.3f}" for ms in results))
+
+    game.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark de los formatos de superficie.
+
+Compara el coste de un blit de cada imagen del juego sobre una superficie con
+el formato de la pantalla según el formato de origen: tal como la decodifica
+pygame.image.load, convert_alpha(), convert_alpha() con RLEACCEL y el formato
+que elige motor.surface_format.normalize (con y sin RLE). La última columna
+mide una rotación seguida de un blit, el caso de los meteoritos que se rotan
+en cada frame.
+
+Uso (desde python-game/):
+    python benchmarks/bench_surface_formats.py [--blits 20000] [images/...png ...]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import pygame
+
+from motor.surface_format import classify, normalize
+
+DEFAULT_IMAGES = ["images/spaceship.png", "images/damage.png", "images/background1.png"] + \
+    sorted(glob.glob("images/meteors/*_1.png"))
+
+# Posiciones de destino repartidas por la superficie (un blits() por lote)
+POSITIONS = [((i * 37) % 760, (i * 53) % 560) for i in range(200)]
+
+# Rotaciones medidas en la columna de rotación
+ROTATIONS = 1000
+
+
+def measure_blit(image, target, blits):
+    """Devuelve los microsegundos medios por blit."""
+    # El primer blit codifica el RLE: no se mide
+    target.blit(image, (0, 0))
+    batch = [(image, position) for position in POSITIONS]
+    rounds = max(1, blits // len(batch))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        target.blits(batch, False)
+    return (time.perf_counter() - start) * 1e6 / (rounds * len(batch))
+
+
+def measure_rotate(image, target):
+    """Devuelve los microsegundos medios de rotar una imagen y dibujarla una vez."""
+    start = time.perf_counter()
+    for angle in range(ROTATIONS):
+        target.blit(pygame.transform.rotate(image, angle % 360), (100, 100))
+    return (time.perf_counter() - start) * 1e6 / ROTATIONS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de los formatos de superficie")
+    parser.add_argument("--blits", type=int, default=20000)
+    parser.add_argument("images", nargs="*", default=DEFAULT_IMAGES)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+    target = pygame.Surface((800, 600)).convert()
+
+    print(f"{'imagen':<22} {'formato':>9} {'load':>8} {'alpha':>8} {'alpha+rle':>10} "
+          f"{'normal':>8} {'norm+rle':>9} {'rot alpha':>10} {'rot norm':>9}  (us)")
+    for path in args.images:
+        loaded = pygame.image.load(path)
+        alpha = loaded.convert_alpha()
+        alpha_rle = loaded.convert_alpha()
+        alpha_rle.set_alpha(255, pygame.RLEACCEL)
+        normalized = normalize(alpha, rle=False)
+        normalized_rle = normalize(alpha)
+
+        times = [measure_blit(image, target, args.blits)
+                 for image in (loaded, alpha, alpha_rle, normalized, normalized_rle)]
+        rotations = [measure_rotate(image, target) for image in (alpha, normalized)]
+        print(f"{os.path.basename(path):<22} {classify(alpha):>9} {times[0]:>8.2f} {times[1]:>8.2f} "
+              f"{times[2]:>10.2f} {times[3]:>8.2f} {times[4]:>9.2f} {rotations[0]:>10.2f} {rotations[1]:>9.2f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -222,6 +222,26 @@ class Config:
         """
         return cls.get("frontend", "display", "fpsLimit", default=60)
         
+    @classmethod
+    def get_render_mode(cls):
+        """
+        Obtiene el modo de renderizado.
+        
+        Returns:
+            str: "scaled_frame" (escalar el frame completo) o "prescaled" (sprites preescalados).
+        """
+        return cls.get("frontend", "display", "renderMode", default="scaled_frame")
+    
+    @classmethod
+    def get_renderer_backend(cls):
+        """
+        Obtiene el backend de renderizado.
+        
+        Returns:
+            str: "surface" (Surface.blit por software) o "texture" (texturas de SDL2).
+        """
+        return cls.get("frontend", "display", "renderer", default="surface")
+    
     @classmethod
     def get_level_width(cls):
         """
@@ -241,6 +261,17 @@ class Config:
             int: Alto del nivel en píxeles.
         """
         return cls.get("frontend", "level", "height", default=300)
+    
+    @classmethod
+    def get_background_scroll_speed(cls):
+        """
+        Obtiene la velocidad de desplazamiento del fondo.
+        
+        Returns:
+            tuple: Velocidad (x, y) en píxeles del nivel por segundo; (0, 0) si el fondo es fijo.
+        """
+        speed = cls.get("frontend", "level", "backgroundScroll", default=[0, 0])
+        return (float(speed[0]), float(speed[1]))
         
     @classmethod
     def get_level_aspect_ratio(cls):
@@ -254,5 +285,89 @@ class Config:
         height = cls.get_level_height()
         return width / height if height > 0 else 1.0
 
+    @classmethod
+    def is_pixel_perfect_collision_enabled(cls):
+        """
+        Comprueba si las colisiones usan máscaras pixel perfect tras la hitbox.
+        
+        Returns:
+            bool: True si la comprobación pixel perfect está habilitada.
+        """
+        return cls.get("frontend", "collision", "pixelPerfect", default=False)
+    
+    @classmethod
+    def get_collision_mask_angle_step(cls):
+        """
+        Obtiene el paso de cuantización del ángulo para las máscaras de colisión.
+        
+        Returns:
+            int: Paso en grados.
+        """
+        return cls.get("frontend", "collision", "maskAngleStep", default=5)
+    
+    @classmethod
+    def get_sprite_atlas_path(cls):
+        """
+        Obtiene la ruta del índice del atlas de sprites.
+        
+        Returns:
+            str: Ruta relativa del índice JSON, o None si el atlas está desactivado.
+        """
+        return cls.get("frontend", "assets", "atlas", default="images/atlas.json")
+    
+    @classmethod
+    def get_asset_manifest_path(cls):
+        """
+        Obtiene la ruta del manifiesto de recursos que se precargan al iniciar.
+        
+        Returns:
+            str: Ruta relativa del manifiesto JSON.
+        """
+        return cls.get("frontend", "assets", "manifest", default="assets_manifest.json")
+    
+    @classmethod
+    def get_preload_workers(cls):
+        """
+        Obtiene el número de hilos usados para decodificar imágenes en la precarga.
+        
+        Returns:
+            int: Número de hilos.
+        """
+        return cls.get("frontend", "assets", "preloadWorkers", default=4)
+    
+    @classmethod
+    def get_resource_cache_budgets(cls):
+        """
+        Obtiene el presupuesto de memoria de cada categoría de recursos.
+        
+        Returns:
+            dict: Categoría ("images", "scaled", "sounds", "fonts") -> megabytes.
+        """
+        return cls.get("frontend", "assets", "budgetsMB",
+                       default={"images": 32, "scaled": 16, "sounds": 16, "fonts": 2})
+    
+    @classmethod
+    def get_image_cache_dir(cls):
+        """
+        Obtiene el directorio de la caché en disco de imágenes procesadas.
+        
+        Returns:
+            str: Directorio relativo a python-game/, o None si la caché está desactivada.
+        """
+        return cls.get("frontend", "assets", "imageCache", default=".cache/images")
+    
+    @classmethod
+    def get_network_simulation(cls):
+        """
+        Obtiene la configuración del simulador de red.
+        
+        Returns:
+            dict: Configuración de networkSimulation, o None si está deshabilitado
+        """
+        settings = cls.get("frontend", "multiplayerMode", "networkSimulation", default=None)
+        if not settings or not settings.get("enable", False):
+            return None
+        return settings
+
 # Inicializar la configuración al importar el módulo
 Config.load_config() 
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""
+Capa de fondo precompuesta.
+
+El fondo del nivel se compone una sola vez (la imagen repetida en mosaico
+hasta cubrir el nivel) en una superficie cacheada que se restaura cada frame
+con un único blit. Sólo se recompone si cambia la imagen o el tamaño del
+nivel. Admite un desplazamiento (scroll) que da la vuelta sobre la superficie
+cacheada: desplazarse en un solo eje cuesta como mucho dos blits por frame.
+"""
+import pygame
+
+
+def _wrapped_positions(offset, length):
+    """Posiciones de las copias necesarias para cubrir un eje desplazado offset píxeles."""
+    shift = int(offset) % length
+    if shift == 0:
+        return (0,)
+    return (-shift, length - shift)
+
+
+class BackgroundLayer:
+    """
+    Fondo del nivel compuesto en una superficie cacheada.
+    """
+
+    def __init__(self):
+        """Inicializa la capa vacía; se compone en el primer dibujado."""
+        self.image = None
+        self.size = None
+        self.surface = None
+        self._scaled = {}
+
+        # Estadísticas
+        self.rebuilds = 0
+
+    def update(self, image, size):
+        """
+        Recompone la capa si han cambiado la imagen o el tamaño del nivel.
+
+        Args:
+            image: Imagen del fondo (se repite en mosaico)
+            size: Tamaño (ancho, alto) del nivel
+
+        Returns:
+            Surface: Superficie compuesta del tamaño del nivel
+        """
+        size = tuple(size)
+        if image is not self.image or size != self.size:
+            self.image = image
+            self.size = size
+            self.surface = self._compose(image, size)
+            self._scaled.clear()
+            self.rebuilds += 1
+        return self.surface
+
+    def draw(self, surface, offset=(0, 0)):
+        """
+        Dibuja la capa en coordenadas del nivel.
+
+        Args:
+            surface: Superficie del nivel
+            offset: Desplazamiento (x, y) del fondo en píxeles; da la vuelta
+                    sobre el tamaño del nivel
+        """
+        self._blit_wrapped(surface, self.surface, offset)
+
+    def draw_scaled(self, surface, scale, offset=(0, 0)):
+        """
+        Dibuja la capa a resolución de ventana (modo "prescaled").
+        La versión escalada de la capa se calcula una vez por escala.
+
+        Args:
+            surface: Superficie a resolución de ventana
+            scale: Tupla (escala_x, escala_y) del nivel a la ventana
+            offset: Desplazamiento (x, y) del fondo en píxeles del nivel
+        """
+        scaled = self._scaled.get(scale)
+        if scaled is None:
+            width, height = self.size
+            scaled = pygame.transform.scale(self.surface, (round(width * scale[0]), round(height * scale[1])))
+            self._scaled[scale] = scaled
+        self._blit_wrapped(surface, scaled, (round(offset[0] * scale[0]), round(offset[1] * scale[1])))
+
+    def restore(self, surface, rects, offset=(0, 0)):
+        """
+        Restaura el fondo sólo en unos rectángulos (dirty rects) del nivel.
+
+        Args:
+            surface: Superficie del nivel
+            rects: Rectángulos a restaurar
+            offset: Desplazamiento (x, y) actual del fondo
+        """
+        previous_clip = surface.get_clip()
+        for rect in rects:
+            surface.set_clip(rect)
+            self._blit_wrapped(surface, self.surface, offset)
+        surface.set_clip(previous_clip)
+
+    @staticmethod
+    def _compose(image, size):
+        """Repite la imagen en mosaico sobre una superficie opaca del tamaño del nivel."""
+        layer = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+
+        tile_width, tile_height = image.get_size()
+        layer.blits([(image, (x, y))
+                     for x in range(0, size[0], tile_width)
+                     for y in range(0, size[1], tile_height)], False)
+        return layer
+
+    @staticmethod
+    def _blit_wrapped(surface, layer, offset):
+        """Dibuja la capa con su desplazamiento, repitiéndola donde se sale."""
+        width, height = layer.get_size()
+        for y in _wrapped_positions(-offset[1], height):
+            for x in _wrapped_positions(-offset[0], width):
+                surface.blit(layer, (x, y))
@@ -0,0 +1,124 @@
+"""
+Máscaras de colisión cacheadas para la comprobación pixel perfect.
+
+Construir una máscara con pygame.mask.from_surface en cada frame es demasiado
+caro, así que se guarda una máscara por imagen original y por ángulo
+cuantizado. La comprobación sólo se consulta cuando las hitboxes ya se solapan
+(ver CollisionScheduler.narrowphase).
+"""
+import pygame
+
+
+class MaskCache:
+    """
+    Caché de máscaras por imagen y ángulo de rotación cuantizado.
+    """
+
+    def __init__(self, angle_step=5):
+        """
+        Inicializa la caché.
+
+        Args:
+            angle_step: Paso de cuantización del ángulo en grados
+        """
+        self.angle_step = angle_step
+        self._masks = {}
+
+        # Estadísticas
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0  # Contactos de hitbox descartados por las máscaras
+
+    def get_mask(self, image, angle=0):
+        """
+        Obtiene la máscara de una imagen rotada al ángulo cuantizado más cercano.
+
+        Args:
+            image: Imagen original (sin rotar)
+            angle: Ángulo de rotación en grados
+
+        Returns:
+            pygame.mask.Mask: Máscara de la imagen rotada
+        """
+        step = self.angle_step
+        quantized = int(round(angle / step)) * step % 360
+        key = (image, quantized)
+
+        mask = self._masks.get(key)
+        if mask is not None:
+            self.hits += 1
+            return mask
+
+        self.misses += 1
+        rotated = pygame.transform.rotate(image, quantized) if quantized else image
+        mask = pygame.mask.from_surface(rotated)
+        self._masks[key] = mask
+        return mask
+
+    def warm(self, image):
+        """
+        Construye por adelantado las máscaras de todos los ángulos de una imagen.
+
+        Args:
+            image: Imagen original (sin rotar)
+
+        Returns:
+            int: Número de máscaras nuevas
+        """
+        built = 0
+        for angle in range(0, 360, self.angle_step):
+            if (image, angle) not in self._masks:
+                self._masks[(image, angle)] = pygame.mask.from_surface(
+                    pygame.transform.rotate(image, angle) if angle else image)
+                built += 1
+        return built
+
+    def overlap(self, a, b):
+        """
+        Comprueba si las siluetas de dos objetos se solapan.
+        Las máscaras se centran en la posición de cada objeto, igual que
+        GameObject.draw centra el sprite.
+
+        Args:
+            a: Primer objeto
+            b: Segundo objeto
+
+        Returns:
+            bool: True si hay algún píxel opaco en común
+        """
+        image_a = a.original_image
+        image_b = b.original_image
+        if image_a is None or image_b is None:
+            return True
+
+        mask_a = self.get_mask(image_a, a.angle)
+        mask_b = self.get_mask(image_b, b.angle)
+        width_a, height_a = mask_a.get_size()
+        width_b, height_b = mask_b.get_size()
+
+        offset = (
+            (round(b.x) - width_b // 2) - (round(a.x) - width_a // 2),
+            (round(b.y) - height_b // 2) - (round(a.y) - height_a // 2)
+        )
+        if mask_a.overlap(mask_b, offset) is None:
+            self.rejected += 1
+            return False
+        return True
+
+    def clear(self):
+        """Vacía la caché de máscaras."""
+        self._masks.clear()
+
+    def get_stats(self):
+        """
+        Obtiene las estadísticas de la caché.
+
+        Returns:
+            dict: Máscaras cacheadas, aciertos, fallos y contactos descartados
+        """
+        return {
+            "masks": len(self._masks),
+            "hits": self.hits,
+            "misses": self.misses,
+            "rejected": self.rejected
+        }
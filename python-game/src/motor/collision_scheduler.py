@@ -0,0 +1,324 @@
+"""
+Planificador de colisiones por tiempo de impacto.
+
+En lugar de comprobar solapamientos entre todos los pares en cada frame,
+calcula de forma analítica (swept AABB) el instante en que dos hitboxes con
+velocidad constante empiezan a solaparse y guarda ese contacto previsto en una
+cola de prioridad. Las predicciones sólo se recalculan cuando un objeto se
+registra o cambia su movimiento (ver GameObject.notify_motion_changed).
+
+Como el contacto se dispara aunque los objetos ya se hayan cruzado entre dos
+frames, un misil rápido no atraviesa meteoritos pequeños con FPS bajos. Ese
+cruce se confirma con el desplazamiento real de los objetos en el último frame
+(ver swept_overlap): las predicciones usan el tiempo del mundo, pero los objetos
+sin trayectoria se mueven con DeltaTime, que se limita tras un tirón y no
+avanza en pausa, así que un contacto puede vencer con los objetos aún lejos.
+"""
+import heapq
+import itertools
+
+from motor.collision_shapes import shape_overlaps
+
+
+class CollisionScheduler:
+    """
+    Cola de contactos previstos entre objetos con hitbox.
+
+    Cada entrada guarda la versión de movimiento de ambos objetos en el momento
+    de la predicción; si alguno cambia de movimiento la entrada queda obsoleta
+    y se descarta al sacarla de la cola (invalidación perezosa).
+    """
+
+    # Tamaño mínimo de la cola antes de plantearse compactarla
+    COMPACT_MIN_SIZE = 256
+
+    def __init__(self):
+        """Inicializa el planificador vacío."""
+        self._heap = []
+        self._sequence = itertools.count()
+
+        # Objetos con hitbox registrados y objetos pendientes de predecir
+        self._active = set()
+        self._dirty = {}  # dict como conjunto ordenado (orden de llegada)
+
+        # Comprobación fina opcional: función (a, b) -> bool que se consulta
+        # sólo cuando las hitboxes ya se solapan (por ejemplo MaskCache.overlap)
+        self.narrowphase = None
+
+        # Estadísticas
+        self.predictions = 0   # Pares evaluados
+        self.scheduled = 0     # Contactos añadidos a la cola
+        self.fired = 0         # Contactos disparados
+        self.stale = 0         # Entradas descartadas por obsoletas
+        self.rejected = 0      # Contactos de caja descartados por la forma o la máscara
+
+    def add(self, obj):
+        """
+        Añade un objeto al planificador.
+
+        Args:
+            obj: Objeto del juego (GameObject)
+        """
+        self._active.add(obj)
+        self._dirty[obj] = True
+
+    def remove(self, obj):
+        """
+        Quita un objeto del planificador.
+
+        Args:
+            obj: Objeto del juego (GameObject)
+        """
+        self._active.discard(obj)
+        self._dirty.pop(obj, None)
+        # Invalida sus contactos por si el objeto se vuelve a registrar
+        obj.motion_version += 1
+
+    def mark_dirty(self, obj):
+        """
+        Marca un objeto para recalcular sus contactos en la próxima actualización.
+
+        Args:
+            obj: Objeto cuyo movimiento ha cambiado
+        """
+        if obj in self._active:
+            self._dirty[obj] = True
+
+    def clear(self):
+        """Elimina todos los objetos y contactos pendientes."""
+        for obj in self._active:
+            obj.motion_version += 1
+        self._active.clear()
+        self._dirty.clear()
+        self._heap.clear()
+
+    def update(self, now):
+        """
+        Recalcula los contactos de los objetos modificados y dispara los vencidos.
+
+        Args:
+            now: Tiempo del mundo actual en segundos
+        """
+        if self._dirty:
+            self._predict_dirty(now)
+
+        # Sacar de la cola todos los contactos vencidos en este frame
+        heap = self._heap
+        due = []
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if self._is_valid(entry[2], entry[3], entry[4], entry[5]):
+                due.append(entry)
+            else:
+                self.stale += 1
+
+        # Las cajas envolventes que se solapan ahora se confirman con la forma
+        # real (círculo/caja) en una sola pasada; un contacto ya cruzado entre
+        # frames se confirma con el desplazamiento real de los objetos
+        overlapping = [entry[2].hitbox.colliderect(entry[3].hitbox) for entry in due]
+        candidates = [(entry[2], entry[3]) for entry, overlap in zip(due, overlapping) if overlap]
+        shape_results = iter(shape_overlaps(candidates)) if candidates else iter(())
+
+        persistent = []
+        narrowphase = self.narrowphase
+        for entry, overlap in zip(due, overlapping):
+            _, _, a, b, version_a, version_b, exit_time = entry
+            shape_hit = next(shape_results) if overlap else None
+
+            # Un contacto anterior de este frame puede haber eliminado el objeto
+            if not self._is_valid(a, b, version_a, version_b):
+                self.stale += 1
+                continue
+
+            if not overlap and not self.swept_overlap(a, b):
+                # La predicción se adelantó al movimiento real de los objetos:
+                # invalidar sus contactos y volver a predecirlos desde aquí
+                self.rejected += 1
+                self._repredict(a)
+                self._repredict(b)
+                continue
+            if not overlap:
+                shape_hit = True
+
+            if overlap and shape_hit and narrowphase is not None:
+                shape_hit = narrowphase(a, b)
+
+            if shape_hit:
+                self.fired += 1
+                self._dispatch(a, b)
+            else:
+                self.rejected += 1
+
+            # Mientras las hitboxes sigan solapadas el contacto se repite en el
+            # siguiente frame, igual que la comprobación por solapamiento
+            if exit_time > now and self._is_valid(a, b, version_a, version_b):
+                persistent.append((now, next(self._sequence), a, b,
+                                   version_a, version_b, exit_time))
+
+        for entry in persistent:
+            heapq.heappush(heap, entry)
+
+        if len(heap) > self.COMPACT_MIN_SIZE and len(heap) > 8 * len(self._active):
+            self._compact()
+
+    def get_stats(self):
+        """
+        Obtiene las estadísticas del planificador.
+
+        Returns:
+            dict: Objetos, contactos en cola y contadores acumulados
+        """
+        return {
+            "objects": len(self._active),
+            "queued": len(self._heap),
+            "predictions": self.predictions,
+            "scheduled": self.scheduled,
+            "fired": self.fired,
+            "stale": self.stale,
+            "rejected": self.rejected
+        }
+
+    def _predict_dirty(self, now):
+        """Calcula los contactos de los objetos marcados contra el resto."""
+        # Copias: un objeto añadido o marcado mientras se predice queda para la
+        # siguiente actualización en lugar de alterar las colecciones recorridas
+        dirty = tuple(self._dirty)
+        self._dirty.clear()
+        active = tuple(self._active)
+
+        processed = set()
+        for obj in dirty:
+            processed.add(obj)
+            if not obj.has_hitbox:
+                continue
+            for other in active:
+                # Un par con los dos objetos marcados se predice una sola vez
+                if other in processed or not other.has_hitbox:
+                    continue
+                if not self._wants_contact(obj, other):
+                    continue
+                self._schedule_pair(obj, other, now)
+
+    def _schedule_pair(self, a, b, now):
+        """Predice el contacto entre dos objetos y lo añade a la cola."""
+        self.predictions += 1
+        impact = self.time_of_impact(a, b)
+        if impact is None:
+            return
+
+        enter, exit_time = impact
+        heapq.heappush(self._heap, (now + enter, next(self._sequence), a, b,
+                                    a.motion_version, b.motion_version, now + exit_time))
+        self.scheduled += 1
+
+    def _repredict(self, obj):
+        """Invalida los contactos de un objeto y lo marca para predecirlos de nuevo."""
+        obj.motion_version += 1
+        self._dirty[obj] = True
+
+    def _is_valid(self, a, b, version_a, version_b):
+        """Comprueba que un contacto previsto siga vigente."""
+        return (a.motion_version == version_a and b.motion_version == version_b
+                and a in self._active and b in self._active
+                and a.has_hitbox and b.has_hitbox)
+
+    def _compact(self):
+        """Reconstruye la cola sin las entradas obsoletas."""
+        valid = [entry for entry in self._heap
+                 if self._is_valid(entry[2], entry[3], entry[4], entry[5])]
+        self.stale += len(self._heap) - len(valid)
+        heapq.heapify(valid)
+        self._heap = valid
+
+    @staticmethod
+    def _dispatch(a, b):
+        """Notifica la colisión a ambos objetos."""
+        if hasattr(a, 'on_collide') and callable(a.on_collide):
+            a.on_collide(b)
+        if hasattr(b, 'on_collide') and callable(b.on_collide):
+            b.on_collide(a)
+
+    @staticmethod
+    def _wants_contact(a, b):
+        """
+        Comprueba si alguno de los dos objetos quiere recibir contactos del otro.
+        collision_targets = None significa "colisiona con todo".
+        """
+        targets_a = a.collision_targets
+        targets_b = b.collision_targets
+        return ((targets_a is None or b.type in targets_a)
+                or (targets_b is None or a.type in targets_b))
+
+    @staticmethod
+    def time_of_impact(a, b):
+        """
+        Calcula el intervalo de solapamiento de dos hitboxes con velocidad constante.
+
+        Args:
+            a: Primer objeto
+            b: Segundo objeto
+
+        Returns:
+            tuple: (entrada, salida) en segundos relativos al estado actual,
+                   con entrada = 0 si ya se solapan, o None si nunca se solapan
+        """
+        return CollisionScheduler._overlap_interval(
+            (b.x - a.x, b.speed_x - a.speed_x, (a.hitbox.width + b.hitbox.width) / 2.0),
+            (b.y - a.y, b.speed_y - a.speed_y, (a.hitbox.height + b.hitbox.height) / 2.0)
+        )
+
+    @staticmethod
+    def swept_overlap(a, b):
+        """
+        Comprueba si las hitboxes de dos objetos se han solapado durante el
+        último frame, moviéndolas en línea recta desde su posición anterior
+        (previous_x, previous_y) hasta la actual.
+
+        Args:
+            a: Primer objeto
+            b: Segundo objeto
+
+        Returns:
+            bool: True si las hitboxes se han tocado en algún momento del frame
+        """
+        impact = CollisionScheduler._overlap_interval(
+            (b.previous_x - a.previous_x, (b.x - b.previous_x) - (a.x - a.previous_x),
+             (a.hitbox.width + b.hitbox.width) / 2.0),
+            (b.previous_y - a.previous_y, (b.y - b.previous_y) - (a.y - a.previous_y),
+             (a.hitbox.height + b.hitbox.height) / 2.0)
+        )
+        # Con el desplazamiento como velocidad el frame dura una unidad de tiempo
+        return impact is not None and impact[0] <= 1.0
+
+    @staticmethod
+    def _overlap_interval(*axes):
+        """
+        Intervalo en que dos cajas con velocidad relativa constante se solapan.
+
+        Args:
+            axes: Por eje, tupla (distancia entre centros, velocidad relativa,
+                  suma de las semiextensiones)
+
+        Returns:
+            tuple: (entrada, salida) o None si nunca se solapan
+        """
+        enter = float('-inf')
+        exit_time = float('inf')
+
+        for distance, velocity, reach in axes:
+            if velocity == 0:
+                # Sin movimiento relativo en este eje: o se solapan siempre o nunca
+                if abs(distance) >= reach:
+                    return None
+                continue
+
+            t1 = (-reach - distance) / velocity
+            t2 = (reach - distance) / velocity
+            if t1 > t2:
+                t1, t2 = t2, t1
+            enter = max(enter, t1)
+            exit_time = min(exit_time, t2)
+
+        if enter >= exit_time or exit_time <= 0:
+            return None
+        return max(enter, 0.0), exit_time
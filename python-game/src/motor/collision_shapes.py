@@ -0,0 +1,113 @@
+"""
+Pruebas de forma para colisionadores círculo y caja (AABB).
+
+Los contactos que el planificador de colisiones da por buenos con las cajas
+envolventes se confirman aquí según la forma real declarada en HitboxSpec.
+Cuando hay suficientes pares en el mismo frame las pruebas se hacen en una
+sola pasada vectorizada con NumPy.
+"""
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usa la versión escalar
+    np = None
+
+# Número mínimo de pares para que la pasada vectorizada compense su coste fijo
+BATCH_MIN_PAIRS = 16
+
+
+def _collider(obj):
+    """Devuelve (es_círculo, x, y, radio, semiancho, semialto) de un objeto."""
+    spec = obj.hitbox_spec
+    hitbox = obj.hitbox
+    is_circle = spec is not None and spec.shape == "circle"
+    radius = spec.radius if is_circle else 0.0
+    return is_circle, obj.x, obj.y, radius, hitbox.width / 2.0, hitbox.height / 2.0
+
+
+def shape_overlap(a, b):
+    """
+    Comprueba el solapamiento de dos objetos según su forma.
+
+    Args:
+        a: Primer objeto
+        b: Segundo objeto
+
+    Returns:
+        bool: True si las formas se solapan
+    """
+    circle_a, ax, ay, ra, hwa, hha = _collider(a)
+    circle_b, bx, by, rb, hwb, hhb = _collider(b)
+
+    if circle_a and circle_b:
+        reach = ra + rb
+        return (bx - ax) ** 2 + (by - ay) ** 2 < reach * reach
+
+    if not circle_a and not circle_b:
+        return abs(bx - ax) < hwa + hwb and abs(by - ay) < hha + hhb
+
+    # Círculo contra caja: punto de la caja más cercano al centro del círculo
+    if circle_a:
+        cx, cy, radius, box_x, box_y, half_w, half_h = ax, ay, ra, bx, by, hwb, hhb
+    else:
+        cx, cy, radius, box_x, box_y, half_w, half_h = bx, by, rb, ax, ay, hwa, hha
+    closest_x = min(max(cx, box_x - half_w), box_x + half_w)
+    closest_y = min(max(cy, box_y - half_h), box_y + half_h)
+    return (cx - closest_x) ** 2 + (cy - closest_y) ** 2 < radius * radius
+
+
+def shape_overlaps(pairs):
+    """
+    Comprueba el solapamiento de una lista de pares según su forma.
+
+    Args:
+        pairs: Lista de tuplas (a, b)
+
+    Returns:
+        list: Un bool por par
+    """
+    if np is None or len(pairs) < BATCH_MIN_PAIRS:
+        return [shape_overlap(a, b) for a, b in pairs]
+
+    # Cada objeto se lee una sola vez aunque aparezca en varios pares
+    index = {}
+    colliders = []
+    index_a = []
+    index_b = []
+    for a, b in pairs:
+        for obj, indices in ((a, index_a), (b, index_b)):
+            position = index.get(obj)
+            if position is None:
+                position = len(colliders)
+                index[obj] = position
+                colliders.append(_collider(obj))
+            indices.append(position)
+
+    data = np.array(colliders, dtype=np.float64)
+    data_a = data[index_a]
+    data_b = data[index_b]
+    circle_a = data_a[:, 0] > 0
+    circle_b = data_b[:, 0] > 0
+
+    dx = data_b[:, 1] - data_a[:, 1]
+    dy = data_b[:, 2] - data_a[:, 2]
+
+    # Círculo contra círculo
+    reach = data_a[:, 3] + data_b[:, 3]
+    circle_circle = dx * dx + dy * dy < reach * reach
+
+    # Caja contra caja
+    box_box = ((np.abs(dx) < data_a[:, 4] + data_b[:, 4])
+               & (np.abs(dy) < data_a[:, 5] + data_b[:, 5]))
+
+    # Círculo contra caja: se toma la caja como origen y el círculo como punto
+    box = np.where(circle_a[:, None], data_b, data_a)
+    circle = np.where(circle_a[:, None], data_a, data_b)
+    closest_x = np.clip(circle[:, 1], box[:, 1] - box[:, 4], box[:, 1] + box[:, 4])
+    closest_y = np.clip(circle[:, 2], box[:, 2] - box[:, 5], box[:, 2] + box[:, 5])
+    ex = circle[:, 1] - closest_x
+    ey = circle[:, 2] - closest_y
+    circle_box = ex * ex + ey * ey < circle[:, 3] * circle[:, 3]
+
+    result = np.where(circle_a & circle_b, circle_circle,
+                      np.where(circle_a | circle_b, circle_box, box_box))
+    return result.tolist()
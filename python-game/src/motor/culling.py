@@ -0,0 +1,77 @@
+"""
+Recorte (culling) de objetos fuera del nivel.
+
+Una sola pasada por frame calcula, para cada objeto, si su sprite toca el
+rectángulo del nivel (los que no lo tocan no se rotan ni se dibujan) y si ya
+ha salido por alguno de los bordes por los que debe desaparecer
+(GameObject.despawn_edges). Con suficientes objetos la pasada se hace
+vectorizada con NumPy.
+"""
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usa la versión escalar
+    np = None
+
+# Bordes del nivel por los que un objeto desaparece al salir (máscara de bits)
+EDGE_TOP = 1
+EDGE_BOTTOM = 2
+EDGE_LEFT = 4
+EDGE_RIGHT = 8
+
+# Número mínimo de objetos para que la pasada vectorizada compense su coste fijo
+BATCH_MIN_OBJECTS = 32
+
+
+def _extents(obj):
+    """Devuelve (x, y, semiancho, semialto, bordes) del sprite de un objeto."""
+    image = obj.image
+    if image is None:
+        half_width = half_height = 0.0
+    else:
+        width, height = image.get_size()
+        half_width = width / 2.0
+        half_height = height / 2.0
+    return obj.x, obj.y, half_width, half_height, obj.despawn_edges
+
+
+def cull(objects, width, height):
+    """
+    Clasifica los objetos según el rectángulo del nivel (0, 0, width, height).
+
+    Args:
+        objects: Lista de objetos
+        width: Ancho del nivel
+        height: Alto del nivel
+
+    Returns:
+        tuple: (visibles, salidos) con un bool por objeto: si el sprite toca
+               el nivel y si el objeto ha salido por uno de sus despawn_edges
+    """
+    if np is None or len(objects) < BATCH_MIN_OBJECTS:
+        visible = []
+        gone = []
+        for obj in objects:
+            x, y, half_width, half_height, edges = _extents(obj)
+            left = x + half_width < 0
+            right = x - half_width > width
+            top = y + half_height < 0
+            bottom = y - half_height > height
+            visible.append(not (left or right or top or bottom))
+            gone.append(bool(edges) and (
+                (edges & EDGE_TOP and top) or (edges & EDGE_BOTTOM and bottom)
+                or (edges & EDGE_LEFT and left) or (edges & EDGE_RIGHT and right)))
+        return visible, gone
+
+    data = np.array([_extents(obj) for obj in objects], dtype=np.float64)
+    x, y, half_width, half_height = data[:, 0], data[:, 1], data[:, 2], data[:, 3]
+    edges = data[:, 4].astype(np.int64)
+
+    left = x + half_width < 0
+    right = x - half_width > width
+    top = y + half_height < 0
+    bottom = y - half_height > height
+
+    visible = ~(left | right | top | bottom)
+    gone = (((edges & EDGE_TOP) > 0) & top) | (((edges & EDGE_BOTTOM) > 0) & bottom) \
+        | (((edges & EDGE_LEFT) > 0) & left) | (((edges & EDGE_RIGHT) > 0) & right)
+    return visible.tolist(), gone.tolist()
@@ -0,0 +1,139 @@
+"""
+Bus de eventos del motor del juego.
+
+Los eventos son clases registro con __slots__ (derivadas de Event). Cada
+manejador se suscribe a una clase de evento concreta, así que publicar un
+evento sólo llama a sus suscriptores, no a todos los objetos del juego.
+Los objetos del juego declaran sus manejadores en
+GameObject.get_event_handlers y el ObjectsManager los suscribe al registrarlos.
+
+Los manejadores registran y eliminan objetos, así que sólo pueden ejecutarse en
+el hilo principal. Los demás hilos (p. ej. el que recibe los eventos del
+servidor) encolan sus eventos con post y el motor los entrega al empezar cada
+actualización (ver GameEngine.dispatch_posted_events).
+"""
+import queue
+
+
+class Event:
+    """
+    Base de los eventos. Las clases derivadas declaran sus campos en __slots__.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+
+class EventBus:
+    """
+    Suscripciones por clase de evento y contadores de despacho.
+    """
+
+    def __init__(self):
+        """Inicializa el bus sin suscripciones."""
+        # Clase de evento -> {manejador: None}: conserva el orden de suscripción
+        # y permite cancelar una suscripción en O(1)
+        self._subscribers = {}
+
+        # Clase de evento -> [eventos publicados, llamadas a manejadores]
+        self._counts = {}
+
+        # Eventos enviados desde otros hilos pendientes de entregar
+        self._posted = queue.SimpleQueue()
+
+    def subscribe(self, event_type, handler):
+        """
+        Suscribe un manejador a una clase de evento.
+
+        Args:
+            event_type: Clase del evento (derivada de Event)
+            handler: Función que recibe el evento
+        """
+        handlers = self._subscribers.get(event_type)
+        if handlers is None:
+            handlers = self._subscribers[event_type] = {}
+        handlers[handler] = None
+
+    def unsubscribe(self, event_type, handler):
+        """
+        Cancela la suscripción de un manejador.
+
+        Args:
+            event_type: Clase del evento
+            handler: Manejador suscrito
+        """
+        handlers = self._subscribers.get(event_type)
+        if handlers:
+            handlers.pop(handler, None)
+
+    def publish(self, event):
+        """
+        Entrega un evento a los manejadores suscritos a su clase.
+
+        Args:
+            event: Evento a publicar
+
+        Returns:
+            int: Número de manejadores llamados
+        """
+        event_type = type(event)
+        counts = self._counts.get(event_type)
+        if counts is None:
+            counts = self._counts[event_type] = [0, 0]
+        counts[0] += 1
+
+        handlers = self._subscribers.get(event_type)
+        if not handlers:
+            return 0
+
+        # Una copia: un manejador puede suscribir o cancelar suscripciones
+        handlers = tuple(handlers)
+        for handler in handlers:
+            handler(event)
+        counts[1] += len(handlers)
+        return len(handlers)
+
+    def post(self, event):
+        """
+        Encola un evento para entregarlo en el hilo principal. Se puede llamar
+        desde cualquier hilo.
+
+        Args:
+            event: Evento a publicar
+        """
+        self._posted.put(event)
+
+    def take_posted(self):
+        """
+        Saca los eventos encolados con post, en orden de llegada. Debe
+        llamarse desde el hilo principal, que los publica a continuación.
+
+        Returns:
+            list: Eventos pendientes
+        """
+        posted = self._posted
+        events = []
+        while True:
+            try:
+                events.append(posted.get_nowait())
+            except queue.Empty:
+                return events
+
+    def get_stats(self):
+        """
+        Obtiene los contadores de cada clase de evento publicada.
+
+        Returns:
+            dict: Nombre del evento -> {"published", "dispatched", "subscribers"}
+        """
+        return {
+            event_type.__name__: {
+                "published": published,
+                "dispatched": dispatched,
+                "subscribers": len(self._subscribers.get(event_type, ()))
+            }
+            for event_type, (published, dispatched) in self._counts.items()
+        }
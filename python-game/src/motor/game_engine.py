@@ -8,7 +8,12 @@ import os
 import pygame
 
 # Importar clases base
+from motor.event_bus import EventBus
 from motor.objects_manager import ObjectsManager
+from motor.object_pool import ObjectPool
+from motor.renderers import create_renderer
+from motor.text_service import TextService
+from motor.timer_service import TimerService
 from space_shooter.utils.delta_time import DeltaTime
 import config
 
@@ -47,11 +52,23 @@ class GameEngine:
         # Crear superficie virtual para el nivel
         self.game_surface = pygame.Surface(self.level_size)
         
+        # Modo de renderizado: "scaled_frame" dibuja en la superficie virtual y
+        # la escala entera a la ventana; "prescaled" dibuja directamente en la
+        # ventana con sprites escalados una sola vez (ver render_prescaled)
+        self.render_mode = config.Config.get_render_mode()
+        self.view_scale = (width / self.level_size[0], height / self.level_size[1])
+        
+        # Gestor de recursos; lo crean las clases derivadas (necesario para "prescaled")
+        self.resource_manager = None
+        
         # Aplicar configuración de pantalla completa si está habilitada
         display_flags = pygame.FULLSCREEN if config.Config.is_fullscreen() else 0
-        self.game_window = pygame.display.set_mode(self.screen_size, display_flags)
         
-        pygame.display.set_caption(title)
+        # Backend de renderizado ("surface" o "texture", ver motor/renderers.py).
+        # game_window es la superficie a resolución de ventana donde se dibuja la interfaz
+        self.renderer = create_renderer(config.Config.get_renderer_backend(), self, title, display_flags)
+        self.game_window = self.renderer.surface
+        print(f"Backend de renderizado: {self.renderer.name}")
         
         # Usar el límite de FPS de la configuración, o el valor por defecto si no está disponible
         self.fps = config.Config.get_fps_limit() if hasattr(config.Config, 'get_fps_limit') else fps
@@ -63,10 +80,27 @@ class GameEngine:
         self.paused = False
         
         # Inicializar el gestor de objetos
+        # Bus de eventos y temporizadores (antes que el gestor de objetos, que
+        # suscribe los manejadores y cancela los temporizadores de sus objetos)
+        self.events = EventBus()
+        self.timers = TimerService()
         self.objects_manager = ObjectsManager(self)
         
+        # Fuentes y textos renderizados compartidos
+        self.text_service = TextService.get_default()
+        
+        # Pools de objetos reutilizables por nombre (ver get_pool)
+        self.object_pools = {}
+        
         # Modo depuración para mostrar hitboxes
         self.debug_mode = False
+        
+        # Tiempo de simulación (segundos acumulados sin contar las pausas)
+        self.sim_time = 0.0
+        
+        # Tiempo del mundo fijado al inicio de cada actualización.
+        # Lo usan los objetos con trayectoria analítica (ver GameObject.set_trajectory)
+        self.world_time = 0.0
 
         print("GameEngine inicializado correctamente.")
     
@@ -163,9 +197,22 @@ class GameEngine:
         
     def update(self):
         """Actualiza la lógica del juego."""
+        # Publicar en este hilo los eventos recibidos desde otros hilos
+        self.dispatch_posted_events()
+        
+        # Avanzar el tiempo de simulación y fijar el tiempo del mundo de este frame
+        self.sim_time += DeltaTime.get_delta()
+        self.world_time = self.get_world_time()
+        
+        # Llamar a los temporizadores vencidos en el nuevo tiempo de simulación
+        self.timers.advance(self.sim_time)
+        
         # Actualizar los objetos
         self.objects_manager.update_objects()
         
+        # Marcar los objetos fuera del nivel y eliminar los que han salido de él
+        self.objects_manager.cull_objects()
+        
         # Detectar colisiones
         self.objects_manager.detect_collisions()
         
@@ -175,6 +222,19 @@ class GameEngine:
         # Eliminar objetos marcados para destrucción
         self.clean_destroyed_objects()
     
+    def get_world_time(self):
+        """
+        Obtiene el tiempo del mundo sobre el que se evalúan las trayectorias.
+        
+        Por defecto es el tiempo de simulación local. Las clases derivadas
+        pueden sobrescribirlo para usar una línea temporal compartida
+        (por ejemplo, el reloj del servidor en multijugador).
+        
+        Returns:
+            float: Tiempo del mundo en segundos
+        """
+        return self.sim_time
+    
     def on_update(self):
         """
         Actualiza la lógica específica del juego.
@@ -185,8 +245,27 @@ class GameEngine:
     def render(self):
         """
         Renderiza el juego.
-        Gestiona el renderizado base y luego llama al renderizado específico.
+        Delega en el backend de renderizado: el de superficies dibuja la escena
+        según el modo de renderizado (render_scaled_frame o render_prescaled) y
+        el de texturas la dibuja con el renderer de SDL. Ambos dibujan después
+        la interfaz a resolución de ventana (on_render_ui) y actualizan la pantalla.
+        """
+        self.renderer.render()
+    
+    def uses_prescaled_render(self):
         """
+        Comprueba si este frame se dibuja en modo "prescaled".
+        En modo debug se usa siempre "scaled_frame" para ver las hitboxes en
+        coordenadas del nivel.
+        
+        Returns:
+            bool: True si se dibuja directamente en la ventana con sprites preescalados
+        """
+        return (self.render_mode == "prescaled" and self.resource_manager is not None
+                and not self.debug_mode)
+    
+    def render_scaled_frame(self):
+        """Dibuja la escena en la superficie virtual y la escala entera a la ventana."""
         # Limpiar la superficie virtual (color negro por defecto)
         self.game_surface.fill((0, 0, 0))
         
@@ -201,28 +280,48 @@ class GameEngine:
         
         # En modo debug, dibujar las hitboxes en la superficie virtual
         if self.debug_mode:
-            self.objects_manager.draw_hitboxes(self.game_surface)
-            
-            # Mostrar información de depuración sobre FPS
-            fps = self.clock.get_fps()
-            fps_limit = self.fps
-            fps_color = (0, 255, 0) if fps >= fps_limit * 0.95 else (255, 0, 0)
-            self.draw_text(self.game_surface, f"FPS: {fps:.1f}/{fps_limit}", (5, 5), fps_color)
-            
-            # Mostrar tiempo delta usando la clase estática DeltaTime
-            dt_text = f"DT: {DeltaTime.get_delta() * 1000:.2f}ms"
-            self.draw_text(self.game_surface, dt_text, (5, 25), fps_color)
-            
-            # Mostrar resolución
-            res_text = f"Level: {self.level_size[0]}x{self.level_size[1]} => Window: {self.screen_size[0]}x{self.screen_size[1]}"
-            self.draw_text(self.game_surface, res_text, (5, 45), (255, 255, 255))
+            self.on_render_debug(self.game_surface)
         
         # Escalar la superficie virtual a la ventana real
         scaled_surface = pygame.transform.scale(self.game_surface, self.screen_size)
         self.game_window.blit(scaled_surface, (0, 0))
+    
+    def render_prescaled(self):
+        """
+        Dibuja la escena directamente en la ventana.
+        Los sprites se escalan una sola vez por factor de escala en el
+        ResourceManager y las posiciones se multiplican por view_scale, así que
+        no hay que reescalar el frame completo.
+        """
+        window = self.game_window
+        scale = self.view_scale
+        window.fill((0, 0, 0))
+        self.on_render_background_scaled(window, scale)
+        self.objects_manager.draw_objects_scaled(window, scale, self.resource_manager)
+        self.on_render_foreground_scaled(window, scale)
+    
+    def on_render_debug(self, surface):
+        """
+        Dibuja la información de depuración en la superficie virtual.
         
-        # Actualizar la pantalla
-        pygame.display.update()
+        Args:
+            surface: Superficie virtual del nivel
+        """
+        self.objects_manager.draw_hitboxes(surface)
+        
+        # Mostrar información de depuración sobre FPS
+        fps = self.clock.get_fps()
+        fps_limit = self.fps
+        fps_color = (0, 255, 0) if fps >= fps_limit * 0.95 else (255, 0, 0)
+        self.draw_text(surface, f"FPS: {fps:.1f}/{fps_limit}", (5, 5), fps_color, dynamic=True)
+        
+        # Mostrar tiempo delta usando la clase estática DeltaTime
+        dt_text = f"DT: {DeltaTime.get_delta() * 1000:.2f}ms"
+        self.draw_text(surface, dt_text, (5, 25), fps_color, dynamic=True)
+        
+        # Mostrar resolución
+        res_text = f"Level: {self.level_size[0]}x{self.level_size[1]} => Window: {self.screen_size[0]}x{self.screen_size[1]}"
+        self.draw_text(surface, res_text, (5, 45), (255, 255, 255))
     
     def on_render_background(self, surface):
         """
@@ -244,6 +343,38 @@ class GameEngine:
         """
         pass
     
+    def on_render_background_scaled(self, surface, scale):
+        """
+        Renderiza el fondo en modo "prescaled".
+        Este método debe ser implementado por las clases derivadas.
+        
+        Args:
+            surface: Ventana donde dibujar
+            scale: Tupla (escala_x, escala_y) del nivel a la ventana
+        """
+        pass
+    
+    def on_render_foreground_scaled(self, surface, scale):
+        """
+        Renderiza el primer plano en modo "prescaled".
+        Este método debe ser implementado por las clases derivadas.
+        
+        Args:
+            surface: Ventana donde dibujar
+            scale: Tupla (escala_x, escala_y) del nivel a la ventana
+        """
+        pass
+    
+    def on_render_ui(self, surface):
+        """
+        Renderiza la interfaz sobre la escena, a resolución de ventana.
+        Este método debe ser implementado por las clases derivadas.
+        
+        Args:
+            surface: Ventana donde dibujar
+        """
+        pass
+    
     def draw_objects(self):
         """Dibuja todos los objetos registrados."""
         # Dibujar objetos en su orden de capa (z_index)
@@ -294,40 +425,40 @@ class GameEngine:
         """Elimina todos los objetos registrados."""
         self.objects_manager.clear_objects()
     
-    def emit_event(self, event_type, data=None, target_type=None):
+    def emit_event(self, event):
         """
-        Emite un evento a todos los objetos registrados o solo a un tipo específico.
+        Publica un evento en el bus: sólo lo reciben los manejadores suscritos
+        a su clase (ver motor.event_bus).
         
         Args:
-            event_type: Tipo de evento a emitir
-            data: Datos asociados al evento (opcional)
-            target_type: Tipo de objeto destinatario (opcional, si es None se envía a todos)
+            event: Evento a publicar (derivado de motor.event_bus.Event)
             
         Returns:
             bool: True si el evento fue emitido, False en caso contrario
         """
         try:
-            # Comprobar si existe un método específico para este evento
-            handler_method = f"on_{event_type}"
-            if hasattr(self, handler_method) and callable(getattr(self, handler_method)):
-                getattr(self, handler_method)(data)
-                
-            # Obtener objetos destinatarios
-            if target_type:
-                objects = self.objects_manager.get_objects_by_type(target_type)
-            else:
-                objects = self.objects_manager.get_objects()
-                
-            # Enviar el evento a cada objeto
-            for obj in objects:
-                if hasattr(obj, 'on_game_event'):
-                    obj.on_game_event(event_type, data)
-                    
+            self.events.publish(event)
             return True
         except Exception as e:
-            print(f"Error al emitir evento {event_type}: {e}")
+            print(f"Error al emitir evento {type(event).__name__}: {e}")
             return False
     
+    def post_event(self, event):
+        """
+        Encola un evento desde otro hilo (p. ej. el de red). Se publica en el
+        hilo principal al empezar la siguiente actualización: los manejadores
+        registran y eliminan objetos y no pueden ejecutarse mientras se dibuja.
+        
+        Args:
+            event: Evento a publicar (derivado de motor.event_bus.Event)
+        """
+        self.events.post(event)
+    
+    def dispatch_posted_events(self):
+        """Publica los eventos encolados con post_event desde otros hilos."""
+        for event in self.events.take_posted():
+            self.emit_event(event)
+    
     def quit(self):
         """Sale del juego."""
         self.running = False
@@ -360,6 +491,34 @@ class GameEngine:
         """
         return self.objects_manager.get_objects_by_type(obj_type)
 
+    def get_pool(self, name, factory, max_size=64):
+        """
+        Obtiene (o crea) un pool de objetos reutilizables.
+        Los objetos del pool vuelven a él al desregistrarse del motor.
+        
+        Args:
+            name: Nombre del pool
+            factory: Clase que construye los objetos (debe implementar reset())
+            max_size: Número máximo de objetos libres que se conservan
+            
+        Returns:
+            ObjectPool: Pool solicitado
+        """
+        pool = self.object_pools.get(name)
+        if pool is None:
+            pool = ObjectPool(factory, max_size, name)
+            self.object_pools[name] = pool
+        return pool
+    
+    def get_pool_stats(self):
+        """
+        Obtiene las estadísticas de todos los pools.
+        
+        Returns:
+            dict: Estadísticas de cada pool por nombre
+        """
+        return {name: pool.get_stats() for name, pool in self.object_pools.items()}
+
     def create_game_object(self, game_object_class, *args, **kwargs):
         """
         Crea y registra un objeto del juego.
@@ -375,7 +534,7 @@ class GameEngine:
         self.objects_manager.register_object(obj)
         return obj
 
-    def draw_text(self, surface, text, position, color=(255, 255, 255), font_size=16):
+    def draw_text(self, surface, text, position, color=(255, 255, 255), font_size=16, dynamic=False):
         """
         Dibuja texto en la superficie.
         
@@ -385,17 +544,16 @@ class GameEngine:
             position: Posición (x, y) donde dibujar
             color: Color del texto (r, g, b)
             font_size: Tamaño de la fuente
+            dynamic: Si el texto cambia casi cada frame; se renderiza sin
+                     guardarlo en la caché de textos
+        
+        Returns:
+            Rect: Rectángulo ocupado por el texto
         """
-        font = pygame.font.SysFont(None, font_size)
-        text_surface = font.render(str(text), True, color)
-        surface.blit(text_surface, position)
+        if dynamic:
+            return self.text_service.draw_dynamic(surface, text, position, color, font_size)
+        return self.text_service.draw(surface, text, position, color, font_size)
     
     def clean_destroyed_objects(self):
         """Elimina objetos que han sido marcados para destrucción."""
-        # Obtener todos los objetos
-        all_objects = self.objects_manager.get_objects()
-        
-        # Filtrar objetos que deben ser destruidos
-        for obj in all_objects[:]:  # Usar una copia para iterar
-            if hasattr(obj, 'should_destroy') and obj.should_destroy:
-                self.unregister_object(obj) 
\ No newline at end of file
+        self.objects_manager.remove_destroyed_objects() 
\ No newline at end of file
@@ -0,0 +1,140 @@
+"""
+Caché en disco de imágenes ya procesadas.
+
+Guarda los píxeles de una imagen tras decodificarla y escalarla como un
+volcado RGBA sin comprimir (pygame.image.tobytes). En los siguientes arranques
+el volcado se lee con un mapeo de memoria y se reconstruye con
+pygame.image.frombuffer, sin decodificar el PNG ni volver a escalarlo.
+
+La clave de cada entrada es el hash del archivo original junto con los
+parámetros de procesado, así que modificar la imagen invalida su entrada.
+"""
+import hashlib
+import mmap
+import os
+import struct
+
+import pygame
+
+# Cabecera del volcado: firma, ancho y alto
+_MAGIC = b"PGRAW1"
+_HEADER = struct.Struct("<6sII")
+_FORMAT = "RGBA"
+
+
+class ImageCache:
+    """
+    Caché de superficies procesadas en un directorio del disco.
+    """
+
+    def __init__(self, directory):
+        """
+        Inicializa la caché.
+
+        Args:
+            directory: Directorio donde se guardan los volcados (se crea si no existe)
+        """
+        self.directory = directory
+
+        # Estadísticas
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def make_key(self, source_path, *params):
+        """
+        Calcula la clave de una imagen procesada.
+
+        Args:
+            source_path: Ruta absoluta del archivo original
+            *params: Parámetros de procesado (escala, conversión...)
+
+        Returns:
+            str: Clave hexadecimal, o None si no se puede leer el original
+        """
+        digest = hashlib.sha1()
+        try:
+            with open(source_path, 'rb') as source:
+                digest.update(source.read())
+        except OSError:
+            return None
+        digest.update(repr(params).encode())
+        return digest.hexdigest()
+
+    def load(self, key, convert_alpha=True):
+        """
+        Carga una imagen de la caché.
+
+        Args:
+            key: Clave obtenida con make_key()
+            convert_alpha: Si se debe usar convert_alpha() en lugar de convert()
+
+        Returns:
+            Surface: Imagen convertida al formato de la pantalla, o None si no está
+        """
+        path = self._get_path(key)
+        try:
+            with open(path, 'rb') as raw_file, \
+                    mmap.mmap(raw_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                magic, width, height = _HEADER.unpack_from(data)
+                if magic != _MAGIC or len(data) != _HEADER.size + width * height * 4:
+                    raise ValueError("volcado corrupto")
+
+                pixels = memoryview(data)[_HEADER.size:]
+                try:
+                    # La superficie comparte la memoria mapeada; la conversión
+                    # la copia antes de cerrar el mapeo
+                    raw = pygame.image.frombuffer(pixels, (width, height), _FORMAT)
+                    image = raw.convert_alpha() if convert_alpha else raw.convert()
+                    del raw
+                finally:
+                    pixels.release()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, struct.error, pygame.error) as e:
+            print(f"Error al leer la caché de imágenes {path}: {e}")
+            self.errors += 1
+            return None
+
+        self.hits += 1
+        return image
+
+    def store(self, key, image):
+        """
+        Guarda una imagen procesada en la caché.
+
+        Args:
+            key: Clave obtenida con make_key()
+            image: Imagen ya convertida y escalada
+        """
+        path = self._get_path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            width, height = image.get_size()
+            with open(temp_path, 'wb') as raw_file:
+                raw_file.write(_HEADER.pack(_MAGIC, width, height))
+                raw_file.write(pygame.image.tobytes(image, _FORMAT))
+            # Renombrado atómico: otro proceso nunca lee un volcado a medias
+            os.replace(temp_path, path)
+        except (OSError, pygame.error) as e:
+            print(f"Error al escribir la caché de imágenes {path}: {e}")
+            self.errors += 1
+
+    def get_stats(self):
+        """
+        Obtiene las estadísticas de la caché.
+
+        Returns:
+            dict: Aciertos, fallos y errores de lectura/escritura
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors
+        }
+
+    def _get_path(self, key):
+        """Ruta del volcado de una clave."""
+        return os.path.join(self.directory, f"{key}.raw")
@@ -0,0 +1,99 @@
+"""
+Pools de objetos del motor del juego.
+
+Permite reutilizar objetos que se crean y destruyen con mucha frecuencia
+(misiles, meteoritos) en lugar de construirlos de nuevo cada vez.
+"""
+
+
+class ObjectPool:
+    """
+    Pool de objetos reutilizables.
+
+    Los objetos del pool deben implementar reset() con los mismos argumentos
+    que su constructor, dejando el objeto como recién creado.
+    """
+
+    def __init__(self, factory, max_size=64, name=None):
+        """
+        Inicializa el pool.
+
+        Args:
+            factory: Clase o función que construye un objeto nuevo
+            max_size: Número máximo de objetos libres que se conservan
+            name: Nombre del pool para depuración (opcional)
+        """
+        self.factory = factory
+        self.max_size = max_size
+        self.name = name or getattr(factory, '__name__', 'pool')
+        self.free = []
+
+        # Estadísticas
+        self.hits = 0       # Objetos reutilizados
+        self.misses = 0     # Objetos construidos
+        self.released = 0   # Objetos devueltos al pool
+        self.discarded = 0  # Objetos descartados por pool lleno
+
+    def acquire(self, *args, **kwargs):
+        """
+        Obtiene un objeto del pool, reutilizando uno libre si existe.
+
+        Args:
+            *args, **kwargs: Argumentos del constructor / reset()
+
+        Returns:
+            object: Objeto listo para usarse
+        """
+        try:
+            obj = self.free.pop()
+        except IndexError:
+            obj = None
+
+        if obj is not None:
+            obj.reset(*args, **kwargs)
+            self.hits += 1
+        else:
+            obj = self.factory(*args, **kwargs)
+            self.misses += 1
+
+        obj.pool = self
+        obj.in_pool = False
+        return obj
+
+    def release(self, obj):
+        """
+        Devuelve un objeto al pool.
+
+        Args:
+            obj: Objeto obtenido con acquire()
+
+        Returns:
+            bool: True si el objeto quedó disponible para reutilizarse
+        """
+        # Evitar liberar dos veces el mismo objeto
+        if getattr(obj, 'in_pool', True):
+            return False
+
+        obj.in_pool = True
+        self.released += 1
+        if len(self.free) >= self.max_size:
+            self.discarded += 1
+            return False
+
+        self.free.append(obj)
+        return True
+
+    def get_stats(self):
+        """
+        Obtiene las estadísticas del pool.
+
+        Returns:
+            dict: Aciertos, fallos, liberaciones y objetos libres
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "released": self.released,
+            "discarded": self.discarded,
+            "free": len(self.free)
+        }
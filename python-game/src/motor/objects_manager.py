@@ -1,6 +1,11 @@
 """
 Gestor de objetos del motor del juego.
 """
+from motor.collision_scheduler import CollisionScheduler
+from motor.collision_masks import MaskCache
+from motor.render_queue import RenderQueue
+from motor.culling import cull
+import config
 
 class ObjectsManager:
     """
@@ -18,6 +23,40 @@ class ObjectsManager:
         """
         self.game = game
         self.objects = []
+        
+        # Métodos a los que se despacha en cada frame, resueltos una sola vez al
+        # registrar el objeto (ver _add_dispatch). Son diccionarios objeto -> método
+        # enlazado: conservan el orden de registro y quitar un objeto cuesta O(1)
+        self.updatables = {}         # obj.update
+        self.drawables = {}          # obj.queue_draw
+        self.scaled_drawables = {}   # obj.queue_draw_scaled
+        self.texture_drawables = {}  # capa -> {obj: obj.draw_texture, o draw sobre renderer.scene}
+        self.debug_drawables = {}    # obj.draw_debug, o draw_hitbox
+        self.subscriptions = {}      # obj.get_event_handlers() suscritos al bus de eventos
+        self.destroyables = {}       # objetos con should_destroy
+        
+        # Objetos con hitbox registrados en el planificador de colisiones
+        self.colliders = set()
+        
+        # Cola de dibujado por capas (ver draw_objects)
+        self.render_queue = RenderQueue()
+        
+        # Capas de texture_drawables ordenadas de menor a mayor (ver draw_objects_texture)
+        self.texture_layers = []
+        
+        # Contadores del recorte de objetos fuera del nivel (ver cull_objects)
+        self.drawn_count = 0
+        self.culled_count = 0
+        self.despawned_count = 0
+        
+        # Contactos previstos entre objetos con hitbox
+        self.collision_scheduler = CollisionScheduler()
+        
+        # Comprobación pixel perfect opcional tras el solapamiento de hitboxes
+        self.mask_cache = None
+        if config.Config.is_pixel_perfect_collision_enabled():
+            self.mask_cache = MaskCache(config.Config.get_collision_mask_angle_step())
+            self.collision_scheduler.narrowphase = self.mask_cache.overlap
     
     def register_object(self, obj):
         """
@@ -34,11 +73,90 @@ class ObjectsManager:
             if hasattr(obj, 'set_game'):
                 obj.set_game(self.game)
                 
-            # Añadir a la lista principal
+            # Añadir a la lista principal y a las listas de despacho
             self.objects.append(obj)
+            self._add_dispatch(obj)
+            
+            # Registrar en el planificador de colisiones si tiene hitbox
+            if hasattr(obj, 'motion_version'):
+                self.colliders.add(obj)
+                self.collision_scheduler.add(obj)
             return True
         return False
     
+    def _add_dispatch(self, obj):
+        """
+        Comprueba una sola vez qué métodos implementa un objeto y los añade a
+        las listas de despacho que recorren los bucles de cada frame.
+        
+        Args:
+            obj: Objeto registrado
+        """
+        update = getattr(obj, 'update', None)
+        if callable(update):
+            self.updatables[obj] = update
+        
+        if hasattr(obj, 'queue_draw'):
+            self.drawables[obj] = obj.queue_draw
+        if hasattr(obj, 'queue_draw_scaled'):
+            self.scaled_drawables[obj] = obj.queue_draw_scaled
+        
+        # El backend de texturas dibuja directamente: se agrupa por capa al
+        # registrar para respetar el mismo orden que la cola de dibujado
+        draw_texture = getattr(obj, 'draw_texture', None)
+        if draw_texture is None and hasattr(obj, 'draw'):
+            draw = obj.draw
+            draw_texture = lambda renderer: draw(renderer.scene)
+        if draw_texture is not None:
+            layer = getattr(obj, 'render_layer', 0)
+            layer_drawables = self.texture_drawables.get(layer)
+            if layer_drawables is None:
+                layer_drawables = self.texture_drawables[layer] = {}
+                self.texture_layers = sorted(self.texture_drawables)
+            layer_drawables[obj] = draw_texture
+        
+        # Primero el método de depuración mejorado; si no, el antiguo
+        draw_debug = getattr(obj, 'draw_debug', None) or getattr(obj, 'draw_hitbox', None)
+        if callable(draw_debug):
+            self.debug_drawables[obj] = draw_debug
+        
+        # Suscribir los manejadores de eventos del objeto a sus clases de evento
+        get_event_handlers = getattr(obj, 'get_event_handlers', None)
+        handlers = get_event_handlers() if callable(get_event_handlers) else None
+        if handlers:
+            events = self.game.events
+            for event_type, handler in handlers.items():
+                events.subscribe(event_type, handler)
+            self.subscriptions[obj] = handlers
+        
+        if hasattr(obj, 'should_destroy'):
+            self.destroyables[obj] = obj
+    
+    def _remove_dispatch(self, obj):
+        """
+        Quita un objeto de las listas de despacho.
+        
+        Args:
+            obj: Objeto eliminado
+        """
+        self.updatables.pop(obj, None)
+        self.drawables.pop(obj, None)
+        self.scaled_drawables.pop(obj, None)
+        layer_drawables = self.texture_drawables.get(getattr(obj, 'render_layer', 0))
+        if layer_drawables:
+            layer_drawables.pop(obj, None)
+        self.debug_drawables.pop(obj, None)
+        self.destroyables.pop(obj, None)
+        
+        handlers = self.subscriptions.pop(obj, None)
+        if handlers:
+            events = self.game.events
+            for event_type, handler in handlers.items():
+                events.unsubscribe(event_type, handler)
+        
+        # Cancelar los temporizadores pendientes del objeto
+        self.game.timers.cancel_owner(obj)
+    
     def unregister_object(self, obj):
         """
         Elimina un objeto del gestor.
@@ -51,12 +169,35 @@ class ObjectsManager:
         """
         if obj in self.objects:
             self.objects.remove(obj)
+            self._remove_dispatch(obj)
+            if obj in self.colliders:
+                self.colliders.discard(obj)
+                self.collision_scheduler.remove(obj)
+            
+            # Devolver al pool los objetos reutilizables
+            if getattr(obj, 'pool', None):
+                obj.pool.release(obj)
             return True
         return False
     
     def clear_objects(self):
         """Elimina todos los objetos registrados."""
+        for obj in self.objects:
+            self._remove_dispatch(obj)
+            if getattr(obj, 'pool', None):
+                obj.pool.release(obj)
         self.objects.clear()
+        self.colliders.clear()
+        self.collision_scheduler.clear()
+    
+    def on_object_motion_changed(self, obj):
+        """
+        Notifica que un objeto cambió su movimiento o su hitbox.
+        
+        Args:
+            obj: Objeto modificado
+        """
+        self.collision_scheduler.mark_dirty(obj)
     
     def get_objects(self):
         """
@@ -94,20 +235,93 @@ class ObjectsManager:
     def update_objects(self):
         """Actualiza todos los objetos registrados."""
         # Usar una copia para evitar errores si se añaden/eliminan objetos durante la actualización
-        for obj in self.get_objects():
-            if hasattr(obj, 'update') and callable(obj.update):
-                obj.update()
+        for update in list(self.updatables.values()):
+            update()
+    
+    def cull_objects(self):
+        """
+        Marca qué objetos tocan el nivel y elimina los que han salido por uno
+        de sus despawn_edges, en una sola pasada (vectorizada si hay muchos).
+        Los objetos fuera del nivel no se rotan, no se dibujan y no muestran
+        información de depuración hasta que vuelven a entrar.
+        """
+        objects = self.get_objects()
+        width, height = self.game.level_size
+        visible, gone = cull(objects, width, height)
+        
+        drawn = culled = 0
+        for obj, in_view, is_gone in zip(objects, visible, gone):
+            if is_gone:
+                self.game.unregister_object(obj)
+                obj.kill()
+                self.despawned_count += 1
+                continue
+            
+            obj.in_view = in_view
+            if in_view:
+                drawn += 1
+            else:
+                culled += 1
+        
+        self.drawn_count = drawn
+        self.culled_count = culled
+    
+    def get_cull_stats(self):
+        """
+        Obtiene los contadores del recorte.
+        
+        Returns:
+            dict: Objetos dibujados y recortados en el último frame y total eliminados al salir del nivel
+        """
+        return {
+            "drawn": self.drawn_count,
+            "culled": self.culled_count,
+            "despawned": self.despawned_count
+        }
     
     def draw_objects(self, surface):
         """
         Dibuja todos los objetos registrados en la superficie proporcionada.
+        Cada objeto envía su sprite a la cola de dibujado y la cola los
+        dibuja por capas con un blits() por capa.
         
         Args:
             surface: Superficie de pygame donde dibujar
         """
-        for obj in self.objects:
-            if hasattr(obj, 'draw') and callable(obj.draw):
-                obj.draw(surface)
+        queue = self.render_queue
+        for obj, queue_draw in self.drawables.items():
+            if obj.in_view:
+                queue_draw(queue)
+        queue.flush(surface)
+    
+    def draw_objects_scaled(self, surface, scale, resource_manager):
+        """
+        Dibuja todos los objetos directamente a resolución de ventana.
+        
+        Args:
+            surface: Superficie a resolución de ventana
+            scale: Tupla (escala_x, escala_y) del nivel a la ventana
+            resource_manager: Gestor de recursos con los sprites preescalados
+        """
+        queue = self.render_queue
+        for obj, queue_draw_scaled in self.scaled_drawables.items():
+            if obj.in_view:
+                queue_draw_scaled(queue, scale, resource_manager)
+        queue.flush(surface)
+    
+    def draw_objects_texture(self, renderer):
+        """
+        Dibuja todos los objetos con el backend de texturas, capa a capa
+        (las mayores encima) y, dentro de cada capa, en orden de registro.
+        
+        Args:
+            renderer: Backend de texturas (TextureRenderer)
+        """
+        texture_drawables = self.texture_drawables
+        for layer in self.texture_layers:
+            for obj, draw_texture in texture_drawables[layer].items():
+                if obj.in_view:
+                    draw_texture(renderer)
     
     def draw_hitboxes(self, surface):
         """
@@ -116,28 +330,16 @@ class ObjectsManager:
         Args:
             surface: Superficie de pygame donde dibujar
         """
-        for obj in self.objects:
-            # Primero intentamos usar el nuevo método de depuración mejorado
-            if hasattr(obj, 'draw_debug') and callable(obj.draw_debug):
-                obj.draw_debug(surface)
-            # Si no está disponible, recurrimos al método antiguo
-            elif hasattr(obj, 'draw_hitbox') and callable(obj.draw_hitbox):
-                obj.draw_hitbox(surface)
+        for obj, draw_debug in self.debug_drawables.items():
+            if obj.in_view:
+                draw_debug(surface)
     
     def detect_collisions(self):
-        """Detecta colisiones entre objetos que tienen hitbox."""
-        # Obtener objetos con hitbox
-        objects = [obj for obj in self.objects if hasattr(obj, 'has_hitbox') and obj.has_hitbox]
-        
-        # Comprobar colisiones entre cada par de objetos
-        for i, obj1 in enumerate(objects):
-            for obj2 in objects[i+1:]:
-                if obj1.collides_with(obj2):
-                    # Notificar colisión a ambos objetos
-                    if hasattr(obj1, 'on_collide') and callable(obj1.on_collide):
-                        obj1.on_collide(obj2)
-                    if hasattr(obj2, 'on_collide') and callable(obj2.on_collide):
-                        obj2.on_collide(obj1)
+        """
+        Dispara las colisiones previstas cuyo instante ya ha llegado.
+        Los contactos se calculan por tiempo de impacto (ver CollisionScheduler).
+        """
+        self.collision_scheduler.update(self.game.world_time)
     
     def print_debug_info(self):
         """Imprime información de depuración sobre los objetos registrados."""
@@ -164,6 +366,13 @@ class ObjectsManager:
             for obj_type, objs in self.objects_by_type.items():
                 print(f"  - {obj_type}: {len(objs)}")
         
+        # Imprimir estado del planificador de colisiones
+        print("\nPlanificador de colisiones:")
+        for key, value in self.collision_scheduler.get_stats().items():
+            print(f"  - {key}: {value}")
+        if self.mask_cache:
+            print(f"  - máscaras: {self.mask_cache.get_stats()}")
+        
         # Imprimir información de hitboxes
         print("\nEstado de hitboxes:")
         for obj in self.objects:
@@ -177,33 +386,19 @@ class ObjectsManager:
         
         print("==============================\n")
     
-    def emit_event(self, event_type, data=None, target_type=None):
+    def remove_destroyed_objects(self):
         """
-        Emite un evento a todos los objetos registrados o a un tipo específico.
+        Elimina los objetos marcados para destrucción (should_destroy).
         
-        Args:
-            event_type: Tipo de evento a emitir
-            data: Datos asociados al evento (opcional)
-            target_type: Tipo de objeto al que dirigir el evento (opcional)
-            
         Returns:
-            int: Número de objetos que manejaron el evento
+            int: Número de objetos eliminados
         """
-        handled_count = 0
-        
-        # Determinar los objetos a los que enviar el evento
-        if target_type:
-            objects = self.get_objects_by_type(target_type)
-        else:
-            objects = self.objects
-        
-        # Enviar el evento a cada objeto
-        for obj in objects:
-            if hasattr(obj, 'on_game_event') and callable(obj.on_game_event):
-                if obj.on_game_event(event_type, data):
-                    handled_count += 1
-        
-        return handled_count
+        removed = 0
+        for obj in list(self.destroyables):
+            if obj.should_destroy:
+                self.game.unregister_object(obj)
+                removed += 1
+        return removed
     
     def get_nearest_object(self, x, y, obj_type=None, max_distance=None):
         """
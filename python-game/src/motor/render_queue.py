@@ -0,0 +1,70 @@
+"""
+Cola de dibujado por capas.
+
+Los objetos no dibujan directamente: envían (imagen, destino, capa) a la cola
+y, al final, la cola vuelca cada capa con una sola llamada a Surface.blits(),
+de la capa menor a la mayor. El orden de dibujado queda determinado por la
+capa (y, dentro de ella, por el orden de envío) en lugar de por el orden de
+registro de los objetos, y el blit de cada sprite se hace en C.
+"""
+
+
+class RenderQueue:
+    """
+    Entradas de dibujado agrupadas por capa.
+    """
+
+    def __init__(self):
+        """Inicializa la cola vacía."""
+        # capa -> lista de (imagen, destino); las listas se reutilizan entre frames
+        self._layers = {}
+
+        # Estadísticas del último volcado
+        self.submitted = 0
+        self.batches = 0
+
+    def submit(self, image, dest, layer=0):
+        """
+        Añade una imagen a la cola.
+
+        Args:
+            image: Superficie a dibujar
+            dest: Posición (x, y) de la esquina superior izquierda
+            layer: Capa; las capas mayores se dibujan encima
+        """
+        entries = self._layers.get(layer)
+        if entries is None:
+            entries = self._layers[layer] = []
+        entries.append((image, dest))
+
+    def flush(self, surface):
+        """
+        Dibuja todas las entradas, capa a capa, y vacía la cola.
+
+        Args:
+            surface: Superficie donde dibujar
+        """
+        submitted = batches = 0
+        for layer in sorted(self._layers):
+            entries = self._layers[layer]
+            if entries:
+                surface.blits(entries, False)
+                submitted += len(entries)
+                batches += 1
+                entries.clear()
+        self.submitted = submitted
+        self.batches = batches
+
+    def clear(self):
+        """Descarta las entradas pendientes sin dibujarlas."""
+        for entries in self._layers.values():
+            entries.clear()
+
+    def get_stats(self):
+        """
+        Obtiene las estadísticas del último volcado.
+
+        Returns:
+            dict: Entradas dibujadas y llamadas a blits()
+        """
+        return {"submitted": self.submitted, "batches": self.batches}
@@ -0,0 +1,344 @@
+"""
+Backends de renderizado del motor del juego.
+
+GameEngine.render delega en uno de estos backends, elegido con
+frontend.display.renderer en config.json:
+
+- SurfaceRenderer ("surface"): dibujo por software con Surface.blit sobre la
+  ventana de pygame.display (modos "scaled_frame" y "prescaled").
+- TextureRenderer ("texture"): pygame._sdl2.video. Las imágenes se suben una
+  vez como texturas (la hoja del atlas una sola vez para todos sus sprites) y
+  el renderer de SDL las escala y rota en cada dibujado. Funciona también con
+  el renderer por software de SDL en máquinas sin GPU.
+"""
+import weakref
+
+import pygame
+
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture
+except ImportError:  # pygame sin el módulo _sdl2: sólo queda el backend de superficies
+    Window = Renderer = Texture = None
+
+# Modo de mezcla alfa de SDL (SDL_BLENDMODE_BLEND)
+_BLENDMODE_BLEND = 1
+
+
+class SurfaceRenderer:
+    """
+    Backend de dibujo por software sobre la superficie de la ventana.
+    """
+
+    name = "surface"
+
+    def __init__(self, engine):
+        """
+        Inicializa el backend.
+
+        Args:
+            engine: Motor del juego (GameEngine)
+        """
+        self.engine = engine
+        self.surface = None
+
+    def open(self, size, title, flags=0):
+        """
+        Crea la ventana.
+
+        Args:
+            size: Tamaño (ancho, alto) de la ventana
+            title: Título de la ventana
+            flags: Flags de pygame.display.set_mode
+
+        Returns:
+            Surface: Superficie de la ventana
+        """
+        self.surface = pygame.display.set_mode(size, flags)
+        pygame.display.set_caption(title)
+        return self.surface
+
+    def render(self):
+        """Dibuja un frame completo y actualiza la pantalla."""
+        engine = self.engine
+        if engine.uses_prescaled_render():
+            engine.render_prescaled()
+        else:
+            engine.render_scaled_frame()
+
+        # Interfaz a resolución de ventana
+        engine.on_render_ui(self.surface)
+        pygame.display.update()
+
+    def present_surface(self):
+        """Muestra la superficie de la ventana tal cual (pantallas de carga)."""
+        pygame.display.flip()
+
+    def get_stats(self):
+        """
+        Obtiene las estadísticas del backend.
+
+        Returns:
+            dict: Nombre del backend
+        """
+        return {"backend": self.name}
+
+
+class TextureRenderer:
+    """
+    Backend de dibujo con texturas de SDL2.
+
+    La escena se dibuja en coordenadas del nivel: el tamaño lógico del renderer
+    es el del nivel y SDL lo escala a la ventana. La interfaz se dibuja en una
+    superficie a resolución de ventana que se sube como textura en cada frame.
+    """
+
+    name = "texture"
+
+    def __init__(self, engine):
+        """
+        Inicializa el backend.
+
+        Args:
+            engine: Motor del juego (GameEngine)
+        """
+        if Renderer is None:
+            raise RuntimeError("pygame._sdl2.video no está disponible")
+
+        self.engine = engine
+        self.window = None
+        self.renderer = None
+        self.surface = None  # Superficie de la interfaz (resolución de ventana)
+        self.scene = TextureSurface(self, engine.level_size)
+
+        # Texturas por superficie; las superficies temporales liberan la suya al destruirse
+        self._textures = weakref.WeakKeyDictionary()
+        self._overlays = {}
+
+        # Estadísticas
+        self.uploads = 0  # Texturas creadas
+        self.draws = 0    # Dibujados de texturas en el último frame
+
+    def open(self, size, title, flags=0):
+        """
+        Crea la ventana y el renderer de SDL.
+
+        Args:
+            size: Tamaño (ancho, alto) de la ventana
+            title: Título de la ventana
+            flags: Flags de pygame.display.set_mode (sólo se usa FULLSCREEN)
+
+        Returns:
+            Surface: Superficie de la interfaz a resolución de ventana
+        """
+        # El módulo display sigue siendo necesario para convert()/convert_alpha()
+        # y los eventos; su ventana queda oculta porque una ventana con
+        # superficie no admite renderer
+        pygame.display.set_mode(size, pygame.HIDDEN)
+
+        self.window = Window(title, size, fullscreen=bool(flags & pygame.FULLSCREEN))
+        self.renderer = Renderer(self.window)
+        self.renderer.logical_size = self.engine.level_size
+
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        return self.surface
+
+    def render(self):
+        """Dibuja un frame completo y lo presenta."""
+        engine = self.engine
+        renderer = self.renderer
+        self.draws = 0
+
+        renderer.draw_color = (0, 0, 0, 255)
+        renderer.clear()
+
+        engine.on_render_background(self.scene)
+        engine.objects_manager.draw_objects_texture(self)
+        engine.on_render_foreground(self.scene)
+
+        # Las hitboxes de depuración usan pygame.draw: se dibujan en una capa del nivel
+        if engine.debug_mode:
+            debug = self._get_overlay_surface("debug", engine.level_size)
+            debug.fill((0, 0, 0, 0))
+            engine.on_render_debug(debug)
+            self._draw_overlay("debug", debug)
+
+        self.surface.fill((0, 0, 0, 0))
+        engine.on_render_ui(self.surface)
+        self._draw_overlay("ui", self.surface)
+
+        renderer.present()
+
+    def present_surface(self):
+        """Muestra la superficie de la interfaz tal cual (pantallas de carga)."""
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+        self._draw_overlay("ui", self.surface)
+        self.renderer.present()
+
+    def get_texture(self, image):
+        """
+        Obtiene la textura de una imagen, subiéndola sólo la primera vez.
+        Una subsuperficie (por ejemplo un sprite del atlas) usa la textura de
+        su superficie raíz con el rectángulo que ocupa en ella.
+
+        Args:
+            image: Superficie
+
+        Returns:
+            tuple: (textura, rectángulo de origen o None)
+        """
+        root = image.get_abs_parent()
+        srcrect = None
+        if root is not image:
+            srcrect = pygame.Rect(image.get_abs_offset(), image.get_size())
+
+        texture = self._textures.get(root)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, root)
+            self._textures[root] = texture
+            self.uploads += 1
+        return texture, srcrect
+
+    def draw_sprite(self, image, x, y, angle=0):
+        """
+        Dibuja una imagen centrada en una posición del nivel, rotada por SDL.
+
+        Args:
+            image: Imagen sin rotar
+            x: Posición X del centro
+            y: Posición Y del centro
+            angle: Ángulo en grados (antihorario, como pygame.transform.rotate)
+        """
+        texture, srcrect = self.get_texture(image)
+        width, height = image.get_size()
+        dstrect = (round(x) - width // 2, round(y) - height // 2, width, height)
+        # SDL gira en sentido horario
+        texture.draw(srcrect, dstrect, -angle)
+        self.draws += 1
+
+    def blit(self, image, dest, area=None):
+        """
+        Dibuja una imagen con su esquina superior izquierda en una posición del nivel.
+
+        Args:
+            image: Imagen
+            dest: Posición (x, y) o Rect
+            area: Parte de la imagen a dibujar (opcional)
+        """
+        texture, srcrect = self.get_texture(image)
+        if area is not None:
+            area = pygame.Rect(area)
+            if srcrect is not None:
+                area.move_ip(srcrect.topleft)
+            srcrect = area
+        width, height = srcrect.size if srcrect is not None else image.get_size()
+        x, y = dest[0], dest[1]
+        texture.draw(srcrect, (x, y, width, height))
+        self.draws += 1
+
+    def fill_rect(self, rect, color):
+        """
+        Rellena un rectángulo del nivel con un color (con alfa opcional).
+
+        Args:
+            rect: Rectángulo
+            color: Color (r, g, b) o (r, g, b, a)
+        """
+        renderer = self.renderer
+        renderer.draw_blend_mode = _BLENDMODE_BLEND
+        renderer.draw_color = tuple(color) if len(color) == 4 else (*color, 255)
+        renderer.fill_rect(pygame.Rect(rect))
+
+    def get_stats(self):
+        """
+        Obtiene las estadísticas del backend.
+
+        Returns:
+            dict: Nombre del backend, texturas subidas y dibujados del último frame
+        """
+        return {"backend": self.name, "uploads": self.uploads, "draws": self.draws}
+
+    def _get_overlay_surface(self, name, size):
+        """Superficie transparente reutilizable para una capa."""
+        key = f"{name}_surface"
+        surface = self._overlays.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            self._overlays[key] = surface
+        return surface
+
+    def _draw_overlay(self, name, surface):
+        """Sube una capa completa a su textura y la dibuja sobre todo el nivel."""
+        texture = self._overlays.get(name)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, surface)
+            texture.blend_mode = _BLENDMODE_BLEND
+            self._overlays[name] = texture
+        else:
+            texture.update(surface)
+        texture.draw(None, (0, 0) + tuple(self.engine.level_size))
+
+
+class TextureSurface:
+    """
+    Adaptador con la parte de la interfaz de Surface que usan los hooks de
+    dibujo de la escena (on_render_background, on_render_foreground y los
+    draw(surface) de los objetos), redirigida al TextureRenderer.
+    """
+
+    def __init__(self, backend, size):
+        """
+        Inicializa el adaptador.
+
+        Args:
+            backend: TextureRenderer
+            size: Tamaño lógico (ancho, alto)
+        """
+        self.backend = backend
+        self.size = tuple(size)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """Dibuja una imagen (special_flags no se admite y se ignora)."""
+        self.backend.blit(source, dest, area)
+        width, height = source.get_size()
+        return pygame.Rect(dest[0], dest[1], width, height)
+
+    def fill(self, color, rect=None):
+        """Rellena la superficie o un rectángulo con un color."""
+        self.backend.fill_rect(rect if rect is not None else (0, 0) + self.size, color)
+
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+
+def create_renderer(name, engine, title, flags=0):
+    """
+    Crea el backend de renderizado y abre su ventana.
+    Si el backend de texturas no se puede crear se usa el de superficies.
+
+    Args:
+        name: "surface" o "texture"
+        engine: Motor del juego (GameEngine)
+        title: Título de la ventana
+        flags: Flags de pygame.display.set_mode
+
+    Returns:
+        SurfaceRenderer | TextureRenderer: Backend con la ventana abierta
+    """
+    if name == TextureRenderer.name:
+        try:
+            backend = TextureRenderer(engine)
+            backend.open(engine.screen_size, title, flags)
+            return backend
+        except (RuntimeError, pygame.error) as e:
+            print(f"No se pudo crear el renderer de texturas ({e}), se usará el de superficies")
+
+    backend = SurfaceRenderer(engine)
+    backend.open(engine.screen_size, title, flags)
+    return backend
@@ -0,0 +1,204 @@
+"""
+Caché de recursos con presupuesto de memoria.
+
+Cada categoría de recursos (imágenes, sonidos, fuentes) se guarda en una
+ResourceCache con un presupuesto en bytes. Cuando se supera, se descartan las
+entradas usadas hace más tiempo (LRU) salvo las fijadas, que son los recursos
+básicos que el juego espera encontrar siempre. Las entradas descartadas deben
+poder volver a crearse (por ejemplo con ResourceManager.load_image).
+"""
+from collections import OrderedDict
+
+import pygame
+
+# Coste aproximado de una fuente cargada (la fuente por defecto pesa ~100 KB)
+FONT_BYTES = 100 * 1024
+
+
+def estimate_size(value):
+    """
+    Estima los bytes de memoria que ocupa un recurso.
+
+    Args:
+        value: Superficie, sonido, fuente u otro objeto
+
+    Returns:
+        int: Bytes estimados
+    """
+    if isinstance(value, pygame.Surface):
+        # Una subsuperficie comparte los píxeles de su superficie padre
+        if value.get_parent() is not None:
+            return 0
+        width, height = value.get_size()
+        return width * height * value.get_bytesize()
+
+    if isinstance(value, pygame.font.Font):
+        return FONT_BYTES
+
+    if pygame.mixer.get_init() and isinstance(value, pygame.mixer.Sound):
+        frequency, sample_format, channels = pygame.mixer.get_init()
+        return int(value.get_length() * frequency * channels * abs(sample_format) // 8)
+
+    return 0
+
+
+class ResourceCache:
+    """
+    Diccionario de recursos con presupuesto en bytes y expulsión LRU.
+
+    Admite las operaciones de diccionario que usa el ResourceManager
+    (get, [], in, len, clear) para poder sustituir a un dict normal.
+    """
+
+    def __init__(self, name, budget=None, sizeof=estimate_size):
+        """
+        Inicializa la caché.
+
+        Args:
+            name: Nombre de la categoría para depuración
+            budget: Presupuesto en bytes, o None para no limitarla
+            sizeof: Función que estima los bytes de un recurso
+        """
+        self.name = name
+        self.budget = budget
+        self.sizeof = sizeof
+
+        # clave -> (recurso, bytes); el orden es el de uso (más reciente al final)
+        self._entries = OrderedDict()
+        self._pinned = set()
+        self.bytes = 0
+
+        # Estadísticas
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """
+        Obtiene un recurso y lo marca como usado recientemente.
+
+        Args:
+            key: Clave del recurso
+            default: Valor devuelto si no está en la caché
+
+        Returns:
+            object: El recurso, o default
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value, pinned=False):
+        """
+        Guarda un recurso, expulsando los menos usados si se supera el presupuesto.
+
+        Args:
+            key: Clave del recurso
+            value: Recurso
+            pinned: Si el recurso no debe expulsarse nunca
+        """
+        self.discard(key)
+        size = self.sizeof(value)
+        self._entries[key] = (value, size)
+        self.bytes += size
+        if pinned:
+            self._pinned.add(key)
+        self._evict(keep=key)
+
+    def set_budget(self, budget):
+        """
+        Cambia el presupuesto y expulsa lo necesario para cumplirlo.
+
+        Args:
+            budget: Presupuesto en bytes, o None para no limitarla
+        """
+        self.budget = budget
+        self._evict()
+
+    def pin(self, key):
+        """
+        Fija un recurso para que no se expulse.
+
+        Args:
+            key: Clave del recurso
+        """
+        if key in self._entries:
+            self._pinned.add(key)
+
+    def unpin(self, key):
+        """
+        Permite que un recurso fijado vuelva a expulsarse.
+
+        Args:
+            key: Clave del recurso
+        """
+        self._pinned.discard(key)
+        self._evict()
+
+    def discard(self, key):
+        """
+        Elimina un recurso si existe.
+
+        Args:
+            key: Clave del recurso
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+            self._pinned.discard(key)
+
+    def clear(self):
+        """Elimina todos los recursos (también los fijados)."""
+        self._entries.clear()
+        self._pinned.clear()
+        self.bytes = 0
+
+    def get_stats(self):
+        """
+        Obtiene las estadísticas de la caché.
+
+        Returns:
+            dict: Entradas, fijadas, bytes, presupuesto, aciertos, fallos y expulsiones
+        """
+        return {
+            "entries": len(self._entries),
+            "pinned": len(self._pinned),
+            "bytes": self.bytes,
+            "budget": self.budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+    def _evict(self, keep=None):
+        """Expulsa entradas no fijadas, de la menos usada a la más, hasta cumplir el presupuesto."""
+        if self.budget is None or self.bytes <= self.budget:
+            return
+
+        for key in list(self._entries):
+            if self.bytes <= self.budget:
+                break
+            if key in self._pinned or key == keep:
+                continue
+            self.bytes -= self._entries.pop(key)[1]
+            self.evictions += 1
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __getitem__(self, key):
+        value = self.get(key, self)
+        if value is self:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __len__(self):
+        return len(self._entries)
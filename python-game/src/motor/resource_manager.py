@@ -1,6 +1,13 @@
 """Gestor de recursos para cargar y gestionar imágenes, sonidos y otros assets."""
 import pygame
 import os
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from motor.image_cache import ImageCache
+from motor.resource_cache import ResourceCache
+from motor.sprite_atlas import SpriteAtlas
+from motor.surface_format import normalize
 
 class ResourceManager:
     """Clase para gestionar y cachear recursos del juego."""
@@ -13,11 +20,22 @@ class ResourceManager:
             base_path: Ruta base para los recursos (opcional)
             game: Referencia al juego principal (opcional)
         """
-        self.images = {}
-        self.sounds = {}
-        self.fonts = {}
+        # Cachés por categoría con presupuesto de memoria (ver set_cache_budgets)
+        self.images = ResourceCache("images")
+        self.sounds = ResourceCache("sounds")
+        self.fonts = ResourceCache("fonts")
+        # Variantes escaladas de imágenes (derivadas, siempre se pueden recrear)
+        self.scaled_images = ResourceCache("scaled")
         self.game = game
         
+        # Atlas de sprites (se carga la primera vez que se pide una imagen)
+        self.atlas = None
+        self.atlas_path = None
+        self._atlas_loaded = False
+        
+        # Caché en disco de imágenes procesadas (desactivada por defecto)
+        self.image_cache = None
+        
         # Determinar la ruta base
         if base_path:
             self.base_path = base_path
@@ -34,6 +52,79 @@ class ResourceManager:
         """
         self.game = game
     
+    def set_atlas(self, index_path):
+        """
+        Establece el atlas de sprites del que se sirven las imágenes.
+        Las imágenes que no estén en el atlas se siguen cargando desde su archivo.
+        
+        Args:
+            index_path: Ruta relativa del índice JSON del atlas, o None para desactivarlo
+        """
+        self.atlas_path = index_path
+        self.atlas = None
+        self._atlas_loaded = False
+    
+    def set_cache_budgets(self, budgets):
+        """
+        Establece el presupuesto de memoria de cada categoría de recursos.
+        Al superarlo se expulsan los recursos no fijados menos usados.
+        
+        Args:
+            budgets: Diccionario categoría ("images", "scaled", "sounds", "fonts") -> megabytes
+        """
+        categories = {"images": self.images, "scaled": self.scaled_images,
+                      "sounds": self.sounds, "fonts": self.fonts}
+        for category, megabytes in budgets.items():
+            cache = categories.get(category)
+            if cache is not None:
+                cache.set_budget(int(megabytes * 1024 * 1024) if megabytes else None)
+    
+    def get_cache_stats(self):
+        """
+        Obtiene las estadísticas de las cachés de recursos.
+        
+        Returns:
+            dict: Estadísticas por categoría
+        """
+        return {cache.name: cache.get_stats()
+                for cache in (self.images, self.scaled_images, self.sounds, self.fonts)}
+    
+    def set_image_cache(self, cache_dir):
+        """
+        Activa la caché en disco de imágenes ya decodificadas y escaladas.
+        
+        Args:
+            cache_dir: Directorio de la caché relativo a la ruta base, o None para desactivarla
+        """
+        self.image_cache = ImageCache(self.get_path(cache_dir)) if cache_dir else None
+    
+    def get_atlas(self):
+        """
+        Obtiene el atlas de sprites, cargándolo la primera vez.
+        
+        Returns:
+            SpriteAtlas: El atlas, o None si no hay atlas disponible
+        """
+        if self._atlas_loaded or not self.atlas_path:
+            return self.atlas
+        
+        self._atlas_loaded = True
+        index_path = self.get_path(self.atlas_path)
+        if not os.path.exists(index_path):
+            print(f"Atlas de sprites no encontrado en {self.atlas_path}, se usarán las imágenes sueltas")
+            return None
+        
+        try:
+            atlas = SpriteAtlas.load(index_path, self._load_image_file)
+            self.atlas = atlas
+            # La hoja se contabiliza una vez; sus subsuperficies no ocupan memoria propia
+            self.images.put(f"atlas:{self.atlas_path}", atlas.image, pinned=True)
+            width, height = atlas.image.get_size()
+            print(f"Atlas de sprites cargado: {len(atlas.sprites)} sprites en {width}x{height}")
+        except (pygame.error, OSError, ValueError, KeyError) as e:
+            print(f"Error al cargar el atlas de sprites {self.atlas_path}: {e}")
+        return self.atlas
+    
     def get_path(self, relative_path):
         """
         Convierte una ruta relativa en una ruta absoluta.
@@ -46,15 +137,21 @@ class ResourceManager:
         """
         return os.path.join(self.base_path, relative_path)
     
-    def load_image(self, name, path, scale=None, convert_alpha=True):
+    def load_image(self, name, path, scale=None, convert_alpha=True, pinned=False, rle=True):
         """
         Carga una imagen y opcionalmente la escala.
+        Si la imagen está en el atlas de sprites se usa su subsuperficie en
+        lugar de leer el archivo. La imagen se normaliza al formato de la
+        pantalla (ver motor.surface_format.normalize).
         
         Args:
             name: Nombre para referenciar la imagen
             path: Ruta relativa de la imagen
             scale: Factor de escala o tamaño (opcional)
             convert_alpha: Si se debe usar convert_alpha() para transparencia
+            pinned: Si la imagen no debe expulsarse de la caché por el presupuesto
+            rle: Si se usa RLEACCEL; no conviene en imágenes que se rotan en
+                 cada frame (cada rotación decodifica y recodifica el RLE)
         
         Returns:
             Surface: La imagen cargada
@@ -62,30 +159,21 @@ class ResourceManager:
         full_path = self.get_path(path)
         
         try:
-            image = pygame.image.load(full_path)
+            atlas = self.get_atlas()
+            image = atlas.get(path) if atlas else None
             
-            # Aplicar convert_alpha para imágenes con transparencia
-            if convert_alpha:
-                image = image.convert_alpha()
+            if image is None:
+                image = self._load_image_file(full_path, scale, convert_alpha)
             else:
-                image = image.convert()
-            
-            # Escalar si es necesario
-            if scale:
-                if isinstance(scale, tuple):
-                    # Si scale es una tupla, usarla como tamaño
-                    scaled_size = scale
-                else:
-                    # Si scale es un número, usarlo como factor
-                    image_scale = scale / image.get_rect().width
-                    new_width = image.get_rect().width * image_scale
-                    new_height = image.get_rect().height * image_scale
-                    scaled_size = (new_width, new_height)
-                
-                image = pygame.transform.scale(image, scaled_size)
+                if not convert_alpha:
+                    # La hoja del atlas ya está convertida con alfa
+                    image = image.convert()
+                if scale:
+                    image = self._scale_image(image, scale)
+            image = normalize(image, rle)
             
             # Almacenar en caché
-            self.images[name] = image
+            self.images.put(name, image, pinned)
             return image
             
         except pygame.error as e:
@@ -96,6 +184,187 @@ class ResourceManager:
             self.images[name] = error_surf
             return error_surf
     
+    def _load_image_file(self, full_path, scale=None, convert_alpha=True):
+        """
+        Decodifica, convierte y escala una imagen, o la toma de la caché en disco.
+        
+        Args:
+            full_path: Ruta absoluta de la imagen
+            scale: Factor de escala o tamaño (opcional)
+            convert_alpha: Si se debe usar convert_alpha() para transparencia
+        
+        Returns:
+            Surface: La imagen procesada
+        """
+        image, cache_key = self._load_cached_image(full_path, scale, convert_alpha)
+        if image is None:
+            image = self._process_image(pygame.image.load(full_path), scale, convert_alpha, cache_key)
+        return image
+    
+    def _load_cached_image(self, full_path, scale, convert_alpha):
+        """
+        Busca una imagen procesada en la caché en disco.
+        
+        Returns:
+            tuple: (imagen o None, clave de la caché o None)
+        """
+        if not self.image_cache:
+            return None, None
+        
+        cache_key = self.image_cache.make_key(full_path, scale, convert_alpha)
+        if not cache_key:
+            return None, None
+        return self.image_cache.load(cache_key, convert_alpha), cache_key
+    
+    def _process_image(self, image, scale, convert_alpha, cache_key=None):
+        """
+        Convierte y escala una imagen recién decodificada y la guarda en la caché.
+        Debe llamarse desde el hilo principal (convert necesita el display).
+        
+        Returns:
+            Surface: La imagen procesada
+        """
+        # Aplicar convert_alpha para imágenes con transparencia
+        if convert_alpha:
+            image = image.convert_alpha()
+        else:
+            image = image.convert()
+        
+        if scale:
+            image = self._scale_image(image, scale)
+        
+        if cache_key:
+            self.image_cache.store(cache_key, image)
+        return image
+    
+    def preload(self, manifest_path, progress_callback=None, max_workers=4):
+        """
+        Carga por adelantado las imágenes de un manifiesto.
+        
+        Las imágenes que no están en el atlas ni en la caché en disco se
+        decodifican en un pool de hilos; la conversión y el escalado se hacen
+        en el hilo principal a medida que terminan.
+        
+        Args:
+            manifest_path: Ruta relativa del manifiesto JSON
+            progress_callback: Función (cargadas, total, nombre) llamada tras cada imagen (opcional)
+            max_workers: Número de hilos de decodificación
+        
+        Returns:
+            int: Número de imágenes cargadas
+        """
+        try:
+            with open(self.get_path(manifest_path), 'r') as manifest_file:
+                entries = json.load(manifest_file).get("images", [])
+        except (OSError, ValueError) as e:
+            print(f"Error al leer el manifiesto de recursos {manifest_path}: {e}")
+            return 0
+        
+        pending = []
+        for entry in entries:
+            if entry["name"] in self.images:
+                continue
+            scale = entry.get("scale")
+            if isinstance(scale, list):
+                scale = tuple(scale)
+            pending.append((entry["name"], entry["path"], scale, entry.get("convert_alpha", True),
+                            entry.get("pinned", False), entry.get("rle", True)))
+        
+        total = len(pending)
+        loaded = 0
+        atlas = self.get_atlas()
+        to_decode = []
+        
+        # Lo que ya está en el atlas o en la caché en disco no necesita decodificarse
+        for name, path, scale, convert_alpha, pinned, rle in pending:
+            if atlas and atlas.has(path):
+                self.load_image(name, path, scale, convert_alpha, pinned, rle)
+            else:
+                image, cache_key = self._load_cached_image(self.get_path(path), scale, convert_alpha)
+                if image is None:
+                    to_decode.append((name, path, scale, convert_alpha, pinned, rle, cache_key))
+                    continue
+                self.images.put(name, normalize(image, rle), pinned)
+            loaded += 1
+            if progress_callback:
+                progress_callback(loaded, total, name)
+        
+        if to_decode:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="preload") as executor:
+                futures = {executor.submit(pygame.image.load, self.get_path(item[1])): item
+                           for item in to_decode}
+                for future in as_completed(futures):
+                    name, path, scale, convert_alpha, pinned, rle, cache_key = futures[future]
+                    try:
+                        image = self._process_image(future.result(), scale, convert_alpha, cache_key)
+                        self.images.put(name, normalize(image, rle), pinned)
+                    except (pygame.error, OSError) as e:
+                        # Se volverá a intentar (con imagen de error) al pedirla con load_image
+                        print(f"Error al precargar la imagen {path}: {e}")
+                        continue
+                    loaded += 1
+                    if progress_callback:
+                        progress_callback(loaded, total, name)
+        
+        print(f"Precargadas {loaded}/{total} imágenes de {manifest_path}")
+        return loaded
+    
+    @staticmethod
+    def _scale_image(image, scale):
+        """
+        Escala una imagen.
+        
+        Args:
+            image: Imagen a escalar
+            scale: Ancho deseado (manteniendo la proporción) o tamaño (ancho, alto)
+        
+        Returns:
+            Surface: La imagen escalada
+        """
+        if isinstance(scale, tuple):
+            # Si scale es una tupla, usarla como tamaño
+            scaled_size = scale
+        else:
+            # Si scale es un número, usarlo como factor
+            image_scale = scale / image.get_rect().width
+            new_width = image.get_rect().width * image_scale
+            new_height = image.get_rect().height * image_scale
+            scaled_size = (new_width, new_height)
+        
+        return pygame.transform.scale(image, scaled_size)
+    
+    def get_scaled_image(self, image, scale, angle=0):
+        """
+        Obtiene una imagen escalada (y opcionalmente rotada), calculándola sólo
+        la primera vez para cada combinación y normalizada al formato de la pantalla.
+        
+        Args:
+            image: Nombre de una imagen cargada o la propia superficie
+            scale: Tupla (escala_x, escala_y)
+            angle: Ángulo de rotación en grados; conviene cuantizarlo para que
+                   la caché se reutilice entre frames
+        
+        Returns:
+            Surface: La imagen escalada, o None si el nombre no existe
+        """
+        if isinstance(image, str):
+            image = self.get_image(image)
+            if image is None:
+                return None
+        
+        key = (image, scale, angle)
+        scaled = self.scaled_images.get(key)
+        if scaled is None:
+            if angle:
+                scaled = pygame.transform.rotate(self.get_scaled_image(image, scale), angle)
+            else:
+                width, height = image.get_size()
+                size = (max(1, round(width * scale[0])), max(1, round(height * scale[1])))
+                scaled = pygame.transform.scale(image, size)
+            scaled = normalize(scaled)
+            self.scaled_images.put(key, scaled)
+        return scaled
+    
     def get_image(self, name):
         """
         Obtiene una imagen previamente cargada.
@@ -195,4 +464,7 @@ class ResourceManager:
         """Libera todos los recursos cargados."""
         self.images.clear()
         self.sounds.clear()
-        self.fonts.clear() 
\ No newline at end of file
+        self.fonts.clear()
+        self.scaled_images.clear()
+        self.atlas = None
+        self._atlas_loaded = False 
\ No newline at end of file
@@ -3,25 +3,100 @@ import pygame
 import math
 import sys
 import os
+from typing import NamedTuple
 
 # Añadir el directorio src al path para poder importar
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Importar la utilidad de delta time
 from space_shooter.utils.delta_time import DeltaTime
+from motor.text_service import TextService
+from motor.surface_cache import SurfaceCache
+from motor.surface_format import accelerate
+
+class HitboxSpec(NamedTuple):
+    """
+    Especificación inmutable de una hitbox.
+    Se calcula una vez por tipo de entidad y se comparte entre sus instancias.
+    
+    shape puede ser "box" (caja alineada a los ejes) o "circle". En un círculo
+    width y height son el diámetro: la caja envolvente que usa el planificador
+    de colisiones antes de la prueba de forma.
+    """
+    width: int
+    height: int
+    offset_x: float = 0
+    offset_y: float = 0
+    shape: str = "box"
+    radius: float = 0
+
+    @classmethod
+    def from_data(cls, data):
+        """
+        Construye la especificación a partir de un diccionario de configuración.
+        
+        Args:
+            data: Diccionario con width/height (o hitbox_width/hitbox_height),
+                  offset_x/offset_y opcionales y collider/radius para los
+                  círculos, o un HitboxSpec ya construido
+                  
+        Returns:
+            HitboxSpec: Especificación de la hitbox
+        """
+        if isinstance(data, cls):
+            return data
+        
+        width = data.get("width", data.get("hitbox_width", 10))
+        height = data.get("height", data.get("hitbox_height", 10))
+        offset_x = data.get("offset_x", 0)
+        offset_y = data.get("offset_y", 0)
+        
+        if data.get("collider") == "circle":
+            radius = data.get("radius", min(width, height) / 2.0)
+            diameter = int(math.ceil(radius * 2))
+            return cls(diameter, diameter, offset_x, offset_y, "circle", radius)
+        return cls(width, height, offset_x, offset_y)
+
 
 class GameObject(pygame.sprite.Sprite):
     """Clase base para todos los objetos del juego con hitbox personalizada."""
     
-    # Fuente para el modo debug
-    debug_font = None
+    # Atributos del núcleo en slots: acceso más rápido que el __dict__ de la
+    # instancia (que sigue existiendo por pygame.sprite.Sprite y las subclases)
+    __slots__ = (
+        "x", "y", "speed_x", "speed_y", "type", "game", "is_visible",
+        "angle", "rotation_speed", "trajectory_time", "trajectory_origin",
+        "trajectory_angle", "motion_version", "has_hitbox", "hitbox",
+        "hitbox_spec", "image", "original_image", "image_center_x", "image_center_y",
+        "in_view", "rotated_angle", "previous_x", "previous_y"
+    )
     
     # Constantes para el modo debug
+    DEBUG_FONT = "Arial"                   # Fuente del texto de depuración (ver TextService.get_font)
+    DEBUG_FONT_SIZE = 14
     DEBUG_HITBOX_COLOR = (255, 0, 0)       # Rojo para contorno del hitbox
     DEBUG_CENTER_COLOR = (255, 255, 0)     # Amarillo para centro del hitbox
     DEBUG_SPRITE_CENTER_COLOR = (0, 0, 0)  # Negro para centro del sprite
     DEBUG_CENTER_SIZE = 4                  # Tamaño de los puntos centrales
     
+    # Paso en grados de las rotaciones preescaladas que se cachean (modo "prescaled")
+    SCALED_ANGLE_STEP = 5
+    
+    # Paso en grados con el que se rota la imagen a escala 1:1: la imagen sólo
+    # se vuelve a rotar cuando el ángulo cambia de múltiplo (ver resolve_image)
+    ROTATION_ANGLE_STEP = 2
+    
+    # Capa de dibujo en la RenderQueue: las capas mayores se dibujan encima
+    render_layer = 0
+    
+    # Bordes del nivel por los que el objeto desaparece al salir (máscara de
+    # motor.culling.EDGE_*; 0 = nunca se elimina por salir del nivel)
+    despawn_edges = 0
+    
+    # Tipos de objeto con los que este objeto quiere colisionar (None = todos).
+    # Un par se evalúa si cualquiera de los dos incluye el tipo del otro.
+    collision_targets = None
+    
     def __init__(self, x, y, image=None, obj_type=None):
         """
         Inicializa un objeto del juego.
@@ -50,40 +125,84 @@ class GameObject(pygame.sprite.Sprite):
         # Estado de visibilidad
         self.is_visible = True
         
+        # Si el sprite toca el nivel (lo actualiza ObjectsManager.cull_objects)
+        self.in_view = True
+        
         # Ángulo de rotación y velocidad de rotación
         self.angle = 0
         self.rotation_speed = 0
         
+        # Ángulo (múltiplo de ROTATION_ANGLE_STEP) al que está rotada self.image;
+        # la rotación se resuelve al dibujar, no en cada actualización
+        self.rotated_angle = 0
+        
+        # Trayectoria analítica: si trajectory_time no es None, la posición y el
+        # ángulo se evalúan en forma cerrada a partir del estado en ese instante
+        self.trajectory_time = None
+        self.trajectory_origin = (x, y)
+        self.trajectory_angle = 0
+        
+        # Posición al empezar la última actualización: el planificador de
+        # colisiones confirma con ella los contactos cruzados entre frames
+        self.previous_x = x
+        self.previous_y = y
+        
+        # Versión del movimiento: cambia cuando la velocidad, la posición o la
+        # hitbox cambian fuera de la integración normal (invalida colisiones previstas)
+        self.motion_version = 0
+        
         # Control de hitbox
         self.has_hitbox = False  # Por defecto NO hay hitbox hasta que se establezca hitbox_data
         self.hitbox = pygame.Rect(0, 0, 0, 0)  # Hitbox vacío inicialmente
         
-        # Datos de hitbox (REQUERIDO para tener hitbox)
-        self.hitbox_data = None
+        # Especificación de hitbox (REQUERIDA para tener hitbox)
+        self.hitbox_spec = None
         
         # Cargar imagen si se proporciona
         if image:
             self.image = image
             self.original_image = image  # Guardar imagen original para rotaciones
         else:
-            # Crear un rectángulo por defecto si no hay imagen
-            self.image = pygame.Surface((10, 10))
-            self.image.fill((255, 255, 255))
+            # Rectángulo blanco compartido por defecto si no hay imagen
+            self.image = SurfaceCache.get_default().get_filled((10, 10), (255, 255, 255))
             self.original_image = self.image
         
         # Calcular y dibujar el centro de la imagen
         self.image_center_x = int(self.x)
         self.image_center_y = int(self.y)
-
-        # Inicializar fuente para debug si es necesario
-        if GameObject.debug_font is None:
-            try:
-                # Aumentar el tamaño de la fuente a 14 para mejor legibilidad
-                GameObject.debug_font = pygame.font.SysFont("Arial", 14)
-            except:
-                GameObject.debug_font = pygame.font.Font(None, 14)
     
     
+    def reset(self, x, y):
+        """
+        Reinicia el estado común del objeto para reutilizarlo desde un pool.
+        Las clases derivadas amplían este método con su propio estado.
+        
+        Args:
+            x: Nueva posición X
+            y: Nueva posición Y
+        """
+        self.x = x
+        self.y = y
+        self.speed_x = 0
+        self.speed_y = 0
+        self.angle = 0
+        self.rotation_speed = 0
+        self.trajectory_time = None
+        self.trajectory_origin = (x, y)
+        self.trajectory_angle = 0
+        self.previous_x = x
+        self.previous_y = y
+        self.is_visible = True
+        self.in_view = True
+        self.image = self.original_image
+        self.rotated_angle = 0
+        self.image_center_x = int(x)
+        self.image_center_y = int(y)
+        
+        # Invalidar cualquier colisión prevista con el estado anterior
+        self.motion_version += 1
+        self.update_hitbox()
+    
     def set_game(self, game):
         """
         Establece la referencia al juego principal.
@@ -119,8 +238,10 @@ class GameObject(pygame.sprite.Sprite):
             angle: Ángulo inicial en grados
             speed: Velocidad de rotación en grados por frame
         """
+        self.rebase_trajectory()
         self.angle = angle
         self.rotation_speed = speed
+        self.trajectory_angle = angle
     
     def set_velocity(self, speed_x, speed_y):
         """
@@ -130,8 +251,79 @@ class GameObject(pygame.sprite.Sprite):
             speed_x: Velocidad en el eje X (pixels por segundo)
             speed_y: Velocidad en el eje Y (pixels por segundo)
         """
+        if speed_x == self.speed_x and speed_y == self.speed_y:
+            return
+        self.rebase_trajectory()
         self.speed_x = speed_x
         self.speed_y = speed_y
+        self.notify_motion_changed()
+    
+    def notify_motion_changed(self):
+        """
+        Indica que el movimiento del objeto ya no sigue la predicción anterior
+        (cambio de velocidad, teletransporte o cambio de hitbox), para que el
+        planificador de colisiones recalcule sus contactos.
+        """
+        self.motion_version += 1
+        if self.game and hasattr(self.game, 'objects_manager'):
+            self.game.objects_manager.on_object_motion_changed(self)
+    
+    def set_trajectory(self, start_time):
+        """
+        Activa el movimiento analítico a partir del estado actual.
+        
+        La posición y el ángulo actuales se toman como los del instante
+        start_time, y en cada actualización se evalúan como
+        origen + velocidad * (tiempo_del_mundo - start_time).
+        Así dos clientes con la misma línea temporal calculan la misma posición
+        sin acumular error de integración.
+        
+        Args:
+            start_time: Instante inicial en segundos (ver GameEngine.get_world_time)
+        """
+        self.trajectory_time = start_time
+        self.trajectory_origin = (self.x, self.y)
+        self.trajectory_angle = self.angle
+    
+    def clear_trajectory(self):
+        """Vuelve a la integración por frame con DeltaTime."""
+        self.trajectory_time = None
+    
+    def rebase_trajectory(self):
+        """
+        Fija como nuevo origen de la trayectoria el estado en el tiempo actual.
+        Se llama antes de cambiar la velocidad o la rotación para que el objeto
+        no salte a la posición que tendría con la nueva velocidad desde el inicio.
+        """
+        if self.trajectory_time is None or not self.game:
+            return
+        now = self.game.world_time
+        self._apply_trajectory(now)
+        self.trajectory_time = now
+        self.trajectory_origin = (self.x, self.y)
+        self.trajectory_angle = self.angle
+    
+    def _apply_trajectory(self, now):
+        """
+        Evalúa la trayectoria analítica en el instante indicado.
+        
+        Args:
+            now: Tiempo del mundo en segundos
+            
+        Returns:
+            bool: True si el ángulo cambió
+        """
+        # Un evento que llega con el reloj ligeramente adelantado no debe
+        # colocar el objeto antes de su origen
+        elapsed = max(0.0, now - self.trajectory_time)
+        origin_x, origin_y = self.trajectory_origin
+        self.x = origin_x + self.speed_x * elapsed
+        self.y = origin_y + self.speed_y * elapsed
+        
+        if self.rotation_speed != 0:
+            self.angle = (self.trajectory_angle + self.rotation_speed * elapsed) % 360
+            return True
+        return False
     
     def get_velocity(self):
         """
@@ -148,8 +340,7 @@ class GameObject(pygame.sprite.Sprite):
         Este método DEBE ser llamado para tener un hitbox válido.
         
         Args:
-            data: Diccionario con datos de configuración de la hitbox
-                Debe contener:
+            data: HitboxSpec precalculado del tipo de entidad, o diccionario con:
                 - width/height: Dimensiones exactas de la hitbox
                 Opcional:
                 - offset_x/offset_y: Desplazamiento desde el centro
@@ -158,36 +349,29 @@ class GameObject(pygame.sprite.Sprite):
             self.disable_hitbox()
             return
             
-        # Guardar los datos
-        self.hitbox_data = {
-            "width": data.get("width", data.get("hitbox_width", 10)),
-            "height": data.get("height", data.get("hitbox_height", 10)),
-            "offset_x": data.get("offset_x", 0),
-            "offset_y": data.get("offset_y", 0)
-        }
+        # Guardar la especificación (compartida por todas las instancias del tipo)
+        spec = HitboxSpec.from_data(data)
+        self.hitbox_spec = spec
         
         # Activar hitbox y aplicar configuración
         self.has_hitbox = True
+        self.hitbox = pygame.Rect(0, 0, spec.width, spec.height)
         self.update_hitbox()
+        self.notify_motion_changed()
     
     def update_hitbox(self):
         """
         Actualiza el hitbox según la configuración.
         Esta función se llama automáticamente cuando cambia la posición.
+        El rectángulo se modifica en el sitio, sin crear uno nuevo por frame.
         """
-        if not self.has_hitbox or not self.hitbox_data:
+        if not self.has_hitbox:
             return
 
-        # Obtener dimensiones y offsets del hitbox_data
-        width = self.hitbox_data.get("width", 10)
-        height = self.hitbox_data.get("height", 10)
-        offset_x = self.hitbox_data.get("offset_x", 0)
-        offset_y = self.hitbox_data.get("offset_y", 0)
-
-        # Crear hitbox centrado en la posición del objeto
-        self.hitbox = pygame.Rect(0, 0, width, height)
-        self.hitbox.centerx = self.x
-        self.hitbox.centery = self.y
+        # Centrar el hitbox en la posición del objeto
+        hitbox = self.hitbox
+        hitbox.centerx = self.x
+        hitbox.centery = self.y
     
     def create_custom_hitbox(self, data):
         """
@@ -199,13 +383,16 @@ class GameObject(pygame.sprite.Sprite):
         """Desactiva la hitbox del objeto."""
         self.has_hitbox = False
         self.hitbox = pygame.Rect(0, 0, 0, 0)
-        self.hitbox_data = None
+        self.hitbox_spec = None
+        self.notify_motion_changed()
     
     def enable_hitbox(self):
         """Activa la hitbox del objeto si hay datos de hitbox."""
-        if self.hitbox_data:
+        if self.hitbox_spec:
             self.has_hitbox = True
+            self.hitbox = pygame.Rect(0, 0, self.hitbox_spec.width, self.hitbox_spec.height)
             self.update_hitbox()
+            self.notify_motion_changed()
     
     def update(self):
         """
@@ -213,19 +400,24 @@ class GameObject(pygame.sprite.Sprite):
         Sigue el patrón Hollywood: actualiza primero lo común y luego llama al 
         método específico de la clase derivada.
         """
-        # Aplicar velocidad usando delta time para movimiento independiente de FPS
-        delta = DeltaTime.get_delta()
-        if self.speed_x != 0:
-            self.x += self.speed_x * delta
-        if self.speed_y != 0:
-            self.y += self.speed_y * delta
+        self.previous_x = self.x
+        self.previous_y = self.y
         
-        # Actualizar rotación si hay velocidad de rotación
-        if self.rotation_speed != 0:
-            # Aplicar rotación usando delta time
-            self.angle += self.rotation_speed * delta
-            self.angle %= 360
-            self.update_rotation()
+        if self.trajectory_time is not None and self.game:
+            # Movimiento analítico sobre el tiempo del mundo
+            self._apply_trajectory(self.game.world_time)
+        else:
+            # Aplicar velocidad usando delta time para movimiento independiente de FPS
+            delta = DeltaTime.get_delta()
+            if self.speed_x != 0:
+                self.x += self.speed_x * delta
+            if self.speed_y != 0:
+                self.y += self.speed_y * delta
+            
+            # Integrar el ángulo; la imagen rotada se obtiene al dibujar (resolve_image)
+            if self.rotation_speed != 0:
+                self.angle += self.rotation_speed * delta
+                self.angle %= 360
         
         # Actualizar posición de hitbox (EL HITBOX NUNCA ROTA)
         self.update_hitbox()
@@ -241,14 +433,34 @@ class GameObject(pygame.sprite.Sprite):
         """
         pass  # Por defecto no hace nada
     
+    def resolve_image(self):
+        """
+        Obtiene la imagen rotada al ángulo actual, redondeado al múltiplo de
+        ROTATION_ANGLE_STEP más cercano. Sólo se rota la imagen original cuando
+        ese múltiplo cambia: los objetos que no se dibujan (invisibles, en
+        parpadeo o fuera del nivel) no rotan nada.
+        
+        Returns:
+            Surface: Imagen a dibujar a escala 1:1
+        """
+        step = self.ROTATION_ANGLE_STEP
+        angle = int(round(self.angle / step)) * step % 360
+        if angle != self.rotated_angle and self.original_image is not None:
+            self.rotated_angle = angle
+            # El hitbox no rota: mantiene su forma y dimensiones originales
+            if angle:
+                # Con color clave la rotación lo conserva: se blitea con RLE
+                self.image = accelerate(pygame.transform.rotate(self.original_image, angle))
+            else:
+                self.image = self.original_image
+        return self.image
+    
     def update_rotation(self):
         """
-        Actualiza la rotación de la imagen, pero NO DEL HITBOX.
+        Rota ya la imagen al ángulo actual, sin esperar al dibujado.
         El hitbox se mantiene con su forma y dimensiones originales.
         """
-        if self.original_image is not None:
-            # Rotar la imagen
-            self.image = pygame.transform.rotate(self.original_image, self.angle)
+        self.resolve_image()
 
     def set_visibility(self, visible):
         """
@@ -262,7 +474,24 @@ class GameObject(pygame.sprite.Sprite):
     def toggle_visibility(self):
         """Alterna el estado de visibilidad del objeto."""
         self.is_visible = not self.is_visible
-    
+
+    def start_timer(self, delay, callback, interval=None):
+        """
+        Programa una llamada en el tiempo de simulación del juego. El
+        temporizador se cancela solo cuando el objeto se elimina del juego.
+
+        Args:
+            delay: Segundos hasta la llamada
+            callback: Función sin argumentos a llamar
+            interval: Periodo de repetición en segundos (opcional)
+
+        Returns:
+            Timer: Temporizador programado, o None si el objeto no está en un juego
+        """
+        if self.game is None:
+            return None
+        return self.game.timers.schedule(delay, callback, interval, owner=self)
+
     def collides_with(self, other):
         """
         Comprueba si este objeto colisiona con otro usando hitboxes.
@@ -285,21 +514,82 @@ class GameObject(pygame.sprite.Sprite):
         Args:
             surface: Superficie de pygame donde dibujar
         """
-        if self.is_visible and self.image:
-            # Obtener offsets del hitbox_data
-            offset_x = self.hitbox_data.get("offset_x", 0) if self.hitbox_data else 0
-            offset_y = self.hitbox_data.get("offset_y", 0) if self.hitbox_data else 0
-            
-            self.image_center_x = self.x
-            self.image_center_y = self.y
+        image = self.image
+        if self.is_visible and image:
+            if self.angle != self.rotated_angle:
+                image = self.resolve_image()
+            x = self.x
+            y = self.y
+            self.image_center_x = x
+            self.image_center_y = y
 
-            # Calcular la posición de dibujo aplicando offsets negativos
-            # para que el sprite se posicione correctamente en relación al hitbox
-            rect = self.image.get_rect()
-            rect.centerx = self.image_center_x
-            rect.centery = self.image_center_y
+            # Centrar el sprite en la posición del objeto (mismo redondeo que Rect.center)
+            width, height = image.get_size()
+            surface.blit(image, (round(x) - width // 2, round(y) - height // 2))
+    
+    def queue_draw(self, queue):
+        """
+        Envía el sprite a la cola de dibujado en su capa (ver draw).
+        
+        Args:
+            queue: Cola de dibujado (RenderQueue)
+        """
+        image = self.image
+        if self.is_visible and image:
+            if self.angle != self.rotated_angle:
+                image = self.resolve_image()
+            x = self.x
+            y = self.y
+            self.image_center_x = x
+            self.image_center_y = y
             
-            surface.blit(self.image, rect)
+            width, height = image.get_size()
+            queue.submit(image, (round(x) - width // 2, round(y) - height // 2), self.render_layer)
+    
+    def queue_draw_scaled(self, queue, scale, resource_manager):
+        """
+        Envía el sprite a resolución de ventana a la cola de dibujado (modo "prescaled").
+        Usa la imagen original preescalada y, si el objeto está girado, su
+        rotación al múltiplo de SCALED_ANGLE_STEP más cercano; ambas las cachea
+        el ResourceManager.
+        
+        Args:
+            queue: Cola de dibujado (RenderQueue)
+            scale: Tupla (escala_x, escala_y) del nivel a la ventana
+            resource_manager: Gestor de recursos con los sprites preescalados
+        """
+        base = self.original_image if self.original_image is not None else self.image
+        if not self.is_visible or base is None:
+            return
+        
+        step = self.SCALED_ANGLE_STEP
+        angle = int(round(self.angle / step)) * step % 360
+        image = resource_manager.get_scaled_image(base, scale, angle)
+        
+        x = self.x
+        y = self.y
+        self.image_center_x = x
+        self.image_center_y = y
+        
+        width, height = image.get_size()
+        queue.submit(image, (round(x * scale[0]) - width // 2, round(y * scale[1]) - height // 2),
+                     self.render_layer)
+    
+    def draw_texture(self, renderer):
+        """
+        Dibuja el objeto con el backend de texturas.
+        La imagen original se sube una vez como textura y SDL la rota al dibujarla.
+        
+        Args:
+            renderer: Backend de texturas (TextureRenderer)
+        """
+        base = self.original_image if self.original_image is not None else self.image
+        if not self.is_visible or base is None:
+            return
+        
+        self.image_center_x = self.x
+        self.image_center_y = self.y
+        renderer.draw_sprite(base, self.x, self.y, self.angle)
     
     def draw_hitbox(self, surface, color=None):
         """
@@ -324,9 +614,8 @@ class GameObject(pygame.sprite.Sprite):
                 else:
                     color = (255, 255, 0, 128)  # Amarillo para otros objetos
             
-            # Crear una superficie semitransparente
-            hitbox_surface = pygame.Surface((self.hitbox.width, self.hitbox.height), pygame.SRCALPHA)
-            hitbox_surface.fill(color)
+            # Superficie semitransparente compartida por tamaño y color
+            hitbox_surface = SurfaceCache.get_default().get_filled(self.hitbox.size, color)
             
             # Dibujar en la superficie del juego
             surface.blit(hitbox_surface, self.hitbox)
@@ -354,37 +643,34 @@ class GameObject(pygame.sprite.Sprite):
             
             # Mostrar información específica para meteoritos
             if self.type == "meteor" and hasattr(self, 'meteor_type'):
-                if GameObject.debug_font:
-                    # Calcular posición para texto basada en posición del sprite
-                    if self.hitbox_data:
-                        text_x = self.x - self.hitbox_data.get("offset_x", 0)
-                        text_y = self.y - self.hitbox_data.get("offset_y", 0) - 20
-                    else:
-                        text_x = self.x
-                        text_y = self.y - 20
-                    
-                    # Dibujar tipo de meteorito
-                    type_text = GameObject.debug_font.render(self.meteor_type, True, (255, 255, 255))
-                    surface.blit(type_text, (text_x, text_y))
-                    
-                    # Dibujar HP restante si está disponible
-                    if hasattr(self, 'hp'):
-                        hp_text = GameObject.debug_font.render(f"HP: {self.hp}", True, (255, 255, 255))
-                        surface.blit(hp_text, (text_x, text_y + 10))
-    
-    def emit_event(self, event_type, data=None):
-        """
-        Emite un evento al juego si tiene referencia al mismo.
+                # Calcular posición para texto basada en posición del sprite
+                if self.hitbox_spec:
+                    text_x = self.x - self.hitbox_spec.offset_x
+                    text_y = self.y - self.hitbox_spec.offset_y - 20
+                else:
+                    text_x = self.x
+                    text_y = self.y - 20
+                
+                # Tipo de meteorito y HP restante (pocos valores distintos: se cachean)
+                text = TextService.get_default()
+                text.draw(surface, self.meteor_type, (text_x, text_y), (255, 255, 255),
+                          self.DEBUG_FONT_SIZE, self.DEBUG_FONT)
+                if hasattr(self, 'hp'):
+                    text.draw(surface, f"HP: {self.hp}", (text_x, text_y + 10), (255, 255, 255),
+                              self.DEBUG_FONT_SIZE, self.DEBUG_FONT)
+    
+    def emit_event(self, event):
+        """
+        Publica un evento en el bus del juego si tiene referencia al mismo.
         
         Args:
-            event_type: Tipo de evento
-            data: Datos asociados al evento (opcional)
+            event: Evento a publicar (derivado de motor.event_bus.Event)
             
         Returns:
             bool: True si se pudo emitir el evento, False en caso contrario
         """
         if self.game and hasattr(self.game, 'emit_event'):
-            self.game.emit_event(event_type, data)
+            self.game.emit_event(event)
             return True
         return False
     
@@ -403,17 +689,14 @@ class GameObject(pygame.sprite.Sprite):
                 return True
         return False
     
-    def on_game_event(self, event_type, data=None):
+    def get_event_handlers(self):
         """
-        Maneja eventos emitidos por el juego.
-        Este método debe ser sobrescrito por clases derivadas para
-        implementar el manejo específico de eventos.
+        Obtiene los manejadores de eventos del objeto. El ObjectsManager los
+        suscribe al bus de eventos al registrar el objeto y cancela las
+        suscripciones al eliminarlo. Las clases derivadas lo sobrescriben para
+        recibir sólo los eventos que les interesan.
         
-        Args:
-            event_type: Tipo de evento
-            data: Datos asociados al evento (opcional)
-            
         Returns:
-            bool: True si el evento fue manejado, False en caso contrario
+            dict: Clase de evento -> manejador que recibe el evento
         """
-        return False  # Por defecto no maneja ningún evento 
\ No newline at end of file
+        return {}  # Por defecto no maneja ningún evento 
\ No newline at end of file
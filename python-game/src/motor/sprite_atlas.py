@@ -0,0 +1,217 @@
+"""
+Atlas de sprites del motor del juego.
+
+Empaqueta varias imágenes en una sola hoja (PNG) acompañada de un índice JSON
+con el rectángulo de cada imagen. El ResourceManager carga la hoja una vez y
+entrega subsuperficies, de modo que no hay que leer y decodificar un archivo
+por sprite la primera vez que aparece.
+
+Uso (desde python-game/):
+    python src/motor/sprite_atlas.py images/atlas.json images/spaceship.png images/meteors/*.png
+"""
+import json
+import os
+import sys
+
+import pygame
+
+# Píxeles libres entre sprites para que el filtrado al escalar no mezcle vecinos
+DEFAULT_PADDING = 1
+
+
+def normalize_key(path):
+    """
+    Normaliza una ruta relativa para usarla como clave del atlas.
+
+    Args:
+        path: Ruta relativa de la imagen (ej. "images/spaceship.png")
+
+    Returns:
+        str: Ruta con separadores "/" y sin componentes redundantes
+    """
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+def pack(sizes, padding=DEFAULT_PADDING):
+    """
+    Coloca rectángulos en estantes (shelf packing) ordenados por altura.
+
+    Args:
+        sizes: Lista de tamaños (ancho, alto)
+        padding: Separación en píxeles entre rectángulos
+
+    Returns:
+        tuple: (ancho, alto, posiciones) con una posición (x, y) por tamaño
+    """
+    if not sizes:
+        return 0, 0, []
+
+    # Ancho de la hoja: potencia de dos que deja la hoja aproximadamente cuadrada
+    area = sum((w + padding) * (h + padding) for w, h in sizes)
+    widest = max(w for w, _ in sizes) + padding
+    width = 1
+    while width < widest or width * width < area:
+        width *= 2
+
+    positions = [None] * len(sizes)
+    order = sorted(range(len(sizes)), key=lambda i: (sizes[i][1], sizes[i][0]), reverse=True)
+
+    x = y = shelf_height = 0
+    for i in order:
+        w, h = sizes[i]
+        if x + w > width:
+            # Estante lleno: abrir uno nuevo debajo
+            y += shelf_height + padding
+            x = shelf_height = 0
+        positions[i] = (x, y)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+
+    return width, y + shelf_height, positions
+
+
+class SpriteAtlas:
+    """
+    Hoja de sprites con su índice de rectángulos por ruta de imagen.
+    """
+
+    def __init__(self, image, sprites):
+        """
+        Inicializa el atlas.
+
+        Args:
+            image: Superficie con todos los sprites
+            sprites: Diccionario ruta -> (x, y, ancho, alto)
+        """
+        self.image = image
+        self.sprites = sprites
+        self._subsurfaces = {}
+
+    @classmethod
+    def build(cls, base_path, sources, padding=DEFAULT_PADDING):
+        """
+        Construye un atlas a partir de imágenes sueltas.
+
+        Args:
+            base_path: Ruta base de las imágenes
+            sources: Lista de rutas relativas a base_path
+            padding: Separación en píxeles entre sprites
+
+        Returns:
+            SpriteAtlas: Atlas con todas las imágenes
+        """
+        keys = []
+        images = []
+        for source in sources:
+            key = normalize_key(source)
+            if key in keys:
+                continue
+            keys.append(key)
+            images.append(pygame.image.load(os.path.join(base_path, key)))
+
+        width, height, positions = pack([image.get_size() for image in images], padding)
+        sheet = pygame.Surface((max(width, 1), max(height, 1)), pygame.SRCALPHA)
+        sheet.fill((0, 0, 0, 0))
+
+        sprites = {}
+        for key, image, (x, y) in zip(keys, images, positions):
+            # BLEND_RGBA_MAX sobre una hoja transparente copia los píxeles tal
+            # cual, sin oscurecer los bordes semitransparentes
+            sheet.blit(image, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            sprites[key] = (x, y, image.get_width(), image.get_height())
+
+        return cls(sheet, sprites)
+
+    @classmethod
+    def load(cls, index_path, load_image=pygame.image.load):
+        """
+        Carga un atlas desde su índice JSON.
+
+        Args:
+            index_path: Ruta absoluta del índice
+            load_image: Función que carga la hoja a partir de su ruta absoluta
+
+        Returns:
+            SpriteAtlas: Atlas cargado
+        """
+        with open(index_path, 'r') as index_file:
+            index = json.load(index_file)
+
+        image_path = os.path.join(os.path.dirname(index_path), index["image"])
+        sprites = {key: tuple(rect) for key, rect in index["sprites"].items()}
+        return cls(load_image(image_path), sprites)
+
+    def save(self, index_path):
+        """
+        Guarda la hoja como PNG junto al índice JSON.
+
+        Args:
+            index_path: Ruta del índice; la hoja usa el mismo nombre con extensión .png
+        """
+        image_path = os.path.splitext(index_path)[0] + ".png"
+        pygame.image.save(self.image, image_path)
+
+        index = {
+            "image": os.path.basename(image_path),
+            "size": list(self.image.get_size()),
+            "sprites": {key: list(rect) for key, rect in sorted(self.sprites.items())}
+        }
+        with open(index_path, 'w') as index_file:
+            json.dump(index, index_file, indent=2)
+
+    def convert_alpha(self):
+        """Convierte la hoja al formato de la pantalla (requiere display inicializado)."""
+        self.image = self.image.convert_alpha()
+        self._subsurfaces.clear()
+
+    def has(self, path):
+        """
+        Comprueba si una imagen está en el atlas.
+
+        Args:
+            path: Ruta relativa de la imagen
+
+        Returns:
+            bool: True si el atlas contiene la imagen
+        """
+        return normalize_key(path) in self.sprites
+
+    def get(self, path):
+        """
+        Obtiene la subsuperficie de una imagen del atlas.
+
+        Args:
+            path: Ruta relativa de la imagen
+
+        Returns:
+            Surface: Subsuperficie que comparte píxeles con la hoja, o None
+        """
+        key = normalize_key(path)
+        surface = self._subsurfaces.get(key)
+        if surface is None:
+            rect = self.sprites.get(key)
+            if rect is None:
+                return None
+            surface = self.image.subsurface(rect)
+            self._subsurfaces[key] = surface
+        return surface
+
+
+def main(argv):
+    """Construye un atlas desde la línea de comandos."""
+    if len(argv) < 2:
+        print("Uso: sprite_atlas.py <indice.json> <imagen> [<imagen> ...]")
+        return 1
+
+    index_path, sources = argv[0], argv[1:]
+    base_path = os.getcwd()
+    atlas = SpriteAtlas.build(base_path, [os.path.relpath(os.path.abspath(s), base_path) for s in sources])
+    atlas.save(index_path)
+
+    width, height = atlas.image.get_size()
+    print(f"Atlas guardado en {index_path}: {len(atlas.sprites)} sprites en {width}x{height}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,129 @@
+"""
+Caché de superficies generadas por código.
+
+Rectángulos de color, fondos semitransparentes y placas de nombre se crean
+una sola vez por (tipo, tamaño, color, flags), se normalizan al formato de la
+pantalla (ver motor.surface_format) y se comparten entre todos los objetos y
+frames que los usan. Las superficies devueltas son compartidas: no deben
+modificarse.
+"""
+import pygame
+
+from motor.resource_cache import ResourceCache
+from motor.surface_format import normalize
+
+# Presupuesto por defecto de la caché (las superficies generadas son pequeñas)
+DEFAULT_BUDGET = 4 * 1024 * 1024
+
+# Fondo y margen de las placas de nombre
+NAME_PLATE_BACKGROUND = (0, 0, 0, 180)  # Negro semitransparente
+NAME_PLATE_PADDING = 2
+
+
+class SurfaceCache:
+    """
+    Superficies generadas compartidas, con presupuesto de memoria y expulsión LRU.
+    """
+
+    _default = None
+
+    def __init__(self, budget=DEFAULT_BUDGET):
+        """
+        Inicializa la caché.
+
+        Args:
+            budget: Presupuesto en bytes
+        """
+        self.surfaces = ResourceCache("generated", budget)
+
+    @classmethod
+    def get_default(cls):
+        """
+        Obtiene la caché compartida por el motor y el juego.
+
+        Returns:
+            SurfaceCache: Instancia compartida
+        """
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def get(self, kind, size, color, flags=0, build=None):
+        """
+        Obtiene una superficie generada, creándola sólo la primera vez.
+
+        Args:
+            kind: Tipo de superficie (forma parte de la clave)
+            size: Tamaño (ancho, alto)
+            color: Color
+            flags: Flags de pygame.Surface
+            build: Función (size, color, flags) -> Surface que la genera
+
+        Returns:
+            Surface: Superficie compartida (no modificar)
+        """
+        key = (kind, tuple(size), tuple(color), flags)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = normalize(build(tuple(size), color, flags))
+            self.surfaces.put(key, surface)
+        return surface
+
+    def get_filled(self, size, color, flags=None):
+        """
+        Obtiene un rectángulo relleno de un color.
+
+        Args:
+            size: Tamaño (ancho, alto)
+            color: Color (r, g, b) o (r, g, b, a); con alfa la superficie es SRCALPHA
+            flags: Flags de pygame.Surface (por defecto según el color)
+
+        Returns:
+            Surface: Superficie compartida (no modificar)
+        """
+        if flags is None:
+            flags = pygame.SRCALPHA if len(color) == 4 else 0
+        return self.get("fill", size, color, flags, self._build_filled)
+
+    def get_name_plate(self, text, font, color, background=NAME_PLATE_BACKGROUND, padding=NAME_PLATE_PADDING):
+        """
+        Obtiene una placa de nombre: el texto sobre un fondo semitransparente
+        con un margen, compuesta una sola vez por texto, fuente y colores.
+
+        Args:
+            text: Texto de la placa
+            font: Fuente de pygame
+            color: Color del texto
+            background: Color RGBA del fondo
+            padding: Margen en píxeles alrededor del texto
+
+        Returns:
+            Surface: Superficie compartida (no modificar)
+        """
+        key = ("name_plate", text, id(font), tuple(color), tuple(background), padding)
+        plate = self.surfaces.get(key)
+        if plate is None:
+            text_surface = font.render(text, True, color)
+            width, height = text_surface.get_size()
+            plate = pygame.Surface((width + padding * 2, height + padding * 2), pygame.SRCALPHA)
+            plate.fill(background)
+            plate.blit(text_surface, (padding, padding))
+            plate = normalize(plate)
+            self.surfaces.put(key, plate)
+        return plate
+
+    def get_stats(self):
+        """
+        Obtiene las estadísticas de la caché.
+
+        Returns:
+            dict: Estadísticas de ResourceCache.get_stats
+        """
+        return self.surfaces.get_stats()
+
+    @staticmethod
+    def _build_filled(size, color, flags):
+        """Crea un rectángulo relleno de color."""
+        surface = pygame.Surface(size, flags)
+        surface.fill(color)
+        return surface
@@ -0,0 +1,124 @@
+"""
+Normalización del formato de las superficies cacheadas.
+
+Blitear una superficie cuyo formato no coincide con el de la pantalla obliga
+a SDL a convertir cada píxel en cada blit. Las superficies que se cachean se
+convierten una sola vez al formato de la pantalla según su contenido:
+
+- Opacas (sin píxeles transparentes): convert(), sin canal alfa.
+- Bordes duros (cada píxel es totalmente opaco o totalmente transparente):
+  convert() con color clave; con RLEACCEL los píxeles transparentes se
+  saltan sin mirarlos.
+- Bordes suaves (alfa intermedio): convert_alpha(), opcionalmente con RLEACCEL.
+
+RLEACCEL acelera mucho el blit, pero SDL decodifica y vuelve a codificar la
+superficie cada vez que se bloquea (transform.rotate, transform.scale,
+get_at...). Las imágenes que se usan como origen de rotaciones no deben
+llevarlo (ver ResourceManager.load_image).
+"""
+import pygame
+
+# Color clave de las superficies con bordes duros
+COLORKEY = (255, 0, 255)
+
+# Tipos de formato (ver classify)
+FORMAT_OPAQUE = "opaque"
+FORMAT_COLORKEY = "colorkey"
+FORMAT_ALPHA = "alpha"
+
+
+def classify(surface):
+    """
+    Clasifica una superficie según la transparencia de sus píxeles.
+
+    Args:
+        surface: Superficie a clasificar
+
+    Returns:
+        str: FORMAT_OPAQUE, FORMAT_COLORKEY o FORMAT_ALPHA
+    """
+    if surface.get_colorkey() is not None:
+        return FORMAT_COLORKEY
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return FORMAT_OPAQUE
+
+    width, height = surface.get_size()
+    opaque = pygame.mask.from_surface(surface, 254).count()
+    if opaque == width * height:
+        return FORMAT_OPAQUE
+    if opaque == pygame.mask.from_surface(surface, 0).count():
+        return FORMAT_COLORKEY
+    return FORMAT_ALPHA
+
+
+def normalize(surface, rle=True):
+    """
+    Convierte una superficie al formato de la pantalla según su contenido.
+    Sin pantalla (antes de set_mode) se devuelve tal cual.
+
+    Args:
+        surface: Superficie a normalizar (no se modifica)
+        rle: Si se activa RLEACCEL en las superficies con transparencia
+
+    Returns:
+        Surface: Superficie normalizada
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+
+    surface_format = classify(surface)
+    if surface_format == FORMAT_OPAQUE:
+        return surface.convert()
+
+    if surface_format == FORMAT_COLORKEY:
+        keyed = _to_colorkey(surface)
+        if keyed is not None:
+            keyed.set_colorkey(keyed.get_colorkey(), pygame.RLEACCEL if rle else 0)
+            return keyed
+
+    converted = surface.convert_alpha()
+    if rle:
+        converted.set_alpha(255, pygame.RLEACCEL)
+    return converted
+
+
+def accelerate(surface):
+    """
+    Activa RLEACCEL en una superficie con color clave, p. ej. la rotación de
+    una imagen normalizada (transform.rotate conserva el color clave).
+
+    Args:
+        surface: Superficie a acelerar (se modifica)
+
+    Returns:
+        Surface: La misma superficie
+    """
+    colorkey = surface.get_colorkey()
+    if colorkey is not None:
+        surface.set_colorkey(colorkey, pygame.RLEACCEL)
+    return surface
+
+
+def _to_colorkey(surface):
+    """
+    Copia una superficie con bordes duros a una opaca con color clave.
+
+    Returns:
+        Surface: Superficie con color clave, o None si la imagen ya usa ese color
+    """
+    colorkey = surface.get_colorkey()
+    if colorkey is not None:
+        return surface.convert()
+
+    width, height = surface.get_size()
+    keyed = pygame.Surface((width, height)).convert()
+    keyed.fill(COLORKEY)
+    keyed.blit(surface, (0, 0))
+
+    # Si algún píxel opaco coincide con el color clave no se puede usar
+    transparent = width * height - pygame.mask.from_surface(surface, 254).count()
+    if pygame.mask.from_threshold(keyed, COLORKEY, (1, 1, 1, 255)).count() != transparent:
+        return None
+
+    keyed.set_colorkey(COLORKEY)
+    return keyed
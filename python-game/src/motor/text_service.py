@@ -0,0 +1,160 @@
+"""
+Servicio de texto del motor del juego.
+
+Reúne en un solo sitio lo necesario para dibujar texto sin crear fuentes ni
+renderizar cadenas en cada frame:
+
+- Las fuentes se crean una vez por (nombre, tamaño).
+- Las cadenas renderizadas se guardan en una caché LRU por (texto, color,
+  fuente): etiquetas, mensajes y valores que se repiten entre frames
+  (puntuación, HP) se dibujan con un solo blit.
+- Los textos que cambian casi cada frame (FPS, contadores de depuración) se
+  renderizan directamente con la fuente cacheada, sin pasar por la caché LRU
+  para no expulsar de ella los textos que sí se reutilizan.
+
+No se usa un atlas de glifos: pygame.font (SDL_ttf) ya cachea los glifos y
+renderizar una cadena corta cuesta menos que componerla con un blit por
+carácter.
+"""
+import pygame
+
+from motor.resource_cache import ResourceCache
+
+# Presupuesto por defecto de la caché de cadenas renderizadas
+DEFAULT_BUDGET = 2 * 1024 * 1024
+
+
+class TextService:
+    """
+    Fuentes y cadenas renderizadas compartidas.
+    """
+
+    _default = None
+
+    def __init__(self, budget=DEFAULT_BUDGET):
+        """
+        Inicializa el servicio.
+
+        Args:
+            budget: Presupuesto en bytes de la caché de cadenas renderizadas
+        """
+        self._fonts = {}
+        self.surfaces = ResourceCache("text", budget)
+
+        # Estadísticas
+        self.dynamic_draws = 0
+
+    @classmethod
+    def get_default(cls):
+        """
+        Obtiene el servicio compartido por el motor y el juego.
+
+        Returns:
+            TextService: Instancia compartida
+        """
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def get_font(self, name=None, size=16):
+        """
+        Obtiene una fuente, creándola sólo la primera vez.
+
+        Args:
+            name: None para la fuente por defecto de pygame.font.Font(None),
+                  una ruta de archivo (o pygame.font.get_default_font()) o el
+                  nombre de una fuente del sistema
+            size: Tamaño de la fuente
+
+        Returns:
+            Font: La fuente
+        """
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            if name is None or name == pygame.font.get_default_font() or name.endswith((".ttf", ".otf")):
+                font = pygame.font.Font(name, size)
+            else:
+                font = pygame.font.SysFont(name, size)
+            self._fonts[key] = font
+        return font
+
+    def render(self, text, color, size=16, font=None, antialias=True):
+        """
+        Obtiene una cadena renderizada, renderizándola sólo la primera vez.
+
+        Args:
+            text: Texto
+            color: Color del texto
+            size: Tamaño de la fuente
+            font: Nombre de la fuente (ver get_font)
+            antialias: Si se suaviza el texto
+
+        Returns:
+            Surface: Texto renderizado
+        """
+        key = (text, tuple(color), font, size, antialias)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.get_font(font, size).render(text, antialias, color)
+            self.surfaces.put(key, surface)
+        return surface
+
+    def draw(self, surface, text, position, color=(255, 255, 255), size=16, font=None, anchor="topleft"):
+        """
+        Dibuja un texto que se repite entre frames usando la caché de cadenas.
+
+        Args:
+            surface: Superficie donde dibujar
+            text: Texto
+            position: Posición del punto de anclaje (x, y)
+            color: Color del texto
+            size: Tamaño de la fuente
+            font: Nombre de la fuente (ver get_font)
+            anchor: Atributo de Rect que se coloca en position ("topleft", "center", "topright"...)
+
+        Returns:
+            Rect: Rectángulo ocupado por el texto
+        """
+        text_surface = self.render(str(text), color, size, font)
+        rect = text_surface.get_rect(**{anchor: position})
+        surface.blit(text_surface, rect)
+        return rect
+
+    def draw_dynamic(self, surface, text, position, color=(255, 255, 255), size=16, font=None, anchor="topleft"):
+        """
+        Dibuja un texto que cambia casi cada frame (FPS, contadores)
+        renderizándolo con la fuente cacheada, sin guardarlo en la caché LRU.
+
+        Args:
+            surface: Superficie donde dibujar
+            text: Texto
+            position: Posición del punto de anclaje (x, y)
+            color: Color del texto
+            size: Tamaño de la fuente
+            font: Nombre de la fuente (ver get_font)
+            anchor: Atributo de Rect que se coloca en position
+
+        Returns:
+            Rect: Rectángulo ocupado por el texto
+        """
+        text_surface = self.get_font(font, size).render(str(text), True, color)
+        rect = text_surface.get_rect(**{anchor: position})
+        surface.blit(text_surface, rect)
+        self.dynamic_draws += 1
+        return rect
+
+    def get_stats(self):
+        """
+        Obtiene las estadísticas del servicio.
+
+        Returns:
+            dict: Estadísticas de la caché de cadenas, fuentes creadas y
+                  textos dibujados sin caché
+        """
+        stats = self.surfaces.get_stats()
+        stats.update({
+            "fonts": len(self._fonts),
+            "dynamic_draws": self.dynamic_draws
+        })
+        return stats
@@ -0,0 +1,204 @@
+"""
+Temporizadores del motor sobre el tiempo de simulación.
+
+En lugar de que cada objeto descuente un contador en cada frame, los objetos
+programan una llamada para un instante del tiempo de simulación
+(GameEngine.sim_time) o consultan un plazo. Los temporizadores pendientes se
+guardan en un montículo ordenado por plazo: avanzar el reloj sólo mira los
+que han vencido, así que un frame sin vencimientos cuesta O(1) aunque haya
+muchos temporizadores, y los tiempos no dependen de los FPS.
+"""
+import heapq
+
+
+class Timer:
+    """
+    Temporizador programado en un TimerService.
+    """
+
+    __slots__ = ("service", "deadline", "interval", "callback", "owner", "active")
+
+    def __init__(self, service, deadline, interval, callback, owner):
+        self.service = service
+        self.deadline = deadline      # Instante (tiempo de simulación) en que vence
+        self.interval = interval      # Periodo de repetición en segundos, o None
+        self.callback = callback
+        self.owner = owner            # Objeto cuyos temporizadores se cancelan juntos
+        self.active = True
+
+    def cancel(self):
+        """Cancela el temporizador si sigue pendiente."""
+        self.service.cancel(self)
+
+    def get_remaining(self):
+        """
+        Obtiene el tiempo que falta para que venza el temporizador.
+
+        Returns:
+            float: Segundos hasta el plazo (0 si ha vencido o está cancelado)
+        """
+        if not self.active:
+            return 0.0
+        return max(0.0, self.deadline - self.service.now)
+
+
+class TimerService:
+    """
+    Montículo de temporizadores que avanza con el tiempo de simulación.
+    """
+
+    def __init__(self):
+        """Inicializa el servicio sin temporizadores."""
+        # Tiempo de simulación del último avance (ver advance)
+        self.now = 0.0
+
+        # Entradas (plazo, secuencia, temporizador); la secuencia desempata los
+        # plazos iguales en orden de programación. Los cancelados se quedan en
+        # el montículo marcados como inactivos y se descartan al salir
+        self._heap = []
+        self._sequence = 0
+        self._cancelled = 0
+
+        # Mientras advance llama a los temporizadores el montículo no se
+        # reconstruye (las llamadas pueden cancelar otros temporizadores)
+        self._advancing = False
+
+        # Propietario -> {temporizador: None} con sus temporizadores activos
+        self._owned = {}
+
+        # Contadores para la información de depuración
+        self.fired_count = 0
+
+    def schedule(self, delay, callback, interval=None, owner=None):
+        """
+        Programa una llamada dentro de delay segundos de simulación.
+
+        Args:
+            delay: Segundos hasta la primera llamada
+            callback: Función sin argumentos a llamar al vencer
+            interval: Si se indica, la llamada se repite cada interval segundos
+                      hasta cancelar el temporizador
+            owner: Objeto propietario (opcional, ver cancel_owner)
+
+        Returns:
+            Timer: Temporizador programado
+        """
+        if interval is not None and interval <= 0:
+            raise ValueError(f"Intervalo de repetición no válido: {interval}")
+
+        timer = Timer(self, self.now + max(0.0, delay), interval, callback, owner)
+        self._push(timer)
+        if owner is not None:
+            owned = self._owned.get(owner)
+            if owned is None:
+                owned = self._owned[owner] = {}
+            owned[timer] = None
+        return timer
+
+    def cancel(self, timer):
+        """
+        Cancela un temporizador pendiente.
+
+        Args:
+            timer: Temporizador a cancelar (se ignora si ya no está activo)
+        """
+        if not timer.active:
+            return
+        timer.active = False
+        self._cancelled += 1
+        self._release(timer)
+        if not self._advancing:
+            self._compact()
+
+    def cancel_owner(self, owner):
+        """
+        Cancela todos los temporizadores de un propietario, p. ej. al eliminar
+        un objeto del juego.
+
+        Args:
+            owner: Propietario indicado en schedule
+        """
+        owned = self._owned.pop(owner, None)
+        if owned:
+            for timer in owned:
+                timer.owner = None
+                self.cancel(timer)
+
+    def advance(self, now):
+        """
+        Avanza el reloj y llama a los temporizadores vencidos en orden de plazo.
+        Los temporizadores periódicos se vuelven a programar a partir de su
+        plazo, así que no acumulan el retraso de los frames.
+
+        Args:
+            now: Tiempo de simulación actual en segundos
+
+        Returns:
+            int: Número de llamadas realizadas
+        """
+        self.now = now
+        heap = self._heap
+        fired = 0
+        self._advancing = True
+        try:
+            while heap and heap[0][0] <= now:
+                timer = heapq.heappop(heap)[2]
+                if not timer.active:
+                    self._cancelled -= 1
+                    continue
+
+                if timer.interval is None:
+                    timer.active = False
+                    self._release(timer)
+                else:
+                    timer.deadline += timer.interval
+                    self._push(timer)
+
+                timer.callback()
+                fired += 1
+        finally:
+            self._advancing = False
+
+        self.fired_count += fired
+        self._compact()
+        return fired
+
+    def clear(self):
+        """Cancela todos los temporizadores."""
+        for _, _, timer in self._heap:
+            timer.active = False
+        self._heap.clear()
+        self._owned.clear()
+        self._cancelled = 0
+
+    def get_stats(self):
+        """
+        Obtiene los contadores de los temporizadores.
+
+        Returns:
+            dict: Temporizadores pendientes ("pending") y llamadas realizadas ("fired")
+        """
+        return {"pending": len(self._heap) - self._cancelled, "fired": self.fired_count}
+
+    def _compact(self):
+        """Reconstruye el montículo cuando la mitad son entradas canceladas."""
+        if self._cancelled > 32 and self._cancelled * 2 > len(self._heap):
+            self._heap[:] = [entry for entry in self._heap if entry[2].active]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def _push(self, timer):
+        """Añade un temporizador al montículo con su plazo actual."""
+        self._sequence += 1
+        heapq.heappush(self._heap, (timer.deadline, self._sequence, timer))
+
+    def _release(self, timer):
+        """Quita un temporizador que deja de estar activo de su propietario."""
+        owner = timer.owner
+        if owner is None:
+            return
+        owned = self._owned.get(owner)
+        if owned is not None:
+            owned.pop(timer, None)
+            if not owned:
+                del self._owned[owner]
@@ -31,11 +31,26 @@ PLAYER_SPEED = 300  # Píxeles por segundo (valores originales)
 MISSILE_COOLDOWN = 200
 MISSILE_SPEED = 600  # Píxeles por segundo (valores originales)
 
+# Capas de dibujo (las mayores se dibujan encima, ver RenderQueue)
+LAYER_METEORS = 1
+LAYER_MISSILES = 2
+LAYER_OTHER_PLAYERS = 3
+LAYER_PLAYER = 4
+
 # FPS del juego
 FPS = 120
 
-# Frecuencia de generación de meteoros
-METEOR_SPAWN_FREQUENCY = 100  # Menor valor = generación más frecuente
+# Tiempos en segundos de simulación: los antiguos contadores de frames al
+# límite de 60 FPS de config.json (fpsLimit, que sustituye a FPS en el motor)
+
+# Segundos entre meteoritos generados localmente
+METEOR_SPAWN_INTERVAL = 100 / 60  # Menor valor = generación más frecuente
+
+# Duración del parpadeo de un meteorito al recibir daño (segundos)
+METEOR_BLINK_TIME = 5 / 60
+
+# Periodo del parpadeo de las naves durante la invencibilidad (segundos)
+PLAYER_BLINK_INTERVAL = 8 / 60
 
 # Nombre del juego
 GAME_TITLE = "Space Shooter" 
\ No newline at end of file
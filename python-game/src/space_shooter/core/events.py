@@ -0,0 +1,142 @@
+"""
+Eventos del juego Space Shooter (ver motor.event_bus).
+
+Cada evento es una clase registro con __slots__; los manejadores se suscriben
+a la clase concreta con GameEngine.events.subscribe o, en los objetos del
+juego, devolviéndola en get_event_handlers.
+"""
+from motor.event_bus import Event
+
+
+class GameOver(Event):
+    """El jugador se ha quedado sin vidas."""
+    __slots__ = ()
+
+
+class MissileFired(Event):
+    """Se ha disparado un misil."""
+    __slots__ = ("player_id", "x", "y")
+
+    def __init__(self, player_id, x, y):
+        self.player_id = player_id
+        self.x = x
+        self.y = y
+
+
+class MissileHit(Event):
+    """Un misil ha impactado contra otro objeto."""
+    __slots__ = ("missile_id", "player_id", "hit_entity", "x", "y")
+
+    def __init__(self, missile_id, player_id, hit_entity, x, y):
+        self.missile_id = missile_id
+        self.player_id = player_id
+        self.hit_entity = hit_entity
+        self.x = x
+        self.y = y
+
+
+class MeteorDestroyed(Event):
+    """Un meteorito ha sido destruido localmente."""
+    __slots__ = ("meteor_id", "points", "x", "y", "meteor")
+
+    def __init__(self, meteor_id, points, x, y, meteor):
+        self.meteor_id = meteor_id
+        self.points = points
+        self.x = x
+        self.y = y
+        self.meteor = meteor
+
+
+class Message(Event):
+    """Mensaje para mostrar al jugador."""
+    __slots__ = ("text",)
+
+    def __init__(self, text):
+        self.text = text
+
+
+class OtherPlayerHit(Event):
+    """Un jugador remoto ha recibido daño."""
+    __slots__ = ("player_id", "lives")
+
+    def __init__(self, player_id, lives=None):
+        self.player_id = player_id
+        self.lives = lives
+
+
+# Eventos recibidos del servidor en modo multijugador (ver NetworkEventsManager)
+
+class OnlinePlayerConnected(Event):
+    """Se ha conectado un jugador remoto."""
+    __slots__ = ("player_id", "player_name", "x", "y")
+
+    def __init__(self, player_id, player_name, x=0, y=0):
+        self.player_id = player_id
+        self.player_name = player_name
+        self.x = x
+        self.y = y
+
+
+class OnlinePlayerDisconnected(Event):
+    """Se ha desconectado un jugador remoto."""
+    __slots__ = ("player_id",)
+
+    def __init__(self, player_id):
+        self.player_id = player_id
+
+
+class OnlinePlayerPosition(Event):
+    """Nueva posición y velocidad de un jugador remoto."""
+    __slots__ = ("player_id", "x", "y", "speed_x", "speed_y")
+
+    def __init__(self, player_id, x, y, speed_x=0, speed_y=0):
+        self.player_id = player_id
+        self.x = x
+        self.y = y
+        self.speed_x = speed_x
+        self.speed_y = speed_y
+
+
+class OnlineMissileFired(Event):
+    """Un jugador remoto ha disparado un misil."""
+    __slots__ = ("player_id", "missile_id")
+
+    def __init__(self, player_id, missile_id=0):
+        self.player_id = player_id
+        self.missile_id = missile_id
+
+
+class OnlineMeteorCreated(Event):
+    """El servidor ha creado un meteorito."""
+    __slots__ = ("meteor_id", "meteor_type", "x", "y", "angle", "rotation_speed",
+                 "speed_x", "speed_y", "spawn_time_ms")
+
+    def __init__(self, meteor_id, meteor_type, x, y, angle=0, rotation_speed=0,
+                 speed_x=0, speed_y=0, spawn_time_ms=0):
+        self.meteor_id = meteor_id
+        self.meteor_type = meteor_type
+        self.x = x
+        self.y = y
+        self.angle = angle
+        self.rotation_speed = rotation_speed
+        self.speed_x = speed_x
+        self.speed_y = speed_y
+        self.spawn_time_ms = spawn_time_ms
+
+
+class OnlineMeteorDestroyed(Event):
+    """El servidor ha destruido un meteorito."""
+    __slots__ = ("meteor_id", "player_id")
+
+    def __init__(self, meteor_id, player_id=0):
+        self.meteor_id = meteor_id
+        self.player_id = player_id
+
+
+class OnlineScoreUpdate(Event):
+    """Cambio de puntuación de un jugador."""
+    __slots__ = ("player_id", "score_delta")
+
+    def __init__(self, player_id, score_delta):
+        self.player_id = player_id
+        self.score_delta = score_delta
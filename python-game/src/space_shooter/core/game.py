@@ -7,17 +7,23 @@ import sys
 # Usar importaciones absolutas en lugar de relativas
 from motor.game_engine import GameEngine
 from motor.resource_manager import ResourceManager
+from motor.background_layer import BackgroundLayer
 from space_shooter.entities.player import Player
 from space_shooter.entities.meteor import Meteor
 from space_shooter.entities.missile import Missile
 from space_shooter.data.meteor_data import MeteorData
 from space_shooter.core.meteor_manager import MeteorManager
+from space_shooter.core.events import (
+    GameOver, MeteorDestroyed, Message,
+    OnlinePlayerConnected, OnlinePlayerDisconnected, OnlinePlayerPosition,
+    OnlineMeteorCreated, OnlineMissileFired, OnlineMeteorDestroyed
+)
 from space_shooter.ui.text import write_text
 from space_shooter.ui.hud import HUD
 from space_shooter.utils.delta_time import DeltaTime
 from space_shooter.core.constants import (
     PLAYER_START_X, PLAYER_START_Y,
-    FPS, METEOR_SPAWN_FREQUENCY, GAME_TITLE
+    FPS, GAME_TITLE, WHITE, BLACK
 )
 from config import Config
 from space_shooter.networking.events_manager import NetworkEventsManager
@@ -36,12 +42,28 @@ class SpaceShooterGame(GameEngine):
 
         # Inicializar gestor de recursos con referencia al juego
         self.resource_manager = ResourceManager(game=self)
+        self.resource_manager.set_atlas(Config.get_sprite_atlas_path())
+        self.resource_manager.set_image_cache(Config.get_image_cache_dir())
+        self.resource_manager.set_cache_budgets(Config.get_resource_cache_budgets())
         
         # Inicializar el gestor de meteoritos
         self.meteor_manager = MeteorManager(self)
         
         # Inicializar el HUD con referencia al juego
         self.hud = HUD(self)
+        
+        # Fondo compuesto una sola vez y su velocidad de desplazamiento (px/s)
+        self.background_layer = BackgroundLayer()
+        self.background_scroll_speed = Config.get_background_scroll_speed()
+
+        # Eventos que maneja el juego
+        self.events.subscribe(MeteorDestroyed, self.on_meteor_destroyed)
+        self.events.subscribe(OnlinePlayerConnected, self.on_online_player_connected)
+        self.events.subscribe(OnlinePlayerDisconnected, self.on_online_player_disconnected)
+        self.events.subscribe(OnlinePlayerPosition, self.on_online_player_position)
+        self.events.subscribe(OnlineMeteorCreated, self.on_online_meteor_created)
+        self.events.subscribe(OnlineMissileFired, self.on_online_missile_fired)
+        self.events.subscribe(OnlineMeteorDestroyed, self.on_online_meteor_destroyed)
 
         # Contadores específicos del juego
         self.loop_ctr = 0
@@ -75,11 +97,23 @@ class SpaceShooterGame(GameEngine):
         """Inicializa los recursos específicos del juego."""
         print("Inicializando recursos del juego...")
         try:
-            # Cargar imágenes
+            # Precargar las imágenes del manifiesto mostrando el progreso
             print("Cargando imágenes...")
-            self.resource_manager.load_image('spaceship', 'images/spaceship.png', 40)
-            self.resource_manager.load_image('damage', 'images/damage.png', 80)
-            self.resource_manager.load_image('background', 'images/background1.png')
+            self.resource_manager.preload(
+                Config.get_asset_manifest_path(),
+                self.draw_loading_screen,
+                Config.get_preload_workers()
+            )
+            
+            # Imágenes imprescindibles que no estuvieran en el manifiesto
+            for name, path, scale, convert_alpha in (('spaceship', 'images/spaceship.png', 40, True),
+                                                     ('damage', 'images/damage.png', 80, True),
+                                                     ('background', 'images/background1.png', None, False)):
+                if not self.resource_manager.get_image(name):
+                    self.resource_manager.load_image(name, path, scale, convert_alpha, pinned=True)
+            
+            # Preparar datos derivados antes del primer frame de juego
+            self.warmup_resources()
 
             # Configurar las imágenes del jugador
             print("Configurando jugador...")
@@ -119,6 +153,46 @@ class SpaceShooterGame(GameEngine):
             traceback.print_exc()
             self.quit()
 
+    def draw_loading_screen(self, loaded, total, name):
+        """
+        Dibuja la pantalla de carga con una barra de progreso.
+        
+        Args:
+            loaded: Número de recursos cargados
+            total: Número total de recursos
+            name: Nombre del último recurso cargado
+        """
+        # Mantener la ventana receptiva mientras se carga
+        pygame.event.pump()
+        
+        window = self.game_window
+        width, height = window.get_size()
+        bar_width = width // 2
+        bar_rect = pygame.Rect((width - bar_width) // 2, height // 2, bar_width, 12)
+        progress = loaded / total if total else 1.0
+        
+        window.fill(BLACK)
+        write_text(window, f"Cargando... {loaded}/{total}", WHITE, width // 2, height // 2 - 20)
+        pygame.draw.rect(window, WHITE, bar_rect, 1)
+        pygame.draw.rect(window, WHITE, (bar_rect.x, bar_rect.y, int(bar_width * progress), bar_rect.height))
+        self.renderer.present_surface()
+    
+    def warmup_resources(self):
+        """
+        Construye por adelantado los datos derivados de los recursos para que
+        la primera aparición de cada meteorito no cause tirones en pleno juego.
+        """
+        masks = 0
+        mask_cache = self.objects_manager.mask_cache
+        for meteor_type in MeteorData.get_types():
+            image = MeteorData.load_meteor_image(self.resource_manager, meteor_type)
+            MeteorData.get_hitbox_spec(meteor_type)
+            if mask_cache and image:
+                masks += mask_cache.warm(image)
+        
+        Missile.get_shared_image()
+        print(f"Recursos preparados: {masks} máscaras de colisión")
+    
     def execute_request_game_state(self):
         """Solicita el estado actual del juego al servidor."""
         if not self.network_client or not self.network_client.connected:
@@ -141,20 +215,49 @@ class SpaceShooterGame(GameEngine):
                         continue
                         
                     # Crear evento de conexión para cada jugador existente
-                    self.on_online_player_connected({
-                        'player_id': player_data.player_id,
-                        'player_name': player_data.name,
-                        'x': player_data.position.x if player_data.position else 0,
-                        'y': player_data.position.y if player_data.position else 0
-                    })
+                    self.on_online_player_connected(OnlinePlayerConnected(
+                        player_data.player_id,
+                        player_data.name,
+                        player_data.position.x if player_data.position else 0,
+                        player_data.position.y if player_data.position else 0
+                    ))
                     
                 print(f"Estado del juego recibido: {len(game_state.players.players)} jugadores conectados")
             else:
                 print("Respuesta de estado de juego vacía o inválida")
+            
+            # Crear los meteoritos existentes: su trayectoria es determinista,
+            # así que basta con el estado inicial y el instante de aparición
+            if game_state and game_state.meteors and hasattr(game_state.meteors, 'meteors'):
+                for meteor_data in game_state.meteors.meteors:
+                    self.on_online_meteor_created(OnlineMeteorCreated(
+                        meteor_data.meteor_id,
+                        meteor_data.meteor_type,
+                        meteor_data.position.x,
+                        meteor_data.position.y,
+                        meteor_data.angle,
+                        meteor_data.rotation_speed,
+                        meteor_data.velocity.x,
+                        meteor_data.velocity.y,
+                        meteor_data.spawn_time_ms
+                    ))
                 
         except Exception as e:
             print(f"Error al procesar estado del juego: {e}")
 
+    def get_world_time(self):
+        """
+        Obtiene el tiempo del mundo sobre el que se evalúan las trayectorias.
+        En multijugador es el reloj sincronizado del servidor, de modo que todos
+        los clientes ven cada meteorito en la misma posición.
+        
+        Returns:
+            float: Tiempo del mundo en segundos
+        """
+        if self.network_client and self.network_client.connected:
+            return self.network_client.server_time()
+        return super().get_world_time()
+
     def on_handle_event(self, event):
         """Procesa eventos específicos del juego."""
         if self.gameover and event.type == pygame.KEYDOWN:
@@ -180,20 +283,6 @@ class SpaceShooterGame(GameEngine):
             if players:
                 players[0].handle_input(keys)
 
-    def on_player_fire_missile(self, data):
-        """
-        Maneja el evento de disparo de misil del jugador.
-        
-        Args:
-            data: Datos del evento con la posición (x, y) desde donde disparar
-        """
-        if 'x' in data and 'y' in data:
-            missile = Missile(data['x'], data['y'])
-            # Registrar el misil en el motor
-            self.register_object(missile)
-            # Notificar el disparo a otros objetos
-            self.emit_event("missile_fired", {"x": data['x'], "y": data['y']})
-
     def on_update(self):
         """Actualización específica del juego (llamada por el motor)."""
         # No actualizar si estamos en game over
@@ -209,23 +298,22 @@ class SpaceShooterGame(GameEngine):
             print("¡Juego terminado! Vidas agotadas.")
             self.gameover = True
             # Notificar a todos los objetos del fin del juego
-            self.emit_event("game_over")
+            self.emit_event(GameOver())
 
-    def on_meteor_destroyed(self, data):
+    def on_meteor_destroyed(self, event):
         """
         Maneja el evento de destrucción de un meteorito.
         
         Args:
-            data: Datos del evento con points, x, y, y meteor
+            event: Evento MeteorDestroyed
         """
-        if 'points' in data and 'x' in data and 'y' in data:
-            # Asignar puntos al jugador
-            players = self.objects_manager.get_objects_by_type("player")
-            if players:
-                players[0].add_score(data['points'])
-                
-            # Notificar al gestor de meteoritos
-            self.meteor_manager.on_meteor_destroyed(data)
+        # Asignar puntos al jugador
+        players = self.objects_manager.get_objects_by_type("player")
+        if players:
+            players[0].add_score(event.points)
+            
+        # Notificar al gestor de meteoritos
+        self.meteor_manager.on_meteor_destroyed(event)
 
     def on_render_background(self, surface):
         """
@@ -234,14 +322,7 @@ class SpaceShooterGame(GameEngine):
         Args:
             surface: Superficie virtual donde dibujar el fondo
         """
-        # Dibujar el fondo en la superficie del nivel
-        bg = self.resource_manager.get_image('background')
-        level_width = Config.get_level_width()
-        level_height = Config.get_level_height()
-        
-        for bg_x in range(0, level_width, bg.get_width()):
-            for bg_y in range(0, level_height, bg.get_height()):
-                surface.blit(bg, (bg_x, bg_y))
+        self._update_background_layer().draw(surface, self.get_background_offset())
 
     def on_render_foreground(self, surface):
         """
@@ -256,33 +337,64 @@ class SpaceShooterGame(GameEngine):
         # Dibujar daño si el jugador ha sido golpeado
         player.draw_damage(surface)
 
-    def render(self):
+    def on_render_background_scaled(self, surface, scale):
         """
-        Sobrescribir el método render para manejar el HUD en la ventana real.
+        Renderiza el fondo directamente en la ventana (modo "prescaled").
+        
+        Args:
+            surface: Ventana donde dibujar
+            scale: Tupla (escala_x, escala_y) del nivel a la ventana
+        """
+        self._update_background_layer().draw_scaled(surface, scale, self.get_background_offset())
+
+    def get_background_offset(self):
         """
-        # Usar la implementación base para dibujar juego y objetos en la superficie virtual
-        self.game_surface.fill((0, 0, 0))
-        self.on_render_background(self.game_surface)
-        self.objects_manager.draw_objects(self.game_surface)
-        self.on_render_foreground(self.game_surface)
+        Calcula el desplazamiento actual del fondo a partir del tiempo de simulación.
         
-        if self.debug_mode:
-            self.objects_manager.draw_hitboxes(self.game_surface)
+        Returns:
+            tuple: Desplazamiento (x, y) en píxeles del nivel
+        """
+        speed_x, speed_y = self.background_scroll_speed
+        return (speed_x * self.sim_time, speed_y * self.sim_time)
+
+    def _update_background_layer(self):
+        """Recompone la capa de fondo si han cambiado la imagen o el tamaño del nivel."""
+        layer = self.background_layer
+        layer.update(self.resource_manager.get_image('background'), self.level_size)
+        return layer
+
+    def on_render_foreground_scaled(self, surface, scale):
+        """
+        Renderiza el primer plano directamente en la ventana (modo "prescaled").
+        
+        Args:
+            surface: Ventana donde dibujar
+            scale: Tupla (escala_x, escala_y) del nivel a la ventana
+        """
+        player = self.objects_manager.get_objects_by_type("player")[0]
+        player.draw_damage(surface, scale, self.resource_manager)
+
+    def on_render_debug(self, surface):
+        """
+        Dibuja las hitboxes en modo debug (el HUD ya muestra FPS y contadores).
         
-        # Renderizar el HUD, pasando la superficie virtual para que la escale
+        Args:
+            surface: Superficie virtual del nivel
+        """
+        self.objects_manager.draw_hitboxes(surface)
+
+    def on_render_ui(self, surface):
+        """
+        Renderiza el HUD o la pantalla de game over sobre la escena.
+        
+        Args:
+            surface: Ventana donde dibujar
+        """
         if self.gameover:
-            # Escalar la superficie virtual y dibujarla en la ventana
-            scaled_surface = pygame.transform.scale(self.game_surface, self.screen_size)
-            self.game_window.blit(scaled_surface, (0, 0))
-            # Mostrar pantalla de game over
-            self.hud.render_game_over(self.game_window)
+            self.hud.render_game_over(surface)
         else:
-            # Usar el HUD para mostrar UI y escalado
             player = self.objects_manager.get_objects_by_type("player")[0]
-            self.hud.render(self.game_window, self.game_surface, player, self.debug_mode)
-        
-        # Actualizar la pantalla
-        pygame.display.update()
+            self.hud.render(surface, player, self.debug_mode)
 
     def restart_game(self):
         """Reinicia el estado del juego para una nueva partida."""
@@ -331,179 +443,161 @@ class SpaceShooterGame(GameEngine):
         
     # Métodos para manejo de eventos online
     
-    def on_online_player_connected(self, data):
+    def on_online_player_connected(self, event):
         """
         Maneja la conexión de un jugador remoto.
         
         Args:
-            data: Datos del jugador conectado
+            event: Evento OnlinePlayerConnected
         """
         from space_shooter.entities.other_player import OtherPlayer
         
-        if 'player_id' in data and 'x' in data and 'y' in data:
-            # Verificar si ya existe este jugador
-            remote_players = self.objects_manager.get_objects_by_type("other_player")
-            for player in remote_players:
-                if player.player_id == data['player_id']:
-                    print(f"Jugador {data['player_id']} ya está registrado")
-                    return
-            
-            # Crear objeto OtherPlayer
-            player = OtherPlayer(
-                data['x'], data['y'], 
-                data['player_id'], 
-                data.get('player_name', f"Player_{data['player_id']}")
-            )
-            
-            # IMPORTANTE: Asignar imágenes al jugador remoto
-            spaceship_img = self.resource_manager.get_image('spaceship')
-            damage_img = self.resource_manager.get_image('damage')
-            player.set_images(spaceship_img, damage_img)
-            
-            # Registrar en el motor
-            self.register_object(player)
-            
-            # Notificar UI
-            self.emit_event("message", {"text": f"Jugador {data.get('player_name')} se ha unido"})
-            print(f"Jugador remoto registrado: ID {data['player_id']}, Nombre {data.get('player_name')}")
+        # Verificar si ya existe este jugador
+        remote_players = self.objects_manager.get_objects_by_type("other_player")
+        for player in remote_players:
+            if player.player_id == event.player_id:
+                print(f"Jugador {event.player_id} ya está registrado")
+                return
+        
+        # Crear objeto OtherPlayer
+        player = OtherPlayer(
+            event.x, event.y, 
+            event.player_id, 
+            event.player_name or f"Player_{event.player_id}"
+        )
+        
+        # IMPORTANTE: Asignar imágenes al jugador remoto
+        spaceship_img = self.resource_manager.get_image('spaceship')
+        damage_img = self.resource_manager.get_image('damage')
+        player.set_images(spaceship_img, damage_img)
+        
+        # Registrar en el motor
+        self.register_object(player)
+        
+        # Notificar UI
+        self.emit_event(Message(f"Jugador {event.player_name} se ha unido"))
+        print(f"Jugador remoto registrado: ID {event.player_id}, Nombre {event.player_name}")
 
-    def on_online_player_disconnected(self, data):
+    def on_online_player_disconnected(self, event):
         """
         Maneja la desconexión de un jugador remoto.
         
         Args:
-            data: Datos del jugador desconectado
+            event: Evento OnlinePlayerDisconnected
         """
-        if 'player_id' in data:
-            # Buscar el jugador remoto
-            remote_players = self.objects_manager.get_objects_by_type("other_player")
-            
-            for player in remote_players:
-                if player.player_id == data['player_id']:
-                    # Eliminar del motor
-                    self.unregister_object(player)
-                    
-                    # Notificar UI
-                    self.emit_event("message", {
-                        "text": f"Jugador {player.player_name} se ha desconectado"
-                    })
-                    break
+        # Buscar el jugador remoto
+        remote_players = self.objects_manager.get_objects_by_type("other_player")
+        
+        for player in remote_players:
+            if player.player_id == event.player_id:
+                # Eliminar del motor
+                self.unregister_object(player)
+                
+                # Notificar UI
+                self.emit_event(Message(f"Jugador {player.player_name} se ha desconectado"))
+                break
 
-    def on_online_player_position(self, data):
+    def on_online_player_position(self, event):
         """
         Actualiza la posición de un jugador remoto.
         
         Args:
-            data: Datos de posición
+            event: Evento OnlinePlayerPosition
         """
-        if 'player_id' in data and 'x' in data and 'y' in data:
-            # Buscar el jugador remoto
-            remote_players = self.objects_manager.get_objects_by_type("other_player")
-            
-            for player in remote_players:
-                if player.player_id == data['player_id']:
-                    # Actualizar posición
-                    player.update_position(
-                        data['x'], data['y'],
-                        data.get('speed_x', 0), data.get('speed_y', 0)
-                    )
-                    break
+        # Buscar el jugador remoto
+        remote_players = self.objects_manager.get_objects_by_type("other_player")
+        
+        for player in remote_players:
+            if player.player_id == event.player_id:
+                # Actualizar posición
+                player.update_position(event.x, event.y, event.speed_x, event.speed_y)
+                break
 
-    def on_online_meteor_created(self, data):
+    def on_online_meteor_created(self, event):
         """
         Crea un meteorito basado en datos del servidor.
         
         Args:
-            data: Datos del meteorito con meteor_id, type, x, y, angle, rotation_speed, speed_x, speed_y
+            event: Evento OnlineMeteorCreated
         """
-        if 'meteor_id' in data and 'type' in data and 'x' in data and 'y' in data:
-            print(f"Recibido evento de meteorito creado: ID {data['meteor_id']}, Tipo {data['type']}")
-            
-            # Preparar datos de velocidad
-            speed = (data.get('speed_x', 0), data.get('speed_y', 0))
-            
-            # Delegar la creación al gestor de meteoritos
-            meteor = self.meteor_manager.create_meteor(
-                data['type'], 
-                (data['x'], data['y']),
-                (data.get('angle', 0), data.get('rotation_speed', 0)),
-                speed  # Pasar la velocidad
-            )
-            
-            # Asignar ID
-            if meteor:
-                meteor.set_network_id(data['meteor_id'])
-                print(f"Meteorito remoto creado con ID {data['meteor_id']}")
-            else:
-                print(f"Error: No se pudo crear el meteorito remoto con ID {data['meteor_id']}")
+        print(f"Recibido evento de meteorito creado: ID {event.meteor_id}, Tipo {event.meteor_type}")
+        
+        # Instante de aparición en el reloj del servidor (0 si el servidor no lo envía)
+        spawn_time = event.spawn_time_ms / 1000.0 if event.spawn_time_ms else None
+        
+        # Delegar la creación al gestor de meteoritos
+        meteor = self.meteor_manager.create_meteor(
+            event.meteor_type, 
+            (event.x, event.y),
+            (event.angle, event.rotation_speed),
+            (event.speed_x, event.speed_y),
+            spawn_time
+        )
+        
+        # Asignar ID
+        if meteor:
+            meteor.set_network_id(event.meteor_id)
+            print(f"Meteorito remoto creado con ID {event.meteor_id}")
         else:
-            print("Error: Datos incompletos para crear meteorito:", data)
+            print(f"Error: No se pudo crear el meteorito remoto con ID {event.meteor_id}")
 
-    def on_online_missile_fired(self, data):
+    def on_online_missile_fired(self, event):
         """
         Crea un misil basado en los datos del servidor.
         
         Args:
-            data: Datos del misil con player_id y missile_id
+            event: Evento OnlineMissileFired
         """
-        if 'player_id' in data:
-            from space_shooter.entities.other_missile import OtherMissile
-            
-            # Encontrar la posición del jugador remoto para crear el misil
-            remote_players = self.objects_manager.get_objects_by_type("other_player")
-            player_found = False
-            
-            for player in remote_players:
-                if player.player_id == data['player_id']:
-                    player_found = True
-                    # Crear el misil en la posición del jugador
-                    missile_id = data.get('missile_id', 0)
-                    
-                    # Crear misil justo encima del jugador
-                    missile = OtherMissile(
-                        player.x, 
-                        player.y - player.hitbox.height/2, 
-                        missile_id, 
-                        player.player_id
-                    )
-                    
-                    # Registrar el misil en el motor
-                    self.register_object(missile)
-                    print(f"Misil remoto creado para jugador {player.player_id}")
-                    break
-            
-            if not player_found:
-                print(f"Advertencia: No se encontró al jugador {data['player_id']} para crear su misil")
+        from space_shooter.entities.other_missile import OtherMissile
+        
+        # Encontrar la posición del jugador remoto para crear el misil
+        remote_players = self.objects_manager.get_objects_by_type("other_player")
+        
+        for player in remote_players:
+            if player.player_id == event.player_id:
+                # Crear misil justo encima del jugador
+                missile = self.get_pool("other_missile", OtherMissile).acquire(
+                    player.x, 
+                    player.y - player.hitbox.height/2, 
+                    event.missile_id, 
+                    player.player_id
+                )
+                
+                # Registrar el misil en el motor
+                self.register_object(missile)
+                print(f"Misil remoto creado para jugador {player.player_id}")
+                return
+        
+        print(f"Advertencia: No se encontró al jugador {event.player_id} para crear su misil")
 
-    def on_online_meteor_destroyed(self, data):
+    def on_online_meteor_destroyed(self, event):
         """
         Maneja el evento cuando un meteorito es destruido en el servidor.
         
         Args:
-            data: Datos del evento con meteor_id y player_id
+            event: Evento OnlineMeteorDestroyed
         """
-        if 'meteor_id' in data:
-            meteor_id = data['meteor_id']
-            player_id = data.get('player_id', 0)
-            
-            print(f"Recibido evento de meteorito destruido: ID {meteor_id}")
-            
-            # Buscar el meteorito por su ID
-            meteors = self.objects_manager.get_objects_by_type("meteor")
-            for meteor in meteors:
-                if hasattr(meteor, 'network_id') and meteor.network_id == meteor_id:
-                    # Eliminar el meteorito del motor
-                    self.unregister_object(meteor)
-                    
-                    # Si fue destruido por un jugador (player_id > 0), mostrar mensaje
-                    if player_id > 0:
-                        print(f"Meteorito {meteor_id} destruido por jugador {player_id}")
-                    else:
-                        print(f"Meteorito {meteor_id} destruido (salió de la pantalla)")
-                    
-                    return
-            
-            # Si llegamos aquí, no se encontró el meteorito
-            # Esto es normal, ya que el meteorito podría haber sido destruido localmente
-            # o aún no haber sido creado en este cliente
-            print(f"Meteorito {meteor_id} no encontrado - posiblemente ya destruido localmente")
+        meteor_id = event.meteor_id
+        player_id = event.player_id
+        
+        print(f"Recibido evento de meteorito destruido: ID {meteor_id}")
+        
+        # Buscar el meteorito por su ID
+        meteors = self.objects_manager.get_objects_by_type("meteor")
+        for meteor in meteors:
+            if hasattr(meteor, 'network_id') and meteor.network_id == meteor_id:
+                # Eliminar el meteorito del motor
+                self.unregister_object(meteor)
+                
+                # Si fue destruido por un jugador (player_id > 0), mostrar mensaje
+                if player_id > 0:
+                    print(f"Meteorito {meteor_id} destruido por jugador {player_id}")
+                else:
+                    print(f"Meteorito {meteor_id} destruido (salió de la pantalla)")
+                
+                return
+        
+        # Si llegamos aquí, no se encontró el meteorito
+        # Esto es normal, ya que el meteorito podría haber sido destruido localmente
+        # o aún no haber sido creado en este cliente
+        print(f"Meteorito {meteor_id} no encontrado - posiblemente ya destruido localmente")
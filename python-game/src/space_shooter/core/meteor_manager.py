@@ -6,7 +6,7 @@ import random
 import pygame
 from space_shooter.entities.meteor import Meteor
 from space_shooter.data.meteor_data import MeteorData
-from space_shooter.core.constants import METEOR_SPAWN_FREQUENCY
+from space_shooter.core.constants import METEOR_SPAWN_INTERVAL
 from config import Config
 
 class MeteorManager:
@@ -28,13 +28,15 @@ class MeteorManager:
         """
         self.game = game
         self.resource_manager = game.resource_manager
-        self.spawn_timer = 0
-        self.spawn_frequency = METEOR_SPAWN_FREQUENCY
+        self.spawn_interval = METEOR_SPAWN_INTERVAL
+        
+        # Plazo del próximo meteorito en el tiempo de simulación
+        self.next_spawn_time = game.timers.now + self.spawn_interval
         
         # Variables para ajuste de dificultad
         self.difficulty_factor = 1.0
-        self.min_spawn_frequency = 30  # Mínimo tiempo entre meteoritos
-        self.difficulty_increase_rate = 0.002  # Aumento de dificultad por frame
+        self.min_spawn_interval = 0.5  # Mínimo tiempo entre meteoritos (segundos)
+        self.difficulty_increase_rate = 0.002  # Reducción del intervalo por segundo
         
         # Pesos de probabilidad para diferentes categorías de meteoritos
         self.meteor_category_weights = {
@@ -61,26 +63,24 @@ class MeteorManager:
             # En modo multijugador, no generar meteoritos localmente
             return
         
-        # Actualizar contador de creación
-        self.spawn_timer += 1
-        
         # Aumentar dificultad gradualmente
         # Comentado hasta que se implemente la señal del servidor
-        # if self.spawn_frequency > self.min_spawn_frequency:
-        #     self.spawn_frequency -= self.difficulty_increase_rate
+        # if self.spawn_interval > self.min_spawn_interval:
+        #     self.spawn_interval -= self.difficulty_increase_rate * DeltaTime.get_delta()
         
-        # Crear un nuevo meteorito si es el momento
-        if self.spawn_timer >= self.spawn_frequency:
+        # Crear un nuevo meteorito si ha vencido el plazo
+        now = self.game.timers.now
+        if now >= self.next_spawn_time:
             self.create_meteor()
-            self.spawn_timer = 0
+            self.next_spawn_time = now + self.spawn_interval
     
     def reset(self):
         """Reinicia el gestor de meteoritos a sus valores iniciales."""
-        self.spawn_timer = 0
-        self.spawn_frequency = METEOR_SPAWN_FREQUENCY
+        self.spawn_interval = METEOR_SPAWN_INTERVAL
+        self.next_spawn_time = self.game.timers.now + self.spawn_interval
         self.difficulty_factor = 1.0
     
-    def create_meteor(self, meteor_type=None, position=None, rotation=None, speed=None):
+    def create_meteor(self, meteor_type=None, position=None, rotation=None, speed=None, spawn_time=None):
         """
         Crea un meteorito y lo registra en el motor del juego.
         
@@ -89,6 +89,8 @@ class MeteorManager:
             position: Posición inicial del meteorito (opcional)
             rotation: Tupla (angle, rotation_speed) para la rotación (opcional)
             speed: Tupla (speed_x, speed_y) para la velocidad (opcional)
+            spawn_time: Instante de aparición en el tiempo del mundo (opcional,
+                        por defecto el tiempo actual)
             
         Returns:
             Meteor: El meteorito creado, o None si hubo un error
@@ -108,14 +110,19 @@ class MeteorManager:
             # Determinar propiedades aleatorias del meteorito
             meteor_properties = self._determine_meteor_properties(meteor_data, position, rotation, speed)
             
-            # Crear el meteorito con la imagen, tipo, datos y propiedades
-            meteor = Meteor(
+            # La trayectoria se evalúa en forma cerrada desde el instante de aparición
+            if spawn_time is None:
+                spawn_time = self.game.get_world_time()
+            
+            # Crear (o reutilizar del pool) el meteorito con la imagen, tipo, datos y propiedades
+            meteor = self.game.get_pool("meteor", Meteor).acquire(
                 meteor_img, 
                 meteor_type, 
                 meteor_data,
                 meteor_properties["position"],
                 meteor_properties["speed"],
-                meteor_properties["rotation"]
+                meteor_properties["rotation"],
+                spawn_time
             )
             
             # Registrar el meteorito en el motor
@@ -181,12 +188,12 @@ class MeteorManager:
             "rotation": (angle, rotation_speed)
         }
     
-    def on_meteor_destroyed(self, data):
+    def on_meteor_destroyed(self, event):
         """
         Maneja el evento de destrucción de un meteorito.
         
         Args:
-            data: Datos del evento con points, x, y, meteor
+            event: Evento MeteorDestroyed con points, x, y, meteor
         """
         # Posible lógica adicional aquí, como crear meteoritos secundarios,
         # ajustar patrones de generación, etc.
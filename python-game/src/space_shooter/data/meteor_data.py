@@ -9,6 +9,7 @@ from typing import Dict, Union, Tuple, List, Any, Optional
 import json
 import pygame
 import os
+from motor.sprite import HitboxSpec
 
 CONFIG_PATH = "entities_config.json"
 
@@ -18,6 +19,7 @@ class MeteorData:
     """
     _instance = None
     _meteor_config = None
+    _hitbox_specs = {}  # HitboxSpec precalculado por tipo de meteorito
 
     @classmethod
     def get_instance(cls) -> 'MeteorData':
@@ -184,9 +186,9 @@ class MeteorData:
         # Nombre único para la imagen en el resource manager
         image_name = f"meteor_{meteor_type}"
         
-        # Cargar la imagen si no está ya cargada
+        # Cargar la imagen si no está ya cargada (sin RLE: se rota en cada frame)
         if not resource_manager.get_image(image_name):
-            resource_manager.load_image(image_name, image_path)
+            resource_manager.load_image(image_name, image_path, rle=False)
         
         # Devolver la imagen
         return resource_manager.get_image(image_name)
@@ -215,3 +217,21 @@ class MeteorData:
             "center_x": data.get("center_x"),
             "center_y": data.get("center_y")
         }
+    
+    @classmethod
+    def get_hitbox_spec(cls, meteor_type):
+        """
+        Obtiene la especificación inmutable de hitbox de un tipo de meteorito.
+        Se calcula una sola vez por tipo y la comparten todas sus instancias.
+        
+        Args:
+            meteor_type: Tipo exacto de meteorito (ej. "brown_big_1")
+            
+        Returns:
+            HitboxSpec: Especificación de la hitbox
+        """
+        spec = cls._hitbox_specs.get(meteor_type)
+        if spec is None:
+            spec = HitboxSpec.from_data(cls.get_type_data(meteor_type))
+            cls._hitbox_specs[meteor_type] = spec
+        return spec
@@ -4,6 +4,7 @@ Este módulo contiene las definiciones para el jugador y los misiles,
 cargados desde el archivo de configuración.
 """
 import json
+from motor.sprite import HitboxSpec
 
 CONFIG_PATH = "entities_config.json"
 
@@ -12,6 +13,8 @@ class PlayerData:
     _instance = None
     _player_config = None
     _missile_config = None
+    _player_hitbox_spec = None
+    _missile_hitbox_spec = None
 
     @classmethod
     def get_instance(cls):
@@ -124,4 +127,18 @@ class PlayerData:
             "height": instance._missile_config.get("height", instance._missile_config.get("hitbox_height", 20)),
             "offset_x": instance._missile_config.get("offset_x", 0),
             "offset_y": instance._missile_config.get("offset_y", 0)
-        } 
\ No newline at end of file
+        } 
+    
+    @classmethod
+    def get_player_hitbox_spec(cls):
+        """Retorna la especificación inmutable del hitbox del jugador (calculada una vez)"""
+        if cls._player_hitbox_spec is None:
+            cls._player_hitbox_spec = HitboxSpec.from_data(cls.get_player_hitbox_data())
+        return cls._player_hitbox_spec
+    
+    @classmethod
+    def get_missile_hitbox_spec(cls):
+        """Retorna la especificación inmutable del hitbox del misil (calculada una vez)"""
+        if cls._missile_hitbox_spec is None:
+            cls._missile_hitbox_spec = HitboxSpec.from_data(cls.get_missile_hitbox_data())
+        return cls._missile_hitbox_spec
@@ -3,12 +3,25 @@ Clase Meteor - Representa los meteoritos que caen durante el juego.
 """
 import pygame
 from motor.sprite import GameObject
-from space_shooter.core.constants import GAME_HEIGHT
+from space_shooter.data.meteor_data import MeteorData
+from motor.culling import EDGE_BOTTOM, EDGE_LEFT, EDGE_RIGHT
+from space_shooter.core.constants import LAYER_METEORS, METEOR_BLINK_TIME
+from space_shooter.core.events import GameOver, MeteorDestroyed
 
 class Meteor(GameObject):
     """Clase que representa los meteoritos en el juego."""
     
-    def __init__(self, image, meteor_type, data, position, speed, rotation):
+    # Los meteoritos no inician contactos: los declaran misiles y jugador
+    collision_targets = ()
+    
+    # Los meteoritos se dibujan debajo de misiles y naves
+    render_layer = LAYER_METEORS
+    
+    # Aparecen por encima del nivel: se eliminan al salir por abajo o por los
+    # lados del nivel lógico (ver ObjectsManager.cull_objects)
+    despawn_edges = EDGE_BOTTOM | EDGE_LEFT | EDGE_RIGHT
+    
+    def __init__(self, image, meteor_type, data, position, speed, rotation, spawn_time=None):
         """
         Inicializa un nuevo meteorito.
         
@@ -19,13 +32,12 @@ class Meteor(GameObject):
             position: Tupla (x, y) con la posición inicial del meteorito
             speed: Tupla (speed_x, speed_y) con la velocidad en ambos ejes
             rotation: Tupla (angle, speed) con el ángulo inicial y velocidad de rotación
+            spawn_time: Instante de aparición en el tiempo del mundo (segundos).
+                        position y rotation son el estado en ese instante (opcional)
         """
         # Posición proporcionada por el meteor_manager
         x, y = position
         
-        # Guardar los datos para usar después en la hitbox personalizada
-        self.hitbox_data = data
-        
         # Llamar al constructor de la clase padre con la imagen y tipo
         super().__init__(x, y, image, obj_type="meteor")
         
@@ -46,15 +58,40 @@ class Meteor(GameObject):
         angle, rotation_speed = rotation
         self.set_rotation(angle, rotation_speed)
         
-        # Aplicar hitbox usando el método de la clase base
-        self.set_hitbox_data(data)
+        # Aplicar hitbox precalculada del tipo usando el método de la clase base
+        self.set_hitbox_data(MeteorData.get_hitbox_spec(meteor_type))
         
-        # Contador para controlar el parpadeo al recibir daño
-        self.blink_counter = 0
+        # Trayectoria determinista: la posición depende sólo del tiempo del mundo
+        if spawn_time is not None:
+            self.set_trajectory(spawn_time)
+        
+        # Temporizador que vuelve a mostrar el meteorito tras el parpadeo por daño
+        self.blink_timer = None
         
         # Para almacenar puntos ganados al ser destruido
         self.points_earned = 0
 
+    def reset(self, image, meteor_type, data, position, speed, rotation, spawn_time=None):
+        """
+        Reinicia el meteorito para reutilizarlo desde un pool.
+        Recibe los mismos argumentos que el constructor.
+        """
+        super().reset(position[0], position[1])
+        self.image = image
+        self.original_image = image
+        self.id = None
+        self.meteor_type = meteor_type
+        self.set_velocity(speed[0], speed[1])
+        self.hp = data.get("hp", 1)
+        self.points = data.get("points", 50)
+        angle, rotation_speed = rotation
+        self.set_rotation(angle, rotation_speed)
+        self.set_hitbox_data(MeteorData.get_hitbox_spec(meteor_type))
+        if spawn_time is not None:
+            self.set_trajectory(spawn_time)
+        self.blink_timer = None
+        self.points_earned = 0
+
     def set_network_id(self, meteor_id):
         """
         Establece el ID de red para este meteorito.
@@ -64,23 +101,10 @@ class Meteor(GameObject):
         """
         self.id = meteor_id
 
-    def on_update(self):
-        """
-        Lógica específica de actualización del meteorito.
-        Este método es llamado automáticamente por la clase base GameObject.
-        """
-        # Controlar el parpadeo
-        if self.blink_counter > 0:
-            self.blink_counter -= 1
-            if self.blink_counter == 0:
-                self.set_visibility(True)
-        
-        # Verificar si el meteorito debe ser eliminado por estar fuera de pantalla
-        if self.y > GAME_HEIGHT or self.x < -100 or self.x > 900:
-            if self.game:
-                # Notificar al juego que el meteorito sale de la pantalla
-                self.game.unregister_object(self)
-            self.kill()
+    def end_blink(self):
+        """Vuelve a mostrar el meteorito al terminar el parpadeo por daño."""
+        self.blink_timer = None
+        self.set_visibility(True)
     
     def take_damage(self, damage=1):
         """
@@ -94,8 +118,10 @@ class Meteor(GameObject):
         """
         self.hp -= damage
         
-        # Parpadeo al recibir daño
-        self.blink_counter = 5
+        # Parpadeo al recibir daño (un nuevo impacto reinicia el plazo)
+        if self.blink_timer:
+            self.blink_timer.cancel()
+        self.blink_timer = self.start_timer(METEOR_BLINK_TIME, self.end_blink)
         self.set_visibility(False)
         
         # Verificar si fue destruido
@@ -104,13 +130,7 @@ class Meteor(GameObject):
             
             # Si tiene acceso al juego, notificar la destrucción
             if self.game:
-                self.game.emit_event("meteor_destroyed", {
-                    "meteor_id": self.id,
-                    "points": self.points,
-                    "x": self.x,
-                    "y": self.y,
-                    "meteor": self
-                })
+                self.game.emit_event(MeteorDestroyed(self.id, self.points, self.x, self.y, self))
                 self.game.unregister_object(self)
                 
             self.kill()
@@ -164,20 +184,15 @@ class Meteor(GameObject):
         """Devuelve los puntos ganados por destruir este meteorito."""
         return self.points_earned
 
-    def on_game_event(self, event_type, data=None):
+    def get_event_handlers(self):
         """
-        Maneja eventos emitidos por el juego.
+        Obtiene los manejadores de eventos del meteorito.
         
-        Args:
-            event_type: Tipo de evento
-            data: Datos asociados al evento (opcional)
-            
         Returns:
-            bool: True si el evento fue manejado, False en caso contrario
+            dict: Clase de evento -> manejador
         """
-        if event_type == "game_over":
-            # Detener el movimiento
-            self.set_velocity(0, 0)
-            return True
-            
-        return False
+        return {GameOver: self.on_game_over}
+    
+    def on_game_over(self, event):
+        """Detiene el meteorito al terminar la partida."""
+        self.set_velocity(0, 0)
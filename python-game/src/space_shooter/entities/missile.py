@@ -3,12 +3,43 @@ Clase Missile - Representa los proyectiles disparados por el jugador.
 """
 import pygame
 from motor.sprite import GameObject
-from space_shooter.core.constants import WHITE
+from motor.culling import EDGE_TOP
+from motor.surface_cache import SurfaceCache
+from space_shooter.core.constants import WHITE, LAYER_MISSILES
+from space_shooter.core.events import GameOver, MissileHit
 from space_shooter.data.player_data import PlayerData
 
 class Missile(GameObject):
     """Clase que representa un misil disparado por el jugador."""
     
+    # Tipos con los que el misil colisiona
+    collision_targets = ("meteor",)
+    
+    # Capa de dibujo
+    render_layer = LAYER_MISSILES
+    
+    # El misil se elimina al salir por la parte superior del nivel (ver ObjectsManager.cull_objects)
+    despawn_edges = EDGE_TOP
+    
+    # Imagen compartida por todos los misiles (ver get_shared_image)
+    _shared_image = None
+    
+    @classmethod
+    def get_shared_image(cls):
+        """
+        Obtiene la imagen del misil, creándola la primera vez.
+        Todos los misiles (propios y remotos) comparten la misma superficie.
+        
+        Returns:
+            pygame.Surface: Rectángulo blanco con la mitad del tamaño del hitbox
+        """
+        if Missile._shared_image is None:
+            hitbox_spec = PlayerData.get_missile_hitbox_spec()
+            width = hitbox_spec.width // 2  # Hacer la imagen más pequeña que el hitbox
+            height = hitbox_spec.height // 2
+            Missile._shared_image = SurfaceCache.get_default().get_filled((width, height), WHITE)
+        return Missile._shared_image
+    
     def __init__(self, x, y, player_id=None):
         """
         Inicializa un nuevo misil.
@@ -18,37 +49,21 @@ class Missile(GameObject):
             y: Posición y inicial del misil
             player_id: ID del jugador que disparó este misil (opcional)
         """
-        # Inicializar primero sin imagen, pero con tipo "missile"
-        super().__init__(x, y, None, obj_type="missile")
+        # Inicializar con la imagen compartida y tipo "missile"
+        super().__init__(x, y, Missile.get_shared_image(), obj_type="missile")
         
         # IDs para networking - por defecto None hasta que se asignen
         self.id = None             # ID único del misil (int32)
         self.player_id = player_id # ID del jugador que disparó (int32)
         
-        # Cargar datos de configuración
-        missile_config = PlayerData.get_missile_data()
-        
         # Ajustar el hitbox para hacerlo más pequeño
-        self.hitbox_data = PlayerData.get_missile_hitbox_data()
+        hitbox_spec = PlayerData.get_missile_hitbox_spec()
         
         # Obtener velocidad desde la configuración
         missile_speed = PlayerData.get_missile_speed()
         
         # Guardar el daño que causa este misil
         self.damage = PlayerData.get_missile_damage()
-        
-        # Crear una simple imagen blanca para el misil
-        # Usamos las dimensiones del hitbox para la imagen
-        width = self.hitbox_data["width"] // 2  # Hacer la imagen más pequeña que el hitbox
-        height = self.hitbox_data["height"] // 2
-        
-        self.image = pygame.Surface((width, height))
-        self.original_image = self.image
-
-        # Dibujar el misil como píxeles blancos
-        for w in range(self.image.get_width()):
-            for h in range(self.image.get_height()):
-                self.image.set_at((w, h), WHITE)
 
         # En el nuevo sistema, no necesitamos ajustar x ya que el hitbox estará centrado en (x,y)
         # y el sprite se ajustará automáticamente según los offsets
@@ -57,12 +72,29 @@ class Missile(GameObject):
         self.set_velocity(0, -missile_speed)
 
         # Aplicar hitbox con los datos de configuración ajustados
-        self.set_hitbox_data(self.hitbox_data)
+        self.set_hitbox_data(hitbox_spec)
         
         # Para controlar si debe ser eliminado
         self.should_destroy = False
         self.has_hit = False
 
+    def reset(self, x, y, player_id=None):
+        """
+        Reinicia el misil para reutilizarlo desde un pool.
+        La imagen, el daño y el hitbox se conservan del uso anterior.
+        
+        Args:
+            x: Posición x inicial del misil
+            y: Posición y inicial del misil
+            player_id: ID del jugador que disparó este misil (opcional)
+        """
+        super().reset(x, y)
+        self.id = None
+        self.player_id = player_id
+        self.set_velocity(0, -PlayerData.get_missile_speed())
+        self.should_destroy = False
+        self.has_hit = False
+
     def set_network_ids(self, missile_id, player_id=None):
         """
         Establece los IDs de red para este misil.
@@ -75,18 +107,6 @@ class Missile(GameObject):
         if player_id is not None:
             self.player_id = player_id
 
-    def on_update(self):
-        """
-        Método llamado en cada actualización de frame.
-        Verifica si el misil debe ser eliminado por salir de la pantalla.
-        """
-        # Eliminar el misil si sale por la parte superior de la pantalla
-        if self.y < -50:
-            # Si tiene referencia al juego, desregistrar el misil
-            if self.game:
-                self.game.unregister_object(self)
-            self.kill()
-
     def on_collide(self, other_entity):
         """
         Maneja la colisión con otra entidad.
@@ -101,13 +121,7 @@ class Missile(GameObject):
         if other_entity.type == "meteor":
             # Si tiene referencia al juego, notificar la colisión
             if self.game:
-                self.game.emit_event("missile_hit", {
-                    "missile_id": self.id,
-                    "player_id": self.player_id,
-                    "hit_entity": other_entity,
-                    "x": self.x,
-                    "y": self.y
-                })
+                self.game.emit_event(MissileHit(self.id, self.player_id, other_entity, self.x, self.y))
                 self.game.unregister_object(self)
             
             # Destruir el misil
@@ -132,20 +146,15 @@ class Missile(GameObject):
         # Si está fuera de la pantalla, se marca para destrucción
         return self.y < -50
 
-    def on_game_event(self, event_type, data=None):
+    def get_event_handlers(self):
         """
-        Maneja eventos emitidos por el juego.
+        Obtiene los manejadores de eventos del misil.
         
-        Args:
-            event_type: Tipo de evento
-            data: Datos asociados al evento (opcional)
-            
         Returns:
-            bool: True si el evento fue manejado, False en caso contrario
+            dict: Clase de evento -> manejador
         """
-        if event_type == "game_over":
-            # Detener el movimiento
-            self.set_velocity(0, 0)
-            return True
-            
-        return False
+        return {GameOver: self.on_game_over}
+    
+    def on_game_over(self, event):
+        """Detiene el misil al terminar la partida."""
+        self.set_velocity(0, 0)
@@ -3,25 +3,34 @@ Clase OtherMissile - Representa los proyectiles disparados por otros jugadores.
 """
 import pygame
 from motor.sprite import GameObject
+from motor.culling import EDGE_TOP
 from space_shooter.data.player_data import PlayerData
-from space_shooter.core.constants import WHITE
+from space_shooter.entities.missile import Missile
+from space_shooter.core.constants import LAYER_MISSILES
+from space_shooter.core.events import GameOver
 
 class OtherMissile(GameObject):
     """Clase que representa los misiles disparados por otros jugadores."""
+    
+    # Tipos con los que el misil colisiona
+    collision_targets = ("meteor",)
+    
+    # Capa de dibujo
+    render_layer = LAYER_MISSILES
+    
+    # Se elimina al salir por arriba del nivel (ver ObjectsManager.cull_objects)
+    despawn_edges = EDGE_TOP
 
     def __init__(self, x, y, missile_id, player_id):
-        # Inicializar primero sin imagen, pero con tipo "other_missile"
-        super().__init__(x, y, None, obj_type="other_missile")
+        # Inicializar con la imagen compartida de los misiles y tipo "other_missile"
+        super().__init__(x, y, Missile.get_shared_image(), obj_type="other_missile")
         
         # Guardar IDs para tracking en red - estos son valores enteros (int32)
         self.id = missile_id        # ID único del misil (int32)
         self.player_id = player_id  # ID del jugador que disparó (int32)
         
-        # Cargar datos de configuración
-        missile_config = PlayerData.get_missile_data()
-        
         # Ajustar el hitbox para hacerlo más pequeño
-        self.hitbox_data = PlayerData.get_missile_hitbox_data()
+        hitbox_spec = PlayerData.get_missile_hitbox_spec()
         
         # Obtener velocidad desde la configuración
         missile_speed = PlayerData.get_missile_speed()
@@ -29,45 +38,32 @@ class OtherMissile(GameObject):
         # Guardar el daño que causa este misil (aunque no causa daño real)
         self.damage = PlayerData.get_missile_damage()
         
-        # Crear una simple imagen blanca para el misil
-        # Usamos las dimensiones del hitbox para la imagen
-        width = self.hitbox_data["width"] // 2  # Hacer la imagen más pequeña que el hitbox
-        height = self.hitbox_data["height"] // 2
-        
-        self.image = pygame.Surface((width, height))
-        self.original_image = self.image
-
-        # Dibujar el misil como píxeles blancos
-        for w in range(self.image.get_width()):
-            for h in range(self.image.get_height()):
-                self.image.set_at((w, h), WHITE)
-        
         # Establecer velocidad usando los datos de configuración ajustados
         self.set_velocity(0, -missile_speed)
 
         # Aplicar hitbox con los datos de configuración ajustados
-        self.set_hitbox_data(self.hitbox_data)
+        self.set_hitbox_data(hitbox_spec)
         
         # Para controlar si debe ser eliminado
         self.should_destroy = False
         self.has_hit = False
 
-    def on_update(self):
+    def reset(self, x, y, missile_id, player_id):
         """
-        Lógica específica de actualización del misil.
-        Este método es llamado automáticamente por la clase base GameObject.
+        Reinicia el misil remoto para reutilizarlo desde un pool.
+        
+        Args:
+            x: Posición x inicial del misil
+            y: Posición y inicial del misil
+            missile_id: ID único del misil (int32)
+            player_id: ID del jugador que disparó (int32)
         """
-        print(f"Misil actualizado: {self.id}")
-
-        # Verificar si el misil sigue en pantalla
-        if self.hitbox.bottom <= 0:
-            self.should_destroy = True
-            
-        # Si debe ser destruido, notificar al juego y eliminarse
-        if self.should_destroy and self.game:
-            # Eliminar el misil del registro
-            self.game.unregister_object(self)
-            self.kill()  # Eliminar de todos los grupos de sprites
+        super().reset(x, y)
+        self.id = missile_id
+        self.player_id = player_id
+        self.set_velocity(0, -PlayerData.get_missile_speed())
+        self.should_destroy = False
+        self.has_hit = False
 
     def on_collide(self, other_entity):
         """
@@ -112,20 +108,15 @@ class OtherMissile(GameObject):
         """
         return self.should_destroy
 
-    def on_game_event(self, event_type, data=None):
+    def get_event_handlers(self):
         """
-        Maneja eventos emitidos por el juego.
-
-        Args:
-            event_type: Tipo de evento
-            data: Datos asociados al evento (opcional)
-            
+        Obtiene los manejadores de eventos del misil remoto.
+        
         Returns:
-            bool: True si el evento fue manejado, False en caso contrario
+            dict: Clase de evento -> manejador
         """
-        if event_type == "game_over":
-            # Auto-destruir el misil cuando termina el juego
-            self.should_destroy = True
-            return True
-
-        return False
+        return {GameOver: self.on_game_over}
+    
+    def on_game_over(self, event):
+        """Marca el misil para destrucción al terminar la partida."""
+        self.should_destroy = True
@@ -3,11 +3,21 @@ Clase OtherPlayer - Representa a jugadores remotos controlados por otros cliente
 """
 import pygame
 from motor.sprite import GameObject
+from motor.text_service import TextService
+from motor.surface_cache import SurfaceCache, NAME_PLATE_PADDING
 from space_shooter.data.player_data import PlayerData
+from space_shooter.core.constants import LAYER_OTHER_PLAYERS, PLAYER_BLINK_INTERVAL
+from space_shooter.core.events import GameOver, OtherPlayerHit
 
 class OtherPlayer(GameObject):
     """Clase que representa a otros jugadores en el juego Space Shooter multijugador."""
     
+    # Las colisiones del jugador remoto las resuelve su propio cliente
+    collision_targets = ()
+    
+    # Capa de dibujo (el jugador local queda siempre encima)
+    render_layer = LAYER_OTHER_PLAYERS
+    
     def __init__(self, x, y, player_id, player_name):
         # La imagen la asignaremos después, cuando esté disponible
         super().__init__(x, y, None, "other_player")
@@ -21,7 +31,7 @@ class OtherPlayer(GameObject):
         player_config = PlayerData.get_player_data()
         
         # Guardar datos del hitbox personalizado
-        self.hitbox_data = PlayerData.get_player_hitbox_data()
+        self.hitbox_spec = PlayerData.get_player_hitbox_spec()
 
         # Atributos específicos del jugador desde la configuración
         self.lives = PlayerData.get_player_lives()
@@ -29,20 +39,22 @@ class OtherPlayer(GameObject):
         
         # Para el sistema de daño e invencibilidad
         self.damage_image = None  # Imagen con efecto de daño
-        self.invincibility_frames = 0  # Contador de frames de invencibilidad
+        self.invincibility_timer = None  # Fin de la invencibilidad tras recibir daño
+        self.blink_timer = None          # Parpadeo periódico mientras dura
         
         # Para mostrar el nombre del jugador
-        self.name_font = pygame.font.Font(None, 20)  # Fuente pequeña
+        self.name_font = TextService.get_default().get_font(None, 20)  # Fuente pequeña compartida
         self.render_name()
     
     def render_name(self):
-        """Renderiza el nombre del jugador como una superficie."""
+        """Prepara la placa con el nombre del jugador."""
         if self.player_name:
             # Color negro para los jugadores remotos
             text_color = (255, 255, 255)  # Blanco (mantener el color original)
-            self.name_surface = self.name_font.render(self.player_name, True, text_color)
+            # Placa (texto y fondo) compuesta una vez por nombre y compartida
+            self.name_plate = SurfaceCache.get_default().get_name_plate(self.player_name, self.name_font, text_color)
         else:
-            self.name_surface = None
+            self.name_plate = None
         
     def set_images(self, image, damage_image):
         """
@@ -57,22 +69,7 @@ class OtherPlayer(GameObject):
         self.damage_image = damage_image
         
         # Aplicar hitbox
-        self.set_hitbox_data(self.hitbox_data)
-    
-    def on_update(self):
-        """
-        Lógica específica de actualización del jugador remoto.
-        Este método es llamado automáticamente por la clase base GameObject.
-        """
-        # Manejar invencibilidad
-        if self.invincibility_frames > 0:
-            # Parpadear cada 8 frames
-            if self.invincibility_frames % 8 == 0:
-                self.toggle_visibility()
-            self.invincibility_frames -= 1
-        elif not self.is_visible:
-            # Asegurar que sea visible cuando termine la invencibilidad
-            self.set_visibility(True)
+        self.set_hitbox_data(self.hitbox_spec)
     
     def draw(self, surface):
         """
@@ -86,51 +83,115 @@ class OtherPlayer(GameObject):
         super().draw(surface)
         
         # Dibujar el nombre sobre el jugador
-        if self.is_visible and self.name_surface:
-            # Calcular posición del nombre (centrado sobre el jugador)
-            name_rect = self.name_surface.get_rect()
-            name_rect.centerx = self.x
-            name_rect.bottom = self.y - self.image.get_height() // 2 - 5  # 5 píxeles arriba de la nave
-            
-            # Crear un fondo negro semitransparente
-            bg_rect = name_rect.copy()
-            bg_rect.inflate_ip(4, 4)  # Hacer el fondo un poco más grande
-            bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-            bg_surface.fill((0, 0, 0, 180))  # Negro semitransparente
-            
-            # Dibujar el fondo y luego el texto
-            surface.blit(bg_surface, bg_rect)
-            surface.blit(self.name_surface, name_rect)
+        if self.is_visible and self.name_plate:
+            self._draw_name(surface, self.name_plate)
+    
+    def queue_draw(self, queue):
+        """
+        Envía el jugador y la placa con su nombre a la cola de dibujado.
+        
+        Args:
+            queue: Cola de dibujado (RenderQueue)
+        """
+        super().queue_draw(queue)
+        
+        if self.is_visible and self.name_plate:
+            queue.submit(self.name_plate, self._get_name_plate_rect(self.name_plate).topleft, self.render_layer)
+    
+    def queue_draw_scaled(self, queue, scale, resource_manager):
+        """
+        Envía el jugador y su nombre a resolución de ventana a la cola de dibujado (modo "prescaled").
+        
+        Args:
+            queue: Cola de dibujado (RenderQueue)
+            scale: Tupla (escala_x, escala_y) del nivel a la ventana
+            resource_manager: Gestor de recursos con los sprites preescalados
+        """
+        super().queue_draw_scaled(queue, scale, resource_manager)
+        
+        if self.is_visible and self.name_plate:
+            name_plate = resource_manager.get_scaled_image(self.name_plate, scale)
+            queue.submit(name_plate, self._get_name_plate_rect(name_plate, scale).topleft, self.render_layer)
+    
+    def draw_texture(self, renderer):
+        """
+        Dibuja el jugador y su nombre con el backend de texturas.
+        
+        Args:
+            renderer: Backend de texturas (TextureRenderer)
+        """
+        super().draw_texture(renderer)
+        
+        if self.is_visible and self.name_plate:
+            self._draw_name(renderer.scene, self.name_plate)
     
-    def draw_damage(self, surface):
-        """Dibuja el efecto de daño si el jugador ha sido golpeado."""
+    def _draw_name(self, surface, name_plate):
+        """Dibuja la placa del nombre centrada sobre la nave."""
+        surface.blit(name_plate, self._get_name_plate_rect(name_plate))
+    
+    def _get_name_plate_rect(self, name_plate, scale=(1, 1)):
+        """Rectángulo de la placa del nombre, centrada sobre la nave."""
+        plate_rect = name_plate.get_rect()
+        plate_rect.centerx = self.x * scale[0]
+        # Texto 5 píxeles arriba de la nave; el margen de la placa sobresale por debajo
+        plate_rect.bottom = (self.y - self.image.get_height() // 2 - 5 + NAME_PLATE_PADDING) * scale[1]
+        return plate_rect
+    
+    def draw_damage(self, surface, scale=None, resource_manager=None):
+        """
+        Dibuja el efecto de daño si el jugador ha sido golpeado.
+        
+        Args:
+            surface: Superficie donde dibujar
+            scale: Tupla (escala_x, escala_y) en modo "prescaled" (opcional)
+            resource_manager: Gestor de recursos con los sprites preescalados (con scale)
+        """
         # Dibujar daño si está activo
-        if self.invincibility_frames > 0 and self.damage_image:
-            # Obtener offsets del hitbox_data
-            offset_x = self.hitbox_data.get("offset_x", 0) if self.hitbox_data else 0
-            offset_y = self.hitbox_data.get("offset_y", 0) if self.hitbox_data else 0
+        if self.invincibility_timer and self.damage_image:
+            # Obtener offsets de la especificación de hitbox
+            offset_x = self.hitbox_spec.offset_x if self.hitbox_spec else 0
+            offset_y = self.hitbox_spec.offset_y if self.hitbox_spec else 0
+            
+            image = self.damage_image
+            scale_x, scale_y = scale or (1, 1)
+            if scale:
+                image = resource_manager.get_scaled_image(image, scale)
             
             # Calcular posición ajustando offsets para que el sprite se coloque correctamente
-            rect = self.damage_image.get_rect()
-            rect.centerx = self.x - offset_x
-            rect.centery = self.y - offset_y
+            rect = image.get_rect()
+            rect.centerx = (self.x - offset_x) * scale_x
+            rect.centery = (self.y - offset_y) * scale_y
             
-            surface.blit(self.damage_image, rect)
+            surface.blit(image, rect)
     
-    def simulate_damage(self):
+    def start_invincibility(self):
         """
-        Simula el efecto visual de recibir daño, sin enviar eventos al servidor.
-        Usado cuando el servidor notifica que este jugador recibió daño.
+        Comienza la invencibilidad tras recibir daño: la nave parpadea durante
+        el damage_time configurado (segundos de simulación).
         """
-        # Calcular frames de invencibilidad desde el damage_time en segundos
-        # Asumiendo 60 FPS
-        frames_per_second = 60
-        invincibility_seconds = PlayerData.get_player_damage_time()
-        self.invincibility_frames = int(invincibility_seconds * frames_per_second)
+        self.end_invincibility()
+        self.invincibility_timer = self.start_timer(PlayerData.get_player_damage_time(), self.end_invincibility)
+        self.blink_timer = self.start_timer(PLAYER_BLINK_INTERVAL, self.toggle_visibility, PLAYER_BLINK_INTERVAL)
         
         # Comenzar efecto de parpadeo
         self.set_visibility(False)
     
+    def end_invincibility(self):
+        """Termina la invencibilidad y el parpadeo, dejando la nave visible."""
+        for timer in (self.invincibility_timer, self.blink_timer):
+            if timer:
+                timer.cancel()
+        self.invincibility_timer = None
+        self.blink_timer = None
+        self.set_visibility(True)
+    
+    def simulate_damage(self):
+        """
+        Simula el efecto visual de recibir daño, sin enviar eventos al servidor.
+        Usado cuando el servidor notifica que este jugador recibió daño.
+        """
+        self.start_invincibility()
+    
     def on_collide(self, other_entity):
         """
         Maneja la colisión con otra entidad.
@@ -140,32 +201,26 @@ class OtherPlayer(GameObject):
         # No hacer nada, el jugador original maneja sus colisiones
         return False
     
-    def on_game_event(self, event_type, data=None):
+    def get_event_handlers(self):
         """
-        Maneja eventos emitidos por el juego.
+        Obtiene los manejadores de eventos del jugador remoto.
         
-        Args:
-            event_type: Tipo de evento
-            data: Datos asociados al evento (opcional)
-            
         Returns:
-            bool: True si el evento fue manejado, False en caso contrario
-        """
-        if event_type == "game_over":
-            # Mostrar animación de game over
-            self.set_visibility(True)  # Asegurar que sea visible en game over
-            # Detener movimiento
-            self.set_velocity(0, 0)
-            return True
-        elif event_type == "other_player_hit":
-            # Si los datos coinciden con este jugador, mostrar efecto de daño
-            if data and 'player_id' in data and data['player_id'] == self.player_id:
-                self.simulate_damage()
-                if 'lives' in data:
-                    self.lives = data['lives']
-                return True
-            
-        return False 
+            dict: Clase de evento -> manejador
+        """
+        return {GameOver: self.on_game_over, OtherPlayerHit: self.on_other_player_hit}
+    
+    def on_game_over(self, event):
+        """Deja el jugador visible y quieto al terminar la partida."""
+        self.end_invincibility()  # Asegurar que sea visible en game over
+        self.set_velocity(0, 0)
+    
+    def on_other_player_hit(self, event):
+        """Muestra el efecto de daño si el evento es de este jugador."""
+        if event.player_id == self.player_id:
+            self.simulate_damage()
+            if event.lives is not None:
+                self.lives = event.lives
         
     def update_position(self, x, y, speed_x, speed_y):
         """
@@ -180,4 +235,7 @@ class OtherPlayer(GameObject):
         self.x = x
         self.y = y
         self.set_velocity(speed_x, speed_y)
-        self.update_hitbox() 
\ No newline at end of file
+        self.update_hitbox()
+        
+        # La posición cambió fuera de la integración: recalcular contactos
+        self.notify_motion_changed() 
\ No newline at end of file
@@ -4,13 +4,23 @@ Clase Player - Representa al jugador controlado por el usuario.
 import pygame
 from pygame.locals import *
 from motor.sprite import GameObject
+from motor.text_service import TextService
+from motor.surface_cache import SurfaceCache, NAME_PLATE_PADDING
 from space_shooter.data.player_data import PlayerData
 from space_shooter.entities.missile import Missile
+from space_shooter.core.constants import LAYER_PLAYER, PLAYER_BLINK_INTERVAL
+from space_shooter.core.events import GameOver, MissileFired
 from config import Config
 
 class Player(GameObject):
     """Clase que representa al jugador en el juego Space Shooter."""
     
+    # Tipos con los que el jugador colisiona
+    collision_targets = ("meteor",)
+    
+    # Capa de dibujo: el jugador local se dibuja encima de todo
+    render_layer = LAYER_PLAYER
+    
     def __init__(self, x, y):
         # La imagen la asignaremos después, cuando esté disponible
         super().__init__(x, y, None, "player")
@@ -24,35 +34,38 @@ class Player(GameObject):
         player_config = PlayerData.get_player_data()
         
         # Guardar datos del hitbox personalizado
-        self.hitbox_data = PlayerData.get_player_hitbox_data()
+        self.hitbox_spec = PlayerData.get_player_hitbox_spec()
 
         # Atributos específicos del jugador desde la configuración
         self.lives = PlayerData.get_player_lives()
         self.score = 0
         
-        # Calcular cooldown en milisegundos desde el delay en segundos
-        self.missile_cooldown = int(PlayerData.get_player_fire_delay() * 1000)
-        self.last_missile = 0
+        # Tiempo mínimo entre disparos (segundos) y plazo del próximo disparo
+        # en el tiempo de simulación
+        self.missile_cooldown = PlayerData.get_player_fire_delay()
+        self.next_missile_time = 0.0
         
         # Para el sistema de daño e invencibilidad
         self.damage_image = None  # Imagen con efecto de daño
-        self.invincibility_frames = 0  # Contador de frames de invencibilidad
+        self.invincibility_timer = None  # Fin de la invencibilidad tras recibir daño
+        self.blink_timer = None          # Parpadeo periódico mientras dura
         
         # Para mostrar el nombre del jugador
-        self.name_font = pygame.font.Font(None, 20)  # Fuente pequeña
+        self.name_font = TextService.get_default().get_font(None, 20)  # Fuente pequeña compartida
         self.render_name()
         
         # Para controlar el evento STOP
         self.at_border = False
         
     def render_name(self):
-        """Renderiza el nombre del jugador como una superficie."""
+        """Prepara la placa con el nombre del jugador."""
         if self.player_name:
             # Color azul para el jugador local
             blue_color = (0, 120, 255)  # Azul claro
-            self.name_surface = self.name_font.render(self.player_name, True, blue_color)
+            # Placa (texto y fondo) compuesta una vez por nombre y compartida
+            self.name_plate = SurfaceCache.get_default().get_name_plate(self.player_name, self.name_font, blue_color)
         else:
-            self.name_surface = None
+            self.name_plate = None
         
     def set_network_ids(self, player_id, object_id=None):
         """
@@ -78,23 +91,13 @@ class Player(GameObject):
         self.damage_image = damage_image
         
         # Aplicar hitbox
-        self.set_hitbox_data(self.hitbox_data)
+        self.set_hitbox_data(self.hitbox_spec)
     
     def on_update(self):
         """
         Lógica específica de actualización del jugador.
         Este método es llamado automáticamente por la clase base GameObject.
         """
-        # Manejar invencibilidad
-        if self.invincibility_frames > 0:
-            # Parpadear cada 8 frames
-            if self.invincibility_frames % 8 == 0:
-                self.toggle_visibility()
-            self.invincibility_frames -= 1
-        elif not self.is_visible:
-            # Asegurar que sea visible cuando termine la invencibilidad
-            self.set_visibility(True)
-        
         # Notificar cambio de posición al servidor si está en modo multijugador
         if self.player_id is not None:
             game = self.get_game()
@@ -113,51 +116,114 @@ class Player(GameObject):
         super().draw(surface)
         
         # Dibujar el nombre sobre el jugador
-        if self.is_visible and self.name_surface:
-            # Calcular posición del nombre (centrado sobre el jugador)
-            name_rect = self.name_surface.get_rect()
-            name_rect.centerx = self.x
-            name_rect.bottom = self.y - self.image.get_height() // 2 - 5  # 5 píxeles arriba de la nave
-            
-            # Crear un fondo negro semitransparente
-            bg_rect = name_rect.copy()
-            bg_rect.inflate_ip(4, 4)  # Hacer el fondo un poco más grande
-            bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-            bg_surface.fill((0, 0, 0, 180))  # Negro semitransparente
-            
-            # Dibujar el fondo y luego el texto
-            surface.blit(bg_surface, bg_rect)
-            surface.blit(self.name_surface, name_rect)
+        if self.is_visible and self.name_plate:
+            self._draw_name(surface, self.name_plate)
+    
+    def queue_draw(self, queue):
+        """
+        Envía el jugador y la placa con su nombre a la cola de dibujado.
+        
+        Args:
+            queue: Cola de dibujado (RenderQueue)
+        """
+        super().queue_draw(queue)
+        
+        if self.is_visible and self.name_plate:
+            queue.submit(self.name_plate, self._get_name_plate_rect(self.name_plate).topleft, self.render_layer)
+    
+    def queue_draw_scaled(self, queue, scale, resource_manager):
+        """
+        Envía el jugador y su nombre a resolución de ventana a la cola de dibujado (modo "prescaled").
+        
+        Args:
+            queue: Cola de dibujado (RenderQueue)
+            scale: Tupla (escala_x, escala_y) del nivel a la ventana
+            resource_manager: Gestor de recursos con los sprites preescalados
+        """
+        super().queue_draw_scaled(queue, scale, resource_manager)
+        
+        if self.is_visible and self.name_plate:
+            name_plate = resource_manager.get_scaled_image(self.name_plate, scale)
+            queue.submit(name_plate, self._get_name_plate_rect(name_plate, scale).topleft, self.render_layer)
+    
+    def draw_texture(self, renderer):
+        """
+        Dibuja el jugador y su nombre con el backend de texturas.
+        
+        Args:
+            renderer: Backend de texturas (TextureRenderer)
+        """
+        super().draw_texture(renderer)
+        
+        if self.is_visible and self.name_plate:
+            self._draw_name(renderer.scene, self.name_plate)
+    
+    def _draw_name(self, surface, name_plate):
+        """Dibuja la placa del nombre centrada sobre la nave."""
+        surface.blit(name_plate, self._get_name_plate_rect(name_plate))
+    
+    def _get_name_plate_rect(self, name_plate, scale=(1, 1)):
+        """Rectángulo de la placa del nombre, centrada sobre la nave."""
+        plate_rect = name_plate.get_rect()
+        plate_rect.centerx = self.x * scale[0]
+        # Texto 5 píxeles arriba de la nave; el margen de la placa sobresale por debajo
+        plate_rect.bottom = (self.y - self.image.get_height() // 2 - 5 + NAME_PLATE_PADDING) * scale[1]
+        return plate_rect
     
-    def draw_damage(self, surface):
-        """Dibuja el efecto de daño si el jugador ha sido golpeado."""
+    def draw_damage(self, surface, scale=None, resource_manager=None):
+        """
+        Dibuja el efecto de daño si el jugador ha sido golpeado.
+        
+        Args:
+            surface: Superficie donde dibujar
+            scale: Tupla (escala_x, escala_y) en modo "prescaled" (opcional)
+            resource_manager: Gestor de recursos con los sprites preescalados (con scale)
+        """
         # Dibujar daño si está activo
-        if self.invincibility_frames > 0 and self.damage_image:
-            # Obtener offsets del hitbox_data
-            offset_x = self.hitbox_data.get("offset_x", 0) if self.hitbox_data else 0
-            offset_y = self.hitbox_data.get("offset_y", 0) if self.hitbox_data else 0
+        if self.invincibility_timer and self.damage_image:
+            # Obtener offsets de la especificación de hitbox
+            offset_x = self.hitbox_spec.offset_x if self.hitbox_spec else 0
+            offset_y = self.hitbox_spec.offset_y if self.hitbox_spec else 0
+            
+            image = self.damage_image
+            scale_x, scale_y = scale or (1, 1)
+            if scale:
+                image = resource_manager.get_scaled_image(image, scale)
             
             # Calcular posición ajustando offsets para que el sprite se coloque correctamente
-            rect = self.damage_image.get_rect()
-            rect.centerx = self.x - offset_x
-            rect.centery = self.y - offset_y
+            rect = image.get_rect()
+            rect.centerx = (self.x - offset_x) * scale_x
+            rect.centery = (self.y - offset_y) * scale_y
             
-            surface.blit(self.damage_image, rect)
+            surface.blit(image, rect)
+    
+    def start_invincibility(self):
+        """
+        Comienza la invencibilidad tras recibir daño: la nave parpadea durante
+        el damage_time configurado (segundos de simulación).
+        """
+        self.end_invincibility()
+        self.invincibility_timer = self.start_timer(PlayerData.get_player_damage_time(), self.end_invincibility)
+        self.blink_timer = self.start_timer(PLAYER_BLINK_INTERVAL, self.toggle_visibility, PLAYER_BLINK_INTERVAL)
+        
+        # Comenzar efecto de parpadeo
+        self.set_visibility(False)
+    
+    def end_invincibility(self):
+        """Termina la invencibilidad y el parpadeo, dejando la nave visible."""
+        for timer in (self.invincibility_timer, self.blink_timer):
+            if timer:
+                timer.cancel()
+        self.invincibility_timer = None
+        self.blink_timer = None
+        self.set_visibility(True)
     
     def take_damage(self):
         """Aplica daño al jugador si no está en estado de invencibilidad."""
-        if self.invincibility_frames == 0:
+        if not self.invincibility_timer:
             # Recibir daño
             self.lives -= 1
-            
-            # Calcular frames de invencibilidad desde el damage_time en segundos
-            # Asumiendo 60 FPS
-            frames_per_second = 60
-            invincibility_seconds = PlayerData.get_player_damage_time()
-            self.invincibility_frames = int(invincibility_seconds * frames_per_second)
-            
-            # Comenzar efecto de parpadeo
-            self.set_visibility(False)
+            self.start_invincibility()
             return True
         return False
     
@@ -167,40 +233,24 @@ class Player(GameObject):
         
     def on_collide(self, other_entity):
         """Maneja la colisión con otra entidad."""
-        if other_entity.type == "meteor" and self.invincibility_frames == 0:
+        if other_entity.type == "meteor" and not self.invincibility_timer:
             self.take_damage()
             return True
         return False
 
-    def on_game_event(self, event_type, data=None):
+    def get_event_handlers(self):
         """
-        Maneja eventos emitidos por el juego.
+        Obtiene los manejadores de eventos del jugador.
         
-        Args:
-            event_type: Tipo de evento
-            data: Datos asociados al evento (opcional)
-            
         Returns:
-            bool: True si el evento fue manejado, False en caso contrario
+            dict: Clase de evento -> manejador
         """
-        if event_type == "game_over":
-            # Mostrar animación de game over
-            self.set_visibility(True)  # Asegurar que sea visible en game over
-            # Detener movimiento
-            self.set_velocity(0, 0)
-            return True
-        elif event_type == "meteor_destroyed":
-            # Reaccionar a la destrucción de un meteorito
-            # Por ejemplo, mostrar una animación especial si el meteorito
-            # fue destruido cerca del jugador
-            if data and 'x' in data and 'y' in data:
-                distance = ((self.x - data['x'])**2 + (self.y - data['y'])**2)**0.5
-                if distance < 100:  # Si el meteorito explotó cerca
-                    # Aquí podríamos activar algún efecto especial
-                    pass
-            return True
-        
-        return False
+        return {GameOver: self.on_game_over}
+    
+    def on_game_over(self, event):
+        """Deja el jugador visible y quieto al terminar la partida."""
+        self.end_invincibility()  # Asegurar que sea visible en game over
+        self.set_velocity(0, 0)
     
     def handle_input(self, keys):
         """
@@ -286,26 +336,27 @@ class Player(GameObject):
         Crea un nuevo misil en la posición del jugador.
         El misil es creado en el centro superior del jugador.
         """
-        # Comprobar si el tiempo transcurrido es suficiente para disparar
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_missile < self.missile_cooldown:
-            return None  # No ha pasado suficiente tiempo
+        # Comprobar si ha vencido el plazo del próximo disparo
+        if self.game:
+            current_time = self.game.timers.now
+            if current_time < self.next_missile_time:
+                return None  # No ha pasado suficiente tiempo
             
-        # Actualizar tiempo del último disparo
-        self.last_missile = current_time
+            # Fijar el plazo del siguiente disparo
+            self.next_missile_time = current_time + self.missile_cooldown
         
         # Crear un nuevo misil en la posición del jugador
         # Usamos self.x y self.y que ahora son el centro del hitbox
         # El misil se sitúa en el centro superior
-        missile = Missile(self.x, self.y - self.hitbox.height/2, self.player_id)
+        if self.game:
+            missile = self.game.get_pool("missile", Missile).acquire(
+                self.x, self.y - self.hitbox.height/2, self.player_id)
+        else:
+            missile = Missile(self.x, self.y - self.hitbox.height/2, self.player_id)
         
         # Si tiene acceso al juego, notificar que se creó un misil
         if self.game:
-            self.game.emit_event("missile_fired", {
-                "player_id": self.player_id,
-                "x": self.x, 
-                "y": self.y - self.hitbox.height/2
-            })
+            self.game.emit_event(MissileFired(self.player_id, self.x, self.y - self.hitbox.height/2))
             
             # Notificar al servidor en modo multijugador
             if self.player_id is not None and hasattr(self.game, 'network_events_manager') and self.game.network_events_manager:
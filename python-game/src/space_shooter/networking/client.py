@@ -6,9 +6,16 @@ import grpc
 import threading
 import sys
 from space_shooter.networking.generated import game_pb2, game_pb2_grpc
+from space_shooter.networking.network_simulator import create_simulated_channel
+from space_shooter.networking.clock_sync import ClockSync, local_time_ms
 from config import Config
 import time
 
+# Sincronización de reloj: ráfaga inicial y periodo de muestreo posterior
+CLOCK_SYNC_BURST = 5
+CLOCK_SYNC_BURST_INTERVAL = 0.1  # Segundos entre muestras de la ráfaga inicial
+CLOCK_SYNC_INTERVAL = 2.0        # Segundos entre muestras posteriores
+
 class NetworkClient:
     """Cliente para comunicación con el servidor de juego."""
     
@@ -27,6 +34,9 @@ class NetworkClient:
         self.events_thread = None
         self.running = False
         self.player_name = "Player"  # Nombre por defecto
+        self.network_simulator = None  # Interceptor de condiciones de red (opcional)
+        self.clock = ClockSync()       # Estimador del reloj del servidor
+        self.clock_thread = None
     
     def initialize(self):
         """
@@ -54,11 +64,17 @@ class NetworkClient:
         try:
             # Crear canal y stub
             self.channel = grpc.insecure_channel(f"{host}:{port}")
-            self.stub = game_pb2_grpc.GameServiceStub(self.channel)
             
             # Probar conexión con timeout
             grpc.channel_ready_future(self.channel).result(timeout=5)
             
+            # Aplicar el simulador de latencia/pérdida si está habilitado
+            simulation = Config.get_network_simulation()
+            if simulation:
+                self.channel, self.network_simulator = create_simulated_channel(self.channel, simulation)
+            
+            self.stub = game_pb2_grpc.GameServiceStub(self.channel)
+            
             # Si llegamos aquí, la conexión fue exitosa
             print("Canal establecido con éxito. Intentando autenticación...")
             success = self.connect(self.player_name)
@@ -112,9 +128,16 @@ class NetworkClient:
             
             print(f"Conectado exitosamente al servidor con ID: {self.player_id}")
             
+            # Primera muestra de reloj antes de recibir eventos, para que las
+            # trayectorias de los meteoritos se evalúen ya en tiempo del servidor
+            self.sync_clock()
+            
             # Iniciar hilo para eventos
             self._start_events_thread()
             
+            # Iniciar sincronización de reloj con el servidor
+            self._start_clock_sync_thread()
+            
             # Esperar un breve momento para que el servidor actualice su estado
             time.sleep(0.5)
 
@@ -139,6 +162,8 @@ class NetworkClient:
             self.running = False
             if self.events_thread and self.events_thread.is_alive():
                 self.events_thread.join(timeout=1.0)
+            if self.clock_thread and self.clock_thread.is_alive():
+                self.clock_thread.join(timeout=1.0)
             
             # Enviar evento de desconexión si es posible
             if self.stub and self.player_id:
@@ -266,6 +291,70 @@ class NetworkClient:
             traceback.print_exc()
             return None
     
+    def server_time(self):
+        """
+        Obtiene la hora estimada del servidor (línea temporal compartida).
+        
+        Returns:
+            float: Segundos desde la época Unix según el servidor
+        """
+        return self.clock.server_time()
+    
+    def sync_clock(self):
+        """
+        Toma una muestra de sincronización de reloj con el servidor.
+        
+        Returns:
+            bool: True si se obtuvo una muestra válida
+        """
+        if not self.connected or not self.stub:
+            return False
+            
+        try:
+            t0 = local_time_ms()
+            request = game_pb2.ClockSyncRequest(
+                player_id=self.player_id,
+                client_send_time_ms=int(t0)
+            )
+            response = self.stub.SyncClock(request)
+            t3 = local_time_ms()
+            
+            self.clock.add_sample(
+                t0,
+                response.server_receive_time_ms,
+                response.server_send_time_ms,
+                t3
+            )
+            return True
+            
+        except grpc.RpcError as e:
+            print(f"Error al sincronizar reloj: {e.code()}: {e.details()}")
+            return False
+        except Exception as e:
+            print(f"Error inesperado al sincronizar reloj: {str(e)}")
+            return False
+    
+    def _start_clock_sync_thread(self):
+        """Inicia el hilo que muestrea periódicamente el reloj del servidor."""
+        self.running = True
+        self.clock_thread = threading.Thread(
+            target=self._clock_sync_loop,
+            daemon=True
+        )
+        self.clock_thread.start()
+    
+    def _clock_sync_loop(self):
+        """Función del hilo de sincronización de reloj."""
+        samples = 0
+        while self.running and self.connected:
+            self.sync_clock()
+            samples += 1
+            
+            if samples < CLOCK_SYNC_BURST:
+                time.sleep(CLOCK_SYNC_BURST_INTERVAL)
+            else:
+                time.sleep(CLOCK_SYNC_INTERVAL)
+    
     def _start_events_thread(self):
         """Inicia el hilo para recibir eventos del servidor."""
         self.running = True
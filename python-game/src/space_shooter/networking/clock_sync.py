@@ -0,0 +1,126 @@
+"""
+Sincronización de reloj con el servidor.
+
+Estima el desfase entre el reloj local y el del servidor al estilo NTP,
+a partir de muestras (t0, t1, t2, t3) obtenidas con la RPC SyncClock:
+
+    t0: reloj local al enviar la solicitud
+    t1: reloj del servidor al recibirla
+    t2: reloj del servidor al responder
+    t3: reloj local al recibir la respuesta
+
+    desfase = ((t1 - t0) + (t2 - t3)) / 2
+    rtt     = (t3 - t0) - (t2 - t1)
+
+El reloj local es time.monotonic(), así que la línea temporal compartida
+no se ve afectada por cambios en la hora del sistema.
+"""
+import threading
+import time
+from collections import deque
+
+
+def local_time_ms():
+    """
+    Obtiene el reloj local monótono en milisegundos.
+
+    Returns:
+        float: Milisegundos de time.monotonic()
+    """
+    return time.monotonic() * 1000.0
+
+
+class ClockSync:
+    """
+    Estimador del desfase de reloj entre cliente y servidor.
+
+    Conserva una ventana de muestras recientes y usa la de menor RTT como
+    referencia (es la que menos error de asimetría tiene), suavizando los
+    cambios para que server_time() no dé saltos.
+    """
+
+    def __init__(self, window_size=8, smoothing=0.2):
+        """
+        Inicializa el estimador.
+
+        Args:
+            window_size: Número de muestras recientes que se conservan
+            smoothing: Factor de suavizado exponencial del desfase (0-1)
+        """
+        self.samples = deque(maxlen=window_size)
+        self.smoothing = smoothing
+        self.lock = threading.Lock()
+
+        # Estado estimado
+        self.offset_ms = 0.0
+        self.rtt_ms = 0.0
+        self.synchronized = False
+
+        # Retraso medio de los eventos recibidos (servidor -> cliente)
+        self.event_delay_ms = 0.0
+
+        # Último valor entregado, para garantizar que el tiempo nunca retrocede
+        self._last_server_time_ms = 0.0
+
+    def add_sample(self, t0, t1, t2, t3):
+        """
+        Añade una muestra de sincronización.
+
+        Args:
+            t0: Reloj local al enviar (ms)
+            t1: Reloj del servidor al recibir (ms)
+            t2: Reloj del servidor al responder (ms)
+            t3: Reloj local al recibir la respuesta (ms)
+        """
+        rtt = (t3 - t0) - (t2 - t1)
+        offset = ((t1 - t0) + (t2 - t3)) / 2.0
+        if rtt < 0:
+            # Muestra inconsistente (reloj del servidor ajustado entre t1 y t2)
+            return
+
+        with self.lock:
+            self.samples.append((rtt, offset))
+            best_rtt, best_offset = min(self.samples)
+
+            if not self.synchronized:
+                self.offset_ms = best_offset
+                self.rtt_ms = rtt
+                self.synchronized = True
+            else:
+                self.offset_ms += (best_offset - self.offset_ms) * self.smoothing
+                self.rtt_ms += (rtt - self.rtt_ms) * self.smoothing
+
+    def server_time_ms(self):
+        """
+        Obtiene la hora estimada del servidor.
+
+        Returns:
+            float: Milisegundos desde la época Unix según el servidor
+        """
+        with self.lock:
+            estimate = local_time_ms() + self.offset_ms
+            if estimate < self._last_server_time_ms:
+                estimate = self._last_server_time_ms
+            self._last_server_time_ms = estimate
+            return estimate
+
+    def server_time(self):
+        """
+        Obtiene la hora estimada del servidor en segundos.
+
+        Returns:
+            float: Segundos desde la época Unix según el servidor
+        """
+        return self.server_time_ms() / 1000.0
+
+    def observe_event(self, timestamp_ms):
+        """
+        Registra la marca de tiempo de un evento recibido del servidor.
+
+        Args:
+            timestamp_ms: NotificationEvent.timestamp (ms del servidor)
+        """
+        if not self.synchronized or not timestamp_ms:
+            return
+        delay = self.server_time_ms() - timestamp_ms
+        self.event_delay_ms += (delay - self.event_delay_ms) * self.smoothing
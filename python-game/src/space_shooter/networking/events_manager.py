@@ -3,11 +3,17 @@ Gestor de eventos para comunicación entre el juego y la red.
 """
 import threading
 from space_shooter.networking.generated import game_pb2
+from space_shooter.core.events import (
+    OnlinePlayerConnected, OnlinePlayerDisconnected, OnlinePlayerPosition,
+    OnlineMeteorCreated, OnlineMissileFired, OnlineMeteorDestroyed, OnlineScoreUpdate
+)
 
 class NetworkEventsManager:
     """
     Gestiona eventos entre el servidor y el juego.
     Encapsula la lógica de conversión entre eventos de red y eventos del juego.
+    Los eventos del servidor llegan en el hilo de red y se encolan con
+    GameEngine.post_event para manejarlos en el hilo principal.
     """
     
     def __init__(self, game=None, client=None):
@@ -49,6 +55,10 @@ class NetworkEventsManager:
             print("Advertencia: Evento recibido sin datos")
             return
             
+        # Registrar la marca de tiempo del servidor para las métricas de latencia
+        if self.client:
+            self.client.clock.observe_event(notification_event.timestamp)
+        
         # Extraer el evento real
         event = notification_event.event
         event_type = event.event_type
@@ -98,21 +108,18 @@ class NetworkEventsManager:
         if not hasattr(player_connect_data, 'player_id') or not hasattr(player_connect_data, 'player_name'):
             return
             
-        self.game.emit_event("online_player_connected", {
-            "player_id": player_connect_data.player_id,
-            "player_name": player_connect_data.player_name,
-            "x": 0,  # Posición por defecto hasta que se reciba una actualización
-            "y": 0
-        })
+        # Posición por defecto (0, 0) hasta que se reciba una actualización
+        self.game.post_event(OnlinePlayerConnected(
+            player_connect_data.player_id,
+            player_connect_data.player_name
+        ))
     
     def _handle_player_disconnect(self, player_disconnect_data):
         """Maneja un evento de desconexión de jugador."""
         if not hasattr(player_disconnect_data, 'player_id'):
             return
             
-        self.game.emit_event("online_player_disconnected", {
-            "player_id": player_disconnect_data.player_id
-        })
+        self.game.post_event(OnlinePlayerDisconnected(player_disconnect_data.player_id))
     
     def _handle_meteor_destroyed(self, meteor_destroyed_data):
         """Maneja un evento de meteorito destruido o misil disparado."""
@@ -124,27 +131,27 @@ class NetworkEventsManager:
         
         # Si es un evento de misil disparado
         if parent_event == "missile_fired":
-            self.game.emit_event("online_missile_fired", {
-                "player_id": meteor_destroyed_data.player_id,
-                "missile_id": meteor_destroyed_data.meteor_id
-            })
+            self.game.post_event(OnlineMissileFired(
+                meteor_destroyed_data.player_id,
+                meteor_destroyed_data.meteor_id
+            ))
             return
             
         # Si es un evento normal de meteorito destruido
-        self.game.emit_event("online_meteor_destroyed", {
-            "meteor_id": meteor_destroyed_data.meteor_id,
-            "player_id": getattr(meteor_destroyed_data, 'player_id', 0)
-        })
+        self.game.post_event(OnlineMeteorDestroyed(
+            meteor_destroyed_data.meteor_id,
+            getattr(meteor_destroyed_data, 'player_id', 0)
+        ))
     
     def _handle_score_update(self, score_update_data):
         """Maneja un evento de actualización de puntuación."""
         if not hasattr(score_update_data, 'player_id') or not hasattr(score_update_data, 'score_delta'):
             return
             
-        self.game.emit_event("online_score_update", {
-            "player_id": score_update_data.player_id,
-            "score_delta": score_update_data.score_delta
-        })
+        self.game.post_event(OnlineScoreUpdate(
+            score_update_data.player_id,
+            score_update_data.score_delta
+        ))
     
     def _handle_player_position(self, player_position_data):
         """
@@ -160,13 +167,13 @@ class NetworkEventsManager:
         velocity = player_position_data.velocity
         
         # Emitir evento al juego
-        self.game.emit_event("online_player_position", {
-            "player_id": player_position_data.player_id,
-            "x": position.x,
-            "y": position.y,
-            "speed_x": velocity.x if velocity else 0,
-            "speed_y": velocity.y if velocity else 0
-        })
+        self.game.post_event(OnlinePlayerPosition(
+            player_position_data.player_id,
+            position.x,
+            position.y,
+            velocity.x if velocity else 0,
+            velocity.y if velocity else 0
+        ))
     
     def on_player_position_changed(self, player, force_stop=False):
         """
@@ -269,14 +276,15 @@ class NetworkEventsManager:
         velocity = meteor_created_data.velocity if hasattr(meteor_created_data, 'velocity') else None
         
         # Emitir evento al juego con todos los datos necesarios
-        self.game.emit_event("online_meteor_created", {
-            "meteor_id": meteor_created_data.meteor_id,
-            "type": meteor_created_data.meteor_type,
-            "x": position.x if position else 0,
-            "y": position.y if position else 0,
-            "angle": getattr(meteor_created_data, 'angle', 0),
-            "rotation_speed": getattr(meteor_created_data, 'rotation_speed', 0),
-            "speed_x": velocity.x if velocity else 0,
-            "speed_y": velocity.y if velocity else 0
-        })
+        self.game.post_event(OnlineMeteorCreated(
+            meteor_created_data.meteor_id,
+            meteor_created_data.meteor_type,
+            position.x if position else 0,
+            position.y if position else 0,
+            getattr(meteor_created_data, 'angle', 0),
+            getattr(meteor_created_data, 'rotation_speed', 0),
+            velocity.x if velocity else 0,
+            velocity.y if velocity else 0,
+            getattr(meteor_created_data, 'spawn_time_ms', 0)
+        ))
         print(f"Meteorito remoto recibido: ID {meteor_created_data.meteor_id}, Tipo {meteor_created_data.meteor_type}") 
\ No newline at end of file
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ngame.proto\x12\x05proto\" \n\x08Vector2D\x12\t\n\x01x\x18\x01 \x01(\x02\x12\t\n\x01y\x18\x02 \x01(\x02\"%\n\x0e\x43onnectRequest\x12\x13\n\x0bplayer_name\x18\x01 \x01(\t\"L\n\x0f\x43onnectResponse\x12\x11\n\tplayer_id\x18\x01 \x01(\x05\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t\"s\n\nPlayerData\x12\x11\n\tplayer_id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12!\n\x08position\x18\x03 \x01(\x0b\x32\x0f.proto.Vector2D\x12\x12\n\nvelocity_x\x18\x04 \x01(\x02\x12\r\n\x05score\x18\x05 \x01(\x05\"0\n\nPlayerList\x12\"\n\x07players\x18\x01 \x03(\x0b\x32\x11.proto.PlayerData\"W\n\x0bMissileData\x12\x12\n\nmissile_id\x18\x01 \x01(\x05\x12\x11\n\tplayer_id\x18\x02 \x01(\x05\x12!\n\x08position\x18\x03 \x01(\x0b\x32\x0f.proto.Vector2D\"3\n\x0bMissileList\x12$\n\x08missiles\x18\x01 \x03(\x0b\x32\x12.proto.MissileData\"~\n\nMeteorData\x12\x11\n\tmeteor_id\x18\x01 \x01(\x05\x12\x13\n\x0bmeteor_type\x18\x02 \x01(\t\x12!\n\x08position\x18\x03 \x01(\x0b\x32\x0f.proto.Vector2D\x12\r\n\x05\x61ngle\x18\x04 \x01(\x02\x12\x16\n\x0erotation_speed\x18\x05 \x01(\x02\"0\n\nMeteorList\x12\"\n\x07meteors\x18\x01 \x03(\x0b\x32\x11.proto.MeteorData\"<\n\x12PlayerConnectEvent\x12\x11\n\tplayer_id\x18\x01 \x01(\x05\x12\x13\n\x0bplayer_name\x18\x02 \x01(\t\"?\n\x15PlayerDisconnectEvent\x12\x11\n\tplayer_id\x18\x01 \x01(\x05\x12\x13\n\x0bplayer_name\x18\x02 \x01(\t\"n\n\x13PlayerPositionEvent\x12\x11\n\tplayer_id\x18\x01 \x01(\x05\x12!\n\x08position\x18\x02 \x01(\x0b\x32\x0f.proto.Vector2D\x12!\n\x08velocity\x18\x03 \x01(\x0b\x32\x0f.proto.Vector2D\"<\n\x14MeteorDestroyedEvent\x12\x11\n\tmeteor_id\x18\x01 \x01(\x05\x12\x11\n\tplayer_id\x18\x02 \x01(\x05\"\xa9\x01\n\x12MeteorCreatedEvent\x12\x11\n\tmeteor_id\x18\x01 \x01(\x05\x12\x13\n\x0bmeteor_type\x18\x02 \x01(\t\x12!\n\x08position\x18\x03 \x01(\x0b\x32\x0f.proto.Vector2D\x12\r\n\x05\x61ngle\x18\x04 \x01(\x02\x12\x16\n\x0erotation_speed\x18\x05 \x01(\x02\x12!\n\x08velocity\x18\x06 \x01(\x0b\x32\x0f.proto.Vector2D\":\n\x10ScoreUpdateEvent\x12\x11\n\tplayer_id\x18\x01 \x01(\x05\x12\x13\n\x0bscore_delta\x18\x02 \x01(\x05\"\xf3\x02\n\tGameEvent\x12\x12\n\nevent_type\x18\x01 \x01(\t\x12\x33\n\x0eplayer_connect\x18\x02 \x01(\x0b\x32\x19.proto.PlayerConnectEventH\x00\x12\x39\n\x11player_disconnect\x18\x03 \x01(\x0b\x32\x1c.proto.PlayerDisconnectEventH\x00\x12\x37\n\x10meteor_destroyed\x18\x04 \x01(\x0b\x32\x1b.proto.MeteorDestroyedEventH\x00\x12/\n\x0cscore_update\x18\x05 \x01(\x0b\x32\x17.proto.ScoreUpdateEventH\x00\x12\x35\n\x0fplayer_position\x18\x06 \x01(\x0b\x32\x1a.proto.PlayerPositionEventH\x00\x12\x33\n\x0emeteor_created\x18\x07 \x01(\x0b\x32\x19.proto.MeteorCreatedEventH\x00\x42\x0c\n\nevent_data\"\x9d\x01\n\tGameState\x12\x0f\n\x07game_id\x18\x01 \x01(\x05\x12\"\n\x07players\x18\x02 \x01(\x0b\x32\x11.proto.PlayerList\x12$\n\x08missiles\x18\x03 \x01(\x0b\x32\x12.proto.MissileList\x12\"\n\x07meteors\x18\x04 \x01(\x0b\x32\x11.proto.MeteorList\x12\x11\n\tgame_over\x18\x05 \x01(\x08\"G\n\x11NotificationEvent\x12\x1f\n\x05\x65vent\x18\x01 \x01(\x0b\x32\x10.proto.GameEvent\x12\x11\n\ttimestamp\x18\x02 \x01(\x05\"\xfe\x01\n\rClientRequest\x12\x11\n\tplayer_id\x18\x01 \x01(\x05\x12\x14\n\ndisconnect\x18\x02 \x01(\x08H\x00\x12\x37\n\x10meteor_destroyed\x18\x03 \x01(\x0b\x32\x1b.proto.MeteorDestroyedEventH\x00\x12/\n\x0cscore_update\x18\x04 \x01(\x0b\x32\x17.proto.ScoreUpdateEventH\x00\x12\x18\n\x0eget_game_state\x18\x05 \x01(\x08H\x00\x12\x35\n\x0fplayer_position\x18\x06 \x01(\x0b\x32\x1a.proto.PlayerPositionEventH\x00\x42\t\n\x07request\"\x9e\x01\n\x0eServerResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12&\n\ngame_state\x18\x03 \x01(\x0b\x32\x10.proto.GameStateH\x00\x12\x30\n\x0cnotification\x18\x04 \x01(\x0b\x32\x18.proto.NotificationEventH\x00\x42\n\n\x08response2\xbf\x02\n\x0bGameService\x12\x38\n\x07\x43onnect\x12\x15.proto.ConnectRequest\x1a\x16.proto.ConnectResponse\x12\x34\n\tSendEvent\x12\x10.proto.GameEvent\x1a\x15.proto.ServerResponse\x12=\n\nStreamGame\x12\x14.proto.ClientRequest\x1a\x15.proto.ServerResponse(\x01\x30\x01\x12:\n\x0cGetGameState\x12\x14.proto.ClientRequest\x1a\x10.proto.GameState(\x01\x30\x01\x12\x45\n\x11SubscribeToEvents\x12\x14.proto.ClientRequest\x1a\x18.proto.NotificationEvent0\x01\x42:Z8github.com/Yisustxz/cen-project/backend/internal/serviceb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ngame.proto\x12\x05proto\" \n\x08Vector2D\x12\t\n\x01x\x18\x01 \x01(\x02\x12\t\n\x01y\x18\x02 \x01(\x02\"%\n\x0e\x43onnectRequest\x12\x13\n\x0bplayer_name\x18\x01 \x01(\t\"L\n\x0f\x43onnectResponse\x12\x11\n\tplayer_id\x18\x01 \x01(\x05\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x15\n\rerror_message\x18\x03 \x01(\t\"s\n\nPlayerData\x12\x11\n\tplayer_id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12!\n\x08position\x18\x03 \x01(\x0b\x32\x0f.proto.Vector2D\x12\x12\n\nvelocity_x\x18\x04 \x01(\x02\x12\r\n\x05score\x18\x05 \x01(\x05\"0\n\nPlayerList\x12\"\n\x07players\x18\x01 \x03(\x0b\x32\x11.proto.PlayerData\"W\n\x0bMissileData\x12\x12\n\nmissile_id\x18\x01 \x01(\x05\x12\x11\n\tplayer_id\x18\x02 \x01(\x05\x12!\n\x08position\x18\x03 \x01(\x0b\x32\x0f.proto.Vector2D\"3\n\x0bMissileList\x12$\n\x08missiles\x18\x01 \x03(\x0b\x32\x12.proto.MissileData\"\xb8\x01\n\nMeteorData\x12\x11\n\tmeteor_id\x18\x01 \x01(\x05\x12\x13\n\x0bmeteor_type\x18\x02 \x01(\t\x12!\n\x08position\x18\x03 \x01(\x0b\x32\x0f.proto.Vector2D\x12\r\n\x05\x61ngle\x18\x04 \x01(\x02\x12\x16\n\x0erotation_speed\x18\x05 \x01(\x02\x12!\n\x08velocity\x18\x06 \x01(\x0b\x32\x0f.proto.Vector2D\x12\x15\n\rspawn_time_ms\x18\x07 \x01(\x03\"0\n\nMeteorList\x12\"\n\x07meteors\x18\x01 \x03(\x0b\x32\x11.proto.MeteorData\"<\n\x12PlayerConnectEvent\x12\x11\n\tplayer_id\x18\x01 \x01(\x05\x12\x13\n\x0bplayer_name\x18\x02 \x01(\t\"?\n\x15PlayerDisconnectEvent\x12\x11\n\tplayer_id\x18\x01 \x01(\x05\x12\x13\n\x0bplayer_name\x18\x02 \x01(\t\"n\n\x13PlayerPositionEvent\x12\x11\n\tplayer_id\x18\x01 \x01(\x05\x12!\n\x08position\x18\x02 \x01(\x0b\x32\x0f.proto.Vector2D\x12!\n\x08velocity\x18\x03 \x01(\x0b\x32\x0f.proto.Vector2D\"<\n\x14MeteorDestroyedEvent\x12\x11\n\tmeteor_id\x18\x01 \x01(\x05\x12\x11\n\tplayer_id\x18\x02 \x01(\x05\"\xc0\x01\n\x12MeteorCreatedEvent\x12\x11\n\tmeteor_id\x18\x01 \x01(\x05\x12\x13\n\x0bmeteor_type\x18\x02 \x01(\t\x12!\n\x08position\x18\x03 \x01(\x0b\x32\x0f.proto.Vector2D\x12\r\n\x05\x61ngle\x18\x04 \x01(\x02\x12\x16\n\x0erotation_speed\x18\x05 \x01(\x02\x12!\n\x08velocity\x18\x06 \x01(\x0b\x32\x0f.proto.Vector2D\x12\x15\n\rspawn_time_ms\x18\x07 \x01(\x03\":\n\x10ScoreUpdateEvent\x12\x11\n\tplayer_id\x18\x01 \x01(\x05\x12\x13\n\x0bscore_delta\x18\x02 \x01(\x05\"\xf3\x02\n\tGameEvent\x12\x12\n\nevent_type\x18\x01 \x01(\t\x12\x33\n\x0eplayer_connect\x18\x02 \x01(\x0b\x32\x19.proto.PlayerConnectEventH\x00\x12\x39\n\x11player_disconnect\x18\x03 \x01(\x0b\x32\x1c.proto.PlayerDisconnectEventH\x00\x12\x37\n\x10meteor_destroyed\x18\x04 \x01(\x0b\x32\x1b.proto.MeteorDestroyedEventH\x00\x12/\n\x0cscore_update\x18\x05 \x01(\x0b\x32\x17.proto.ScoreUpdateEventH\x00\x12\x35\n\x0fplayer_position\x18\x06 \x01(\x0b\x32\x1a.proto.PlayerPositionEventH\x00\x12\x33\n\x0emeteor_created\x18\x07 \x01(\x0b\x32\x19.proto.MeteorCreatedEventH\x00\x42\x0c\n\nevent_data\"\x9d\x01\n\tGameState\x12\x0f\n\x07game_id\x18\x01 \x01(\x05\x12\"\n\x07players\x18\x02 \x01(\x0b\x32\x11.proto.PlayerList\x12$\n\x08missiles\x18\x03 \x01(\x0b\x32\x12.proto.MissileList\x12\"\n\x07meteors\x18\x04 \x01(\x0b\x32\x11.proto.MeteorList\x12\x11\n\tgame_over\x18\x05 \x01(\x08\"G\n\x11NotificationEvent\x12\x1f\n\x05\x65vent\x18\x01 \x01(\x0b\x32\x10.proto.GameEvent\x12\x11\n\ttimestamp\x18\x02 \x01(\x03\"B\n\x10\x43lockSyncRequest\x12\x11\n\tplayer_id\x18\x01 \x01(\x05\x12\x1b\n\x13\x63lient_send_time_ms\x18\x02 \x01(\x03\"m\n\x11\x43lockSyncResponse\x12\x1b\n\x13\x63lient_send_time_ms\x18\x01 \x01(\x03\x12\x1e\n\x16server_receive_time_ms\x18\x02 \x01(\x03\x12\x1b\n\x13server_send_time_ms\x18\x03 \x01(\x03\"\xfe\x01\n\rClientRequest\x12\x11\n\tplayer_id\x18\x01 \x01(\x05\x12\x14\n\ndisconnect\x18\x02 \x01(\x08H\x00\x12\x37\n\x10meteor_destroyed\x18\x03 \x01(\x0b\x32\x1b.proto.MeteorDestroyedEventH\x00\x12/\n\x0cscore_update\x18\x04 \x01(\x0b\x32\x17.proto.ScoreUpdateEventH\x00\x12\x18\n\x0eget_game_state\x18\x05 \x01(\x08H\x00\x12\x35\n\x0fplayer_position\x18\x06 \x01(\x0b\x32\x1a.proto.PlayerPositionEventH\x00\x42\t\n\x07request\"\x9e\x01\n\x0eServerResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12&\n\ngame_state\x18\x03 \x01(\x0b\x32\x10.proto.GameStateH\x00\x12\x30\n\x0cnotification\x18\x04 \x01(\x0b\x32\x18.proto.NotificationEventH\x00\x42\n\n\x08response2\xff\x02\n\x0bGameService\x12\x38\n\x07\x43onnect\x12\x15.proto.ConnectRequest\x1a\x16.proto.ConnectResponse\x12\x34\n\tSendEvent\x12\x10.proto.GameEvent\x1a\x15.proto.ServerResponse\x12=\n\nStreamGame\x12\x14.proto.ClientRequest\x1a\x15.proto.ServerResponse(\x01\x30\x01\x12:\n\x0cGetGameState\x12\x14.proto.ClientRequest\x1a\x10.proto.GameState(\x01\x30\x01\x12\x45\n\x11SubscribeToEvents\x12\x14.proto.ClientRequest\x1a\x18.proto.NotificationEvent0\x01\x12>\n\tSyncClock\x12\x17.proto.ClockSyncRequest\x1a\x18.proto.ClockSyncResponseB:Z8github.com/Yisustxz/cen-project/backend/internal/serviceb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -46,32 +46,36 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_MISSILEDATA']._serialized_end=426
   _globals['_MISSILELIST']._serialized_start=428
   _globals['_MISSILELIST']._serialized_end=479
-  _globals['_METEORDATA']._serialized_start=481
-  _globals['_METEORDATA']._serialized_end=607
-  _globals['_METEORLIST']._serialized_start=609
-  _globals['_METEORLIST']._serialized_end=657
-  _globals['_PLAYERCONNECTEVENT']._serialized_start=659
-  _globals['_PLAYERCONNECTEVENT']._serialized_end=719
-  _globals['_PLAYERDISCONNECTEVENT']._serialized_start=721
-  _globals['_PLAYERDISCONNECTEVENT']._serialized_end=784
-  _globals['_PLAYERPOSITIONEVENT']._serialized_start=786
-  _globals['_PLAYERPOSITIONEVENT']._serialized_end=896
-  _globals['_METEORDESTROYEDEVENT']._serialized_start=898
-  _globals['_METEORDESTROYEDEVENT']._serialized_end=958
-  _globals['_METEORCREATEDEVENT']._serialized_start=961
-  _globals['_METEORCREATEDEVENT']._serialized_end=1130
-  _globals['_SCOREUPDATEEVENT']._serialized_start=1132
-  _globals['_SCOREUPDATEEVENT']._serialized_end=1190
-  _globals['_GAMEEVENT']._serialized_start=1193
-  _globals['_GAMEEVENT']._serialized_end=1564
-  _globals['_GAMESTATE']._serialized_start=1567
-  _globals['_GAMESTATE']._serialized_end=1724
-  _globals['_NOTIFICATIONEVENT']._serialized_start=1726
-  _globals['_NOTIFICATIONEVENT']._serialized_end=1797
-  _globals['_CLIENTREQUEST']._serialized_start=1800
-  _globals['_CLIENTREQUEST']._serialized_end=2054
-  _globals['_SERVERRESPONSE']._serialized_start=2057
-  _globals['_SERVERRESPONSE']._serialized_end=2215
-  _globals['_GAMESERVICE']._serialized_start=2218
-  _globals['_GAMESERVICE']._serialized_end=2537
+  _globals['_METEORDATA']._serialized_start=482
+  _globals['_METEORDATA']._serialized_end=666
+  _globals['_METEORLIST']._serialized_start=668
+  _globals['_METEORLIST']._serialized_end=716
+  _globals['_PLAYERCONNECTEVENT']._serialized_start=718
+  _globals['_PLAYERCONNECTEVENT']._serialized_end=778
+  _globals['_PLAYERDISCONNECTEVENT']._serialized_start=780
+  _globals['_PLAYERDISCONNECTEVENT']._serialized_end=843
+  _globals['_PLAYERPOSITIONEVENT']._serialized_start=845
+  _globals['_PLAYERPOSITIONEVENT']._serialized_end=955
+  _globals['_METEORDESTROYEDEVENT']._serialized_start=957
+  _globals['_METEORDESTROYEDEVENT']._serialized_end=1017
+  _globals['_METEORCREATEDEVENT']._serialized_start=1020
+  _globals['_METEORCREATEDEVENT']._serialized_end=1212
+  _globals['_SCOREUPDATEEVENT']._serialized_start=1214
+  _globals['_SCOREUPDATEEVENT']._serialized_end=1272
+  _globals['_GAMEEVENT']._serialized_start=1275
+  _globals['_GAMEEVENT']._serialized_end=1646
+  _globals['_GAMESTATE']._serialized_start=1649
+  _globals['_GAMESTATE']._serialized_end=1806
+  _globals['_NOTIFICATIONEVENT']._serialized_start=1808
+  _globals['_NOTIFICATIONEVENT']._serialized_end=1879
+  _globals['_CLOCKSYNCREQUEST']._serialized_start=1881
+  _globals['_CLOCKSYNCREQUEST']._serialized_end=1947
+  _globals['_CLOCKSYNCRESPONSE']._serialized_start=1949
+  _globals['_CLOCKSYNCRESPONSE']._serialized_end=2058
+  _globals['_CLIENTREQUEST']._serialized_start=2061
+  _globals['_CLIENTREQUEST']._serialized_end=2315
+  _globals['_SERVERRESPONSE']._serialized_start=2318
+  _globals['_SERVERRESPONSE']._serialized_end=2476
+  _globals['_GAMESERVICE']._serialized_start=2479
+  _globals['_GAMESERVICE']._serialized_end=2862
 # @@protoc_insertion_point(module_scope)
@@ -60,6 +60,11 @@ class GameServiceStub(object):
                 request_serializer=game__pb2.ClientRequest.SerializeToString,
                 response_deserializer=game__pb2.NotificationEvent.FromString,
                 _registered_method=True)
+        self.SyncClock = channel.unary_unary(
+                '/proto.GameService/SyncClock',
+                request_serializer=game__pb2.ClockSyncRequest.SerializeToString,
+                response_deserializer=game__pb2.ClockSyncResponse.FromString,
+                _registered_method=True)
 
 
 class GameServiceServicer(object):
@@ -101,6 +106,13 @@ class GameServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SyncClock(self, request, context):
+        """Muestrear el desfase de reloj y el RTT con el servidor
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_GameServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -129,6 +141,11 @@ def add_GameServiceServicer_to_server(servicer, server):
                     request_deserializer=game__pb2.ClientRequest.FromString,
                     response_serializer=game__pb2.NotificationEvent.SerializeToString,
             ),
+            'SyncClock': grpc.unary_unary_rpc_method_handler(
+                    servicer.SyncClock,
+                    request_deserializer=game__pb2.ClockSyncRequest.FromString,
+                    response_serializer=game__pb2.ClockSyncResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'proto.GameService', rpc_method_handlers)
@@ -275,3 +292,30 @@ class GameService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def SyncClock(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/proto.GameService/SyncClock',
+            game__pb2.ClockSyncRequest.SerializeToString,
+            game__pb2.ClockSyncResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,314 @@
+"""
+Simulador de condiciones de red para probar el netcode.
+
+Implementa interceptores gRPC que se colocan dentro de NetworkClient y que
+inyectan latencia, jitter, pérdida, límite de ancho de banda y bloqueos
+periódicos del stream en ambas direcciones. Permite reproducir en una red
+local el comportamiento de una conexión mala (por ejemplo 150 ms / 5 %).
+"""
+import queue
+import random
+import threading
+import time
+
+import grpc
+
+# Presets de condiciones de red seleccionables desde config.json
+# latency_ms es el RTT completo; cada dirección aplica la mitad.
+NETWORK_PRESETS = {
+    "none": {
+        "latency_ms": 0, "jitter_ms": 0, "loss": 0.0,
+        "bandwidth_kbps": 0, "stall_every_s": 0, "stall_ms": 0
+    },
+    "lan": {
+        "latency_ms": 2, "jitter_ms": 1, "loss": 0.0,
+        "bandwidth_kbps": 0, "stall_every_s": 0, "stall_ms": 0
+    },
+    "wifi": {
+        "latency_ms": 40, "jitter_ms": 10, "loss": 0.005,
+        "bandwidth_kbps": 0, "stall_every_s": 0, "stall_ms": 0
+    },
+    "bad_wifi": {
+        "latency_ms": 150, "jitter_ms": 30, "loss": 0.05,
+        "bandwidth_kbps": 256, "stall_every_s": 10, "stall_ms": 500
+    },
+    "mobile_3g": {
+        "latency_ms": 300, "jitter_ms": 80, "loss": 0.02,
+        "bandwidth_kbps": 128, "stall_every_s": 15, "stall_ms": 1000
+    }
+}
+
+# Tiempo de retransmisión aplicado a un mensaje "perdido".
+# gRPC viaja sobre TCP, así que una pérdida no elimina el mensaje sino que lo
+# retrasa (y con él a todos los que vienen detrás en el mismo stream).
+DEFAULT_RETRANSMIT_MS = 200
+
+
+class LinkSimulator:
+    """
+    Modela una dirección del enlace (subida o bajada).
+
+    Calcula el instante de entrega de cada mensaje manteniendo el orden,
+    como lo haría una conexión TCP.
+    """
+
+    def __init__(self, conditions, rng):
+        """
+        Inicializa el enlace simulado.
+
+        Args:
+            conditions: Diccionario con las condiciones de red
+            rng: Generador aleatorio propio de este enlace (random.Random)
+        """
+        self.conditions = conditions
+        self.rng = rng
+        self.lock = threading.Lock()
+        self.start_time = time.monotonic()
+
+        # Instante en que el enlace queda libre y última entrega realizada
+        self._link_free_at = 0.0
+        self._last_delivery = 0.0
+
+        # Estadísticas
+        self.messages = 0
+        self.lost = 0
+        self.stalled = 0
+
+    def schedule(self, size_bytes, now=None):
+        """
+        Calcula cuándo debe entregarse un mensaje enviado ahora.
+
+        Args:
+            size_bytes: Tamaño serializado del mensaje
+            now: Instante de envío (time.monotonic), opcional
+
+        Returns:
+            float: Instante de entrega en la escala de time.monotonic()
+        """
+        if now is None:
+            now = time.monotonic()
+
+        conditions = self.conditions
+        with self.lock:
+            self.messages += 1
+
+            # Ancho de banda: el mensaje ocupa el enlace size/bw segundos
+            bandwidth_kbps = conditions.get("bandwidth_kbps", 0)
+            if bandwidth_kbps > 0:
+                transmit = (size_bytes * 8) / (bandwidth_kbps * 1000.0)
+                sent_at = max(now, self._link_free_at) + transmit
+                self._link_free_at = sent_at
+            else:
+                sent_at = now
+
+            # Latencia de un sentido más jitter
+            one_way = conditions.get("latency_ms", 0) / 2000.0
+            jitter = conditions.get("jitter_ms", 0) / 1000.0
+            if jitter > 0:
+                one_way += self.rng.uniform(-jitter, jitter)
+            delivery = sent_at + max(0.0, one_way)
+
+            # Pérdida: retraso de retransmisión
+            loss = conditions.get("loss", 0.0)
+            if loss > 0 and self.rng.random() < loss:
+                self.lost += 1
+                delivery += conditions.get("retransmit_ms", DEFAULT_RETRANSMIT_MS) / 1000.0
+
+            # Bloqueos periódicos del stream
+            stall_every = conditions.get("stall_every_s", 0)
+            stall_ms = conditions.get("stall_ms", 0)
+            elapsed = delivery - self.start_time
+            if stall_every > 0 and stall_ms > 0 and elapsed >= stall_every:
+                phase = elapsed % stall_every
+                if phase < stall_ms / 1000.0:
+                    self.stalled += 1
+                    delivery += stall_ms / 1000.0 - phase
+
+            # Entrega en orden (head-of-line blocking)
+            delivery = max(delivery, self._last_delivery)
+            self._last_delivery = delivery
+            return delivery
+
+    def wait(self, size_bytes):
+        """
+        Bloquea el hilo actual hasta que el mensaje "llega".
+
+        Args:
+            size_bytes: Tamaño serializado del mensaje
+        """
+        delay = self.schedule(size_bytes) - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _message_size(message):
+    """Devuelve el tamaño serializado de un mensaje protobuf (0 si no aplica)."""
+    try:
+        return message.ByteSize()
+    except Exception:
+        return 0
+
+
+class _DelayedResponseStream:
+    """
+    Envuelve un stream de respuestas gRPC aplicando el enlace de bajada.
+
+    Un hilo lector marca la llegada real de cada mensaje y el consumidor los
+    recibe en el instante simulado, respetando el orden.
+    """
+
+    _END = object()
+
+    def __init__(self, call, link):
+        self._call = call
+        self._link = link
+        self._queue = queue.Queue()
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def _read(self):
+        try:
+            for message in self._call:
+                deliver_at = self._link.schedule(_message_size(message))
+                self._queue.put((deliver_at, message, None))
+        except Exception as e:
+            self._queue.put((time.monotonic(), None, e))
+            return
+        self._queue.put((time.monotonic(), self._END, None))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        deliver_at, message, error = self._queue.get()
+        if error is not None:
+            raise error
+        if message is self._END:
+            raise StopIteration
+        delay = deliver_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        return message
+
+    def __getattr__(self, name):
+        # cancel(), code(), details(), etc. se delegan en la llamada real
+        return getattr(self._call, name)
+
+
+class NetworkSimulatorInterceptor(grpc.UnaryUnaryClientInterceptor,
+                                  grpc.UnaryStreamClientInterceptor,
+                                  grpc.StreamUnaryClientInterceptor,
+                                  grpc.StreamStreamClientInterceptor):
+    """
+    Interceptor gRPC que aplica las condiciones simuladas a todas las llamadas.
+
+    Las llamadas unarias bloquean el RTT completo, igual que lo haría una red
+    real con los stubs síncronos del cliente.
+    """
+
+    def __init__(self, conditions, seed=None):
+        """
+        Inicializa el interceptor.
+
+        Args:
+            conditions: Diccionario con las condiciones de red
+            seed: Semilla para reproducir una ejecución (opcional)
+        """
+        self.conditions = conditions
+
+        # Un generador por sentido: la subida y la bajada se usan desde hilos
+        # distintos y un generador compartido haría que las latencias y
+        # pérdidas dependieran del entrelazado de los hilos
+        uplink_seed = seed
+        downlink_seed = seed + 1 if seed is not None else None
+        self.uplink = LinkSimulator(conditions, random.Random(uplink_seed))
+        self.downlink = LinkSimulator(conditions, random.Random(downlink_seed))
+
+    def _delayed_requests(self, request_iterator):
+        for request in request_iterator:
+            self.uplink.wait(_message_size(request))
+            yield request
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        self.uplink.wait(_message_size(request))
+        outcome = continuation(client_call_details, request)
+        try:
+            size = _message_size(outcome.result())
+        except Exception:
+            size = 0
+        self.downlink.wait(size)
+        return outcome
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        self.uplink.wait(_message_size(request))
+        call = continuation(client_call_details, request)
+        return _DelayedResponseStream(call, self.downlink)
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        outcome = continuation(client_call_details, self._delayed_requests(request_iterator))
+        try:
+            size = _message_size(outcome.result())
+        except Exception:
+            size = 0
+        self.downlink.wait(size)
+        return outcome
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        call = continuation(client_call_details, self._delayed_requests(request_iterator))
+        return _DelayedResponseStream(call, self.downlink)
+
+    def get_stats(self):
+        """
+        Obtiene las estadísticas del simulador.
+
+        Returns:
+            dict: Mensajes, pérdidas y bloqueos por dirección
+        """
+        return {
+            "up": {"messages": self.uplink.messages, "lost": self.uplink.lost,
+                   "stalled": self.uplink.stalled},
+            "down": {"messages": self.downlink.messages, "lost": self.downlink.lost,
+                     "stalled": self.downlink.stalled}
+        }
+
+
+def resolve_conditions(settings):
+    """
+    Combina un preset con los valores sobrescritos en la configuración.
+
+    Args:
+        settings: Diccionario de networkSimulation en config.json
+
+    Returns:
+        dict: Condiciones de red resultantes
+
+    Raises:
+        ValueError: Si el preset no existe
+    """
+    preset_name = settings.get("preset", "none")
+    if preset_name not in NETWORK_PRESETS:
+        raise ValueError(f"Preset de red desconocido: {preset_name}")
+
+    conditions = dict(NETWORK_PRESETS[preset_name])
+    for key in ("latency_ms", "jitter_ms", "loss", "bandwidth_kbps",
+                "stall_every_s", "stall_ms", "retransmit_ms"):
+        if key in settings:
+            conditions[key] = settings[key]
+    return conditions
+
+
+def create_simulated_channel(channel, settings):
+    """
+    Envuelve un canal gRPC con el simulador de red.
+
+    Args:
+        channel: Canal gRPC real
+        settings: Diccionario de networkSimulation en config.json
+
+    Returns:
+        tuple: (canal interceptado, interceptor)
+    """
+    conditions = resolve_conditions(settings)
+    interceptor = NetworkSimulatorInterceptor(conditions, settings.get("seed"))
+    print(f"Simulador de red activo: preset '{settings.get('preset', 'none')}' -> {conditions}")
+    return grpc.intercept_channel(channel, interceptor), interceptor
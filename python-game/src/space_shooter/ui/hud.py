@@ -2,10 +2,14 @@
 import pygame
 from space_shooter.core.constants import WHITE, RED, GREEN
 from config import Config
+from motor.surface_cache import SurfaceCache
 
 class HUD:
     """Clase para gestionar el HUD del juego."""
     
+    # Alto de la franja superior con las vidas y la puntuación
+    LAYER_HEIGHT = 50
+    
     def __init__(self, game):
         """
         Inicializa el HUD.
@@ -14,9 +18,10 @@ class HUD:
             game: Referencia al juego principal
         """
         self.game = game
-        self.font = pygame.font.Font(pygame.font.get_default_font(), 16)
-        self.small_font = pygame.font.Font(pygame.font.get_default_font(), 12)
-        self.big_font = pygame.font.Font(pygame.font.get_default_font(), 24)
+        
+        # Fuentes y textos renderizados compartidos
+        self.text = game.text_service
+        self.font_name = pygame.font.get_default_font()
         
         # Obtener las dimensiones del juego y del nivel
         self.screen_width = Config.get_screen_width()
@@ -28,25 +33,35 @@ class HUD:
         self.scale_x = self.screen_width / self.level_width
         self.scale_y = self.screen_height / self.level_height
         
-    def render(self, game_window, level_surface, player, debug_mode=False):
+        # Capa con vidas y puntuación, recompuesta sólo cuando cambian (ver render)
+        self.layer = pygame.Surface((self.screen_width, self.LAYER_HEIGHT), pygame.SRCALPHA)
+        self.layer_key = None
+        
+        # Pantalla de game over y fondos del panel de depuración (por alto), compuestos una vez
+        self.game_over_surface = None
+        self.debug_panels = {}
+        
+        # Número de recomposiciones de cada capa (para verificar que no se hacen cada frame)
+        self.rebuilds = {"layer": 0, "game_over": 0, "debug_panel": 0}
+        
+    def render(self, game_window, player, debug_mode=False):
         """
-        Renderiza todo el HUD.
+        Renderiza todo el HUD sobre la escena ya dibujada en la ventana.
         
         Args:
             game_window: Ventana principal del juego donde dibujar
-            level_surface: Superficie del nivel (ya renderizada)
             player: Objeto del jugador
             debug_mode: Si está activo el modo debug
         """
-        # Escalar la superficie del nivel a la ventana real
-        scaled_surface = pygame.transform.scale(level_surface, (self.screen_width, self.screen_height))
-        game_window.blit(scaled_surface, (0, 0))
-        
-        # Mostrar vidas con iconos
-        self.render_lives(game_window, player.lives)
-        
-        # Mostrar puntuación
-        self.render_score(game_window, player.score)
+        # Vidas y puntuación: se recomponen sólo si cambian y se dibujan con un blit
+        key = (player.lives, player.score, debug_mode)
+        if key != self.layer_key:
+            self.layer_key = key
+            self.layer.fill((0, 0, 0, 0))
+            self.render_lives(self.layer, player.lives)
+            self.render_score(self.layer, player.score)
+            self.rebuilds["layer"] += 1
+        game_window.blit(self.layer, (0, 0))
         
         # En modo debug, mostrar información adicional
         if debug_mode:
@@ -61,8 +76,7 @@ class HUD:
             lives: Número de vidas
         """
         # Texto "Lives:"
-        text_surface = self.font.render("Lives:", True, WHITE)
-        surface.blit(text_surface, (20, 20))
+        self.text.draw(surface, "Lives:", (20, 20), WHITE, 16, self.font_name)
         
         # Dibujar iconos de vida
         for i in range(lives):
@@ -79,18 +93,13 @@ class HUD:
             surface: Superficie donde dibujar
             score: Puntuación actual
         """
-        # Crear un fondo semitransparente para la puntuación
-        score_bg = pygame.Surface((150, 30), pygame.SRCALPHA)
-        score_bg.fill((0, 0, 0, 128))  # Negro semitransparente
-        surface.blit(score_bg, (self.screen_width - 160, 15))
+        # Fondo semitransparente para la puntuación (la capa del HUD está vacía debajo)
+        surface.fill((0, 0, 0, 128), (self.screen_width - 160, 15, 150, 30))
         
-        # Texto formateado para la puntuación
+        # Texto formateado para la puntuación (cambia sólo al puntuar: se cachea)
         score_text = f"SCORE: {score:,}"
-        text_surface = self.font.render(score_text, True, WHITE)
-        text_rect = text_surface.get_rect()
-        text_rect.right = self.screen_width - 20
-        text_rect.top = 20
-        surface.blit(text_surface, text_rect)
+        self.text.draw(surface, score_text, (self.screen_width - 20, 20), WHITE, 16,
+                       self.font_name, anchor="topright")
     
     def render_debug_info(self, surface):
         """
@@ -104,11 +113,6 @@ class HUD:
         meteor_count = self.game.count_objects_by_type("meteor")
         missile_count = self.game.count_objects_by_type("missile")
         
-        # Crear un panel semitransparente con información
-        debug_bg = pygame.Surface((180, 100), pygame.SRCALPHA)
-        debug_bg.fill((30, 30, 30, 200))  # Gris oscuro semitransparente
-        surface.blit(debug_bg, (self.screen_width - 190, self.screen_height - 110))
-        
         # Información de depuración
         debug_texts = [
             f"FPS: {self.game.clock.get_fps():.1f}",
@@ -118,29 +122,92 @@ class HUD:
             f"Misiles: {missile_count}"
         ]
         
+        # Latencia con el servidor en modo multijugador
+        network_client = getattr(self.game, 'network_client', None)
+        if network_client and network_client.clock.synchronized:
+            clock = network_client.clock
+            debug_texts.append(f"RTT: {clock.rtt_ms:.0f}ms  Evt: {clock.event_delay_ms:.0f}ms")
+        
+        # Objetos dibujados y recortados por estar fuera del nivel
+        cull_stats = self.game.objects_manager.get_cull_stats()
+        debug_texts.append(f"Dibujados: {cull_stats['drawn']}  Recortados: {cull_stats['culled']}")
+
+        # Temporizadores pendientes y llamadas realizadas
+        timer_stats = self.game.timers.get_stats()
+        debug_texts.append(f"Temporizadores: {timer_stats['pending']}  Vencidos: {timer_stats['fired']}")
+
+        # Eventos publicados y manejadores llamados por clase de evento
+        for name, stats in self.game.events.get_stats().items():
+            debug_texts.append(f"{name}: {stats['published']}/{stats['dispatched']}")
+        
+        # Recomposiciones de la capa del HUD
+        debug_texts.append(f"HUD: {self.rebuilds['layer']} recomposiciones")
+        
+        # Reutilización de los pools de objetos (aciertos/fallos)
+        for name, stats in self.game.get_pool_stats().items():
+            debug_texts.append(f"Pool {name}: {stats['hits']}/{stats['misses']}")
+        
+        # Memoria de las cachés de recursos, textos y superficies generadas (MB usados/presupuesto, aciertos/fallos/expulsiones)
+        cache_stats = {}
+        resource_manager = getattr(self.game, 'resource_manager', None)
+        if resource_manager:
+            cache_stats.update(resource_manager.get_cache_stats())
+        cache_stats["text"] = self.text.get_stats()
+        cache_stats["generated"] = SurfaceCache.get_default().get_stats()
+        for name, stats in cache_stats.items():
+            budget = f"{stats['budget'] / 1048576:.0f}" if stats['budget'] else "-"
+            debug_texts.append(
+                f"{name}: {stats['bytes'] / 1048576:.1f}/{budget}MB "
+                f"{stats['hits']}/{stats['misses']}/{stats['evictions']}"
+            )
+        
+        # Panel semitransparente con información (uno por número de líneas)
+        panel_height = 10 + len(debug_texts) * 18
+        debug_bg = self.debug_panels.get(panel_height)
+        if debug_bg is None:
+            debug_bg = pygame.Surface((180, panel_height), pygame.SRCALPHA)
+            debug_bg.fill((30, 30, 30, 200))  # Gris oscuro semitransparente
+            self.debug_panels[panel_height] = debug_bg
+            self.rebuilds["debug_panel"] += 1
+        panel_top = self.screen_height - panel_height - 10
+        surface.blit(debug_bg, (self.screen_width - 190, panel_top))
+        
         # Renderizar textos
         for i, text in enumerate(debug_texts):
-            text_surface = self.small_font.render(text, True, GREEN)
-            surface.blit(text_surface, (self.screen_width - 180, self.screen_height - 100 + (i * 18)))
+            self.text.draw_dynamic(surface, text, (self.screen_width - 180, panel_top + 10 + (i * 18)),
+                                   GREEN, 12, self.font_name)
             
     def render_game_over(self, surface):
         """
-        Renderiza la pantalla de game over.
+        Renderiza la pantalla de game over (compuesta una sola vez).
         
         Args:
             surface: Superficie donde dibujar
         """
+        if self.game_over_surface is None:
+            self.game_over_surface = self._compose_game_over()
+            self.rebuilds["game_over"] += 1
+        surface.blit(self.game_over_surface, (0, 0))
+    
+    def get_stats(self):
+        """
+        Obtiene el número de recomposiciones de cada capa del HUD.
+        
+        Returns:
+            dict: Recomposiciones de la capa de vidas/puntuación, de la
+                  pantalla de game over y de los fondos del panel de depuración
+        """
+        return dict(self.rebuilds)
+    
+    def _compose_game_over(self):
+        """Compone el fondo y los mensajes de la pantalla de game over."""
         # Fondo semitransparente
         overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 180))  # Negro semitransparente
-        surface.blit(overlay, (0, 0))
         
         # Mensaje de game over
-        gameover_text = "GAME OVER"
-        text_surface = self.big_font.render(gameover_text, True, RED)
-        text_rect = text_surface.get_rect()
-        text_rect.center = (self.screen_width // 2, self.screen_height // 2 - 20)
-        surface.blit(text_surface, text_rect)
+        self.text.draw(overlay, "GAME OVER", (self.screen_width // 2, self.screen_height // 2 - 20),
+                       RED, 24, self.font_name, anchor="center")
         
         # Verificar si estamos en modo multijugador usando la configuración
         is_multiplayer = Config.get("frontend", "multiplayerMode", "enable")
@@ -153,7 +220,6 @@ class HUD:
             # En modo offline, se puede reiniciar o salir
             continue_text = "Press Y to play again or N to quit"
             
-        text_surface = self.font.render(continue_text, True, WHITE)
-        text_rect = text_surface.get_rect()
-        text_rect.center = (self.screen_width // 2, self.screen_height // 2 + 20)
-        surface.blit(text_surface, text_rect) 
\ No newline at end of file
+        self.text.draw(overlay, continue_text, (self.screen_width // 2, self.screen_height // 2 + 20),
+                       WHITE, 16, self.font_name, anchor="center")
+        return overlay
@@ -1,14 +1,12 @@
 """Utilidades para mostrar texto en la pantalla."""
 import pygame
 from motor.resource_manager import ResourceManager
+from motor.text_service import TextService
 
 def write_text(surface, text, color, x, y, font_size=16, font_name=None):
-    """Muestra texto centrado en una posición específica."""
-    font = pygame.font.Font(pygame.font.get_default_font(), font_size)
-    text_surface = font.render(text, True, color)
-    text_rect = text_surface.get_rect()
-    text_rect.center = (x, y)
-    surface.blit(text_surface, text_rect)
+    """Muestra texto centrado en una posición específica (fuente y texto cacheados)."""
+    font_name = font_name or pygame.font.get_default_font()
+    TextService.get_default().draw(surface, text, (x, y), color, font_size, font_name, anchor="center")
 
 class TextRenderer:
     """Clase para renderizar texto usando un ResourceManager."""